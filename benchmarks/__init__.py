@@ -0,0 +1 @@
+"""Benchmark scripts, the synthetic corpus generator and the regression suite (``python -m benchmarks.suite``)."""
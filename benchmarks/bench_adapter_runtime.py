@@ -0,0 +1,66 @@
+"""Adapter runtime throughput: compiled mappings alone and mapped records through batch ingest.
+
+Usage: python benchmarks/bench_adapter_runtime.py [--count N] [--batch-size 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import AdapterRuntime, read_records
+from opentsr.models import JsonObject
+
+
+def _vendor_records(count: int) -> Dict[str, str]:
+    """CSV exports for the pH meter and NDJSON events for the microscope."""
+    ph_rows: List[str] = ["device_id,device_type,captured_at,reading.value,reading.unit,reading.temperature_c,location"]
+    microscope_lines: List[str] = []
+    for index in range(count):
+        second: int = index % 60
+        ph_rows.append(f"phm-{index % 32},ph_meter,2026-02-20T10:41:{second:02d}Z,{6 + (index % 200) / 100},pH,24.8,line-{index % 8}")
+        microscope_lines.append(
+            '{"device_serial": "WRM-%d", "mode": "brightfield", "objective": "40x", "magnification": 400, '
+            '"captured_at": "2026-02-20T10:44:%02dZ", "image_uri": "s3://vendor-exports/wrm/frame-%d.tif", '
+            '"image_sha256": "%064x"}' % (index % 16, second, index, index)
+        )
+    return {"generic-ph-meter": "\n".join(ph_rows) + "\n", "woehrsh-rm-compound-microscope": "\n".join(microscope_lines) + "\n"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--schema-engine", default="compiled", choices=("jsonschema", "compiled"))
+    args = parser.parse_args()
+
+    runtime = AdapterRuntime.from_registry()
+    formats: Dict[str, str] = {"generic-ph-meter": "csv", "woehrsh-rm-compound-microscope": "ndjson"}
+    for adapter_id, exported in _vendor_records(args.count).items():
+        records: List[JsonObject] = list(read_records(io.StringIO(exported), formats[adapter_id]))  # type: ignore[arg-type]
+        started: float = time.perf_counter()
+        for record in records:
+            runtime.map_record(adapter_id, record)
+        print(f"{adapter_id:<34} map only     {len(records) / (time.perf_counter() - started):>10.0f} records/sec")
+
+        with tempfile.TemporaryDirectory() as cold_store_dir:
+            for _ in runtime.ingest(
+                adapter_id, records, Path(cold_store_dir), batch_size=args.batch_size, schema_engine=args.schema_engine
+            ):
+                pass
+        report = runtime.report()[adapter_id]
+        print(f"{adapter_id:<34} map + ingest {report['records_per_sec']:>10.0f} records/sec  errors={report['mapping_errors']}/{report['rejected']}")
+
+
+if __name__ == "__main__":
+    main()
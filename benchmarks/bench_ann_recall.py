@@ -0,0 +1,93 @@
+"""Recall@k and query latency of the IVF vector index against exact search.
+
+Usage: python benchmarks/bench_ann_recall.py [--size 200000] [--dim 1024] [--lists 256] [--probes 1,4,8,16,32]
+
+The corpus is a Gaussian mixture of unit vectors (``--clusters`` topics), which is closer to
+embedding corpora than isotropic noise, where no partition can beat a full scan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+import numpy as np
+
+from opentsr.vector_index import ENV_VALUES, VectorIndex
+
+BUILD_CHUNK: int = 50_000
+
+
+def _corpus(size: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.standard_normal((clusters, dim), dtype=np.float32)
+    vectors = centers[rng.integers(0, clusters, size)] + 0.5 * rng.standard_normal((size, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _build(vectors: np.ndarray, lists: int) -> Tuple[VectorIndex, float]:
+    index = VectorIndex(initial_capacity=vectors.shape[0], ann="ivf", ann_lists=lists)
+    started: float = time.perf_counter()
+    for start in range(0, vectors.shape[0], BUILD_CHUNK):
+        chunk = vectors[start : start + BUILD_CHUNK]
+        count: int = chunk.shape[0]
+        index.add_batch(
+            tsr_ids=[f"bench-{start + offset}" for offset in range(count)],
+            vectors=chunk,
+            tsr_timestamps_ns=list(range(start, start + count)),
+            envs=[ENV_VALUES[(start + offset) % len(ENV_VALUES)] for offset in range(count)],
+            origin_kinds=["sensor"] * count,
+            hazard_flags=[(start + offset) % 10 == 0 for offset in range(count)],
+        )
+    return index, time.perf_counter() - started
+
+
+def _run(index: VectorIndex, queries: np.ndarray, k: int, filters: Dict[str, object], **options: object) -> Tuple[List[Set[str]], List[float]]:
+    results: List[Set[str]] = []
+    samples: List[float] = []
+    for query in queries:
+        started: float = time.perf_counter()
+        hits = index.search(query, k=k, **filters, **options)  # type: ignore[arg-type]
+        samples.append((time.perf_counter() - started) * 1000.0)
+        results.append({hit.tsr_id for hit in hits})
+    return results, samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=1024, choices=(1024, 1536))
+    parser.add_argument("--clusters", type=int, default=1000)
+    parser.add_argument("--lists", type=int, default=256)
+    parser.add_argument("--probes", default="1,4,8,16,32")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    vectors: np.ndarray = _corpus(args.size, args.dim, args.clusters, rng)
+    index, build_seconds = _build(vectors, args.lists)
+    print(f"n={args.size} dim={args.dim} lists={args.lists}: built in {build_seconds:.1f} s ({args.size / build_seconds:.0f} vectors/sec)")
+
+    # Queries are perturbed corpus vectors, so each has genuine near neighbours.
+    queries = vectors[rng.choice(args.size, args.queries, replace=False)] + 0.1 * rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+    for label, filters in (("unfiltered", {}), ("hazard+prod", {"hazard_flag": True, "env": "prod"})):
+        truth, exact_ms = _run(index, queries, args.k, filters, exact=True)
+        print(f"{label:<12} exact      recall=1.000  p50={statistics.median(exact_ms):8.2f} ms")
+        for probes in (int(value) for value in args.probes.split(",")):
+            found, ivf_ms = _run(index, queries, args.k, filters, probes=probes)
+            recall: float = sum(len(hits & expected) for hits, expected in zip(found, truth)) / sum(len(expected) for expected in truth)
+            print(f"{label:<12} probes={probes:<3} recall={recall:.3f}  p50={statistics.median(ivf_ms):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
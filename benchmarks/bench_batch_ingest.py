@@ -0,0 +1,83 @@
+"""Signals/sec for per-call vs batch reference ingest.
+
+Usage: python benchmarks/bench_batch_ingest.py [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from jsonschema import Draft202012Validator, FormatChecker
+
+from opentsr import Origin, Safety, TSRSignal, ingest_batch, ingest_signal
+from opentsr.models import _default_schema_path, _load_schema
+
+JsonObject = Dict[str, object]
+
+
+def _make_payloads(count: int) -> List[JsonObject]:
+    payloads: List[JsonObject] = []
+    for index in range(count):
+        signal = TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 16}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            safety=Safety(veracity_score=0.9, hazard_flag=index % 7 == 0),
+            vector=[1.0] + [0.0] * 1023 if index % 2 == 0 else None,
+        )
+        payloads.append(signal.as_json_dict())
+    return payloads
+
+
+def _baseline_ingest(payload: JsonObject, cold_store_dir: Path) -> None:
+    # Mirrors the pre-batch per-call path: fresh validator and a second model dump per signal.
+    signal = TSRSignal.model_validate(payload)
+    schema: JsonObject = _load_schema(str(_default_schema_path()))
+    validator = Draft202012Validator(schema=schema, format_checker=FormatChecker())
+    errors = sorted(validator.iter_errors(signal.as_json_dict()), key=lambda error: list(error.absolute_path))
+    if errors:
+        raise ValueError(errors[0].message)
+    cold_store_dir.mkdir(parents=True, exist_ok=True)
+    (cold_store_dir / f"{signal.tsr_id}.json").write_text(
+        json.dumps(signal.as_json_dict(), separators=(",", ":"), sort_keys=True),
+        encoding="utf-8",
+    )
+
+
+def _time(label: str, count: int, run: Callable[[Path], None]) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        started: float = time.perf_counter()
+        run(Path(temp_dir) / "cold")
+        elapsed: float = time.perf_counter() - started
+    print(f"{label:<28} {count / elapsed:>10.0f} signals/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads: List[JsonObject] = _make_payloads(args.count)
+    _time("baseline per-call", args.count, lambda cold: [_baseline_ingest(p, cold) for p in payloads])
+    _time("ingest_signal per-call", args.count, lambda cold: [ingest_signal(p, cold) for p in payloads])
+    for mode in ("both", "pydantic", "schema"):
+        _time(
+            f"ingest_batch[{mode}]",
+            args.count,
+            lambda cold, mode=mode: ingest_batch(payloads, cold, validation_mode=mode),  # type: ignore[misc]
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Analytics scan over a segmented cold store: parsing JSON records vs reading a column bundle.
+
+The query is mean veracity and hazard rate per ``origin.source_id``.
+
+Usage: python benchmarks/bench_columnar_scan.py [--count N] [--vector-dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+import numpy as np
+
+from opentsr import ColumnBundle, Origin, Safety, SegmentedColdStore, TSRSignal, export_columns
+
+Summary = Dict[str, Tuple[float, float]]
+T = TypeVar("T")
+
+
+def _fill(store: SegmentedColdStore, count: int, vector_dim: int) -> None:
+    base: bytes = array("f", [1.0 / math.sqrt(vector_dim)] * vector_dim).tobytes() if vector_dim else b""
+    for index in range(count):
+        fields = dict(
+            env="staging",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 64}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            safety=Safety(veracity_score=(index % 100) / 100, hazard_flag=index % 7 == 0),
+        )
+        signal = TSRSignal.from_vector_buffer(base, **fields) if vector_dim else TSRSignal(**fields)
+        store.put(signal.tsr_id, signal.canonical_bytes())
+    store.flush()
+
+
+def _json_scan(store: SegmentedColdStore) -> Summary:
+    totals: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0.0, 0.0])
+    for _, record in store.scan():
+        instance = json.loads(record)
+        total: List[float] = totals[instance["origin"]["source_id"]]
+        total[0] += 1
+        total[1] += instance["safety"]["veracity_score"]
+        total[2] += instance["safety"]["hazard_flag"]
+    return {source: (total[1] / total[0], total[2] / total[0]) for source, total in totals.items()}
+
+
+def _column_scan(bundle_dir: Path) -> Summary:
+    bundle = ColumnBundle(bundle_dir)
+    codes, sources = bundle.categories("origin.source_id")
+    counts = np.bincount(codes, minlength=len(sources))
+    veracity = np.bincount(codes, weights=bundle.column("safety.veracity_score"), minlength=len(sources)) / counts
+    hazard = np.bincount(codes, weights=bundle.column("safety.hazard_flag"), minlength=len(sources)) / counts
+    return {source: (float(veracity[code]), float(hazard[code])) for code, source in enumerate(sources)}
+
+
+def _timed(label: str, count: int, run: Callable[[], T]) -> T:
+    started: float = time.perf_counter()
+    result: T = run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:>10.1f} ms {count / elapsed:>12.0f} signals/sec")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--vector-dim", type=int, default=1536, choices=(0, 1024, 1536))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, SegmentedColdStore(Path(tmp) / "cold") as store:
+        bundle_dir: Path = Path(tmp) / "columns"
+        _fill(store, args.count, args.vector_dim)
+        _timed("export_columns (full)", args.count, lambda: export_columns(store, bundle_dir))
+        _fill(store, args.count // 10, args.vector_dim)
+        _timed("export_columns (10% new)", args.count // 10, lambda: export_columns(store, bundle_dir))
+
+        total: int = args.count + args.count // 10
+        from_json: Summary = _timed("JSON scan", total, lambda: _json_scan(store))
+        from_columns: Summary = _timed("column bundle scan", total, lambda: _column_scan(bundle_dir))
+        assert from_json.keys() == from_columns.keys()
+        assert all(np.allclose(from_json[source], from_columns[source]) for source in from_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory per signal and conversion throughput: ``TSRSignal`` vs ``CompactSignal``.
+
+Usage: python benchmarks/bench_compact_signal.py [--count N] [--vector-dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import CompactSignal, Origin, Safety, TSRSignal
+from opentsr.compact import VectorDtype
+
+
+def _make_records(count: int, vector_dim: int) -> List[bytes]:
+    """Canonical JSON records, as a cold store holds them, with float32-exact vectors."""
+    base: array = array("f", [1.0 / math.sqrt(vector_dim)] * vector_dim) if vector_dim else array("f")
+    records: List[bytes] = []
+    for index in range(count):
+        fields = dict(
+            env="staging",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 64}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            safety=Safety(veracity_score=0.9),
+            tags=["bench"],
+        )
+        signal = TSRSignal.from_vector_buffer(base.tobytes(), **fields) if vector_dim else TSRSignal(**fields)
+        records.append(signal.canonical_bytes())
+    return records
+
+
+def _bytes_per_signal(label: str, count: int, build: Callable[[], object]) -> None:
+    # Timed without tracing first; tracemalloc slows allocation-heavy code several times over.
+    started: float = time.perf_counter()
+    build()
+    elapsed: float = time.perf_counter() - started
+    tracemalloc.start()
+    held: object = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<36} {size / count:>10.0f} bytes/signal {count / elapsed:>10.0f} signals/sec")
+    del held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--vector-dim", type=int, default=1536, choices=(0, 1024, 1536))
+    args = parser.parse_args()
+
+    records: List[bytes] = _make_records(args.count, args.vector_dim)
+    _bytes_per_signal("TSRSignal.model_validate_json", args.count, lambda: [TSRSignal.model_validate_json(record) for record in records])
+    dtypes: List[VectorDtype] = ["auto", "float64"]
+    for dtype in dtypes:
+        _bytes_per_signal(
+            f"CompactSignal.from_json ({dtype})",
+            args.count,
+            lambda dtype=dtype: [CompactSignal.from_json(record, vector_dtype=dtype) for record in records],
+        )
+    compact: List[CompactSignal] = [CompactSignal.from_json(record) for record in records]
+    started: float = time.perf_counter()
+    for signal in compact:
+        signal.to_signal()
+    print(f"{'CompactSignal.to_signal':<36} {args.count / (time.perf_counter() - started):>34.0f} signals/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cold-start cost of the opentsr package, measured in fresh interpreter processes.
+
+Each scenario runs ``--repeats`` times in a new ``python`` process and reports the median.
+"eager" loads every public name, which is what ``import opentsr`` did before lazy exports.
+
+Usage: python benchmarks/bench_import_time.py [--repeats 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+
+_TIMER: str = "import time\n_started = time.perf_counter()\n"
+_REPORT: str = "\nprint((time.perf_counter() - _started) * 1000)\n"
+_SIGNAL: str = (
+    "signal = TSRSignal(origin=Origin(kind='sensor', source_id='sensor://bench'), "
+    "payload={'reading': 1}, safety=Safety(veracity_score=0.9))\n"
+)
+
+SCENARIOS: Dict[str, str] = {
+    "import opentsr": "import opentsr",
+    "build + emit one signal": "from opentsr import Origin, Safety, TSRSignal\n" + _SIGNAL + "signal.canonical_bytes()",
+    "build + validate (precompiled schema)": "from opentsr import Origin, Safety, TSRSignal\n" + _SIGNAL + "signal.validate()",
+    "build + validate (spec/schema.json)": (
+        "from pathlib import Path\nfrom opentsr import Origin, Safety, TSRSignal\n"
+        + _SIGNAL
+        + f"signal.validate(schema_path=Path({str(REPO_ROOT / 'spec' / 'schema.json')!r}))"
+    ),
+    "eager (all public names)": "import opentsr\nfor name in opentsr.__all__:\n    getattr(opentsr, name)",
+}
+
+
+def _run(code: str) -> float:
+    environment: Dict[str, str] = dict(os.environ, PYTHONPATH=str(SDK_PYTHON_DIR))
+    output: str = subprocess.run(
+        [sys.executable, "-c", _TIMER + code + _REPORT], check=True, capture_output=True, text=True, env=environment
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=15)
+    args = parser.parse_args()
+
+    _run("import opentsr")  # warm the bytecode cache
+    for label, code in SCENARIOS.items():
+        timings: List[float] = [_run(code) for _ in range(args.repeats)]
+        print(f"{label:<40} {statistics.median(timings):>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Ingest metrics overhead: batch ingest without metrics, with metrics, and with an event sink.
+
+Usage: python benchmarks/bench_ingest_metrics.py [--count N] [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import IngestMetrics, Origin, Safety, TSRSignal, ingest_batch
+from opentsr.metrics import IngestEvent
+from opentsr.models import JsonObject
+
+SIGNATURE_KEY: bytes = b"bench-metrics-key"
+
+
+def _payloads(count: int) -> List[JsonObject]:
+    payloads: List[JsonObject] = []
+    for index in range(count):
+        signal = TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 64}", region="eu-west-1"),
+            payload={"event": "bench", "sequence": index, "reading": index * 0.5},
+            safety=Safety(veracity_score=0.9),
+        )
+        signal.sign(SIGNATURE_KEY)
+        payloads.append(signal.as_json_dict())
+    return payloads
+
+
+def _run(payloads: List[JsonObject], metrics_factory: Callable[[], Optional[IngestMetrics]], rounds: int) -> float:
+    """Best signals/sec over ``rounds`` runs, each into a fresh cold store."""
+    best: float = 0.0
+    for _ in range(rounds):
+        metrics: Optional[IngestMetrics] = metrics_factory()
+        with tempfile.TemporaryDirectory() as cold_store_dir:
+            started: float = time.perf_counter()
+            ingest_batch(payloads, Path(cold_store_dir), verify_signatures=True, signature_key=SIGNATURE_KEY, metrics=metrics)
+            best = max(best, len(payloads) / (time.perf_counter() - started))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads: List[JsonObject] = _payloads(args.count)
+    events: List[IngestEvent] = []
+    measured: IngestMetrics = IngestMetrics()
+    variants: Dict[str, Callable[[], Optional[IngestMetrics]]] = {
+        "disabled": lambda: None,
+        "metrics": lambda: measured,
+        "metrics + sink": lambda: IngestMetrics(sinks=[events.append]),
+    }
+    baseline: float = 0.0
+    for name, factory in variants.items():
+        rate: float = _run(payloads, factory, args.rounds)
+        baseline = baseline or rate
+        print(f"{name:<16} {rate:>10.0f} signals/sec  {100 * (baseline - rate) / baseline:>+6.1f}% overhead")
+
+    print(f"\n{'stage':<12} {'count':>8} {'p50 <=':>10} {'p99 <=':>10}")
+    for stage, stats in measured.snapshot()["stages"].items():  # type: ignore[union-attr]
+        print(f"{stage:<12} {stats['count']:>8} {stats['p50'] * 1e6:>8.0f}us {stats['p99'] * 1e6:>8.0f}us")
+    print()
+    print("\n".join(line for line in measured.prometheus_text().splitlines() if "_total" in line))
+
+
+if __name__ == "__main__":
+    main()
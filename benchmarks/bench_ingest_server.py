@@ -0,0 +1,85 @@
+"""Edge throughput of the asyncio ingest server over keep-alive connections on one box.
+
+Usage: python benchmarks/bench_ingest_server.py [--count N] [--connections 32] [--mode both]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import Origin, Safety, TSRSignal
+from opentsr.ingest_server import INGEST_PATH, IngestServer
+
+
+def _make_bodies(count: int) -> List[bytes]:
+    bodies: List[bytes] = []
+    for index in range(count):
+        signal = TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 16}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            safety=Safety(veracity_score=0.9, hazard_flag=index % 7 == 0),
+        )
+        bodies.append(json.dumps(signal.as_json_dict()).encode("utf-8"))
+    return bodies
+
+
+async def _client(port: int, bodies: List[bytes], statuses: Counter) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for body in bodies:
+        head: str = f"POST {INGEST_PATH} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n"
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+        status_line: bytes = await reader.readline()
+        length: int = 0
+        while (line := await reader.readline()) != b"\r\n":
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":", 1)[1])
+        await reader.readexactly(length)
+        statuses[int(status_line.split()[1])] += 1
+    writer.close()
+
+
+async def _run(args: argparse.Namespace, cold_store_dir: Path) -> None:
+    bodies: List[bytes] = _make_bodies(args.count)
+    server = IngestServer(cold_store_dir, port=0, validation_mode=args.mode)
+    await server.start()
+    statuses: Counter = Counter()
+    try:
+        started: float = time.perf_counter()
+        await asyncio.gather(
+            *(_client(server.port, bodies[offset :: args.connections], statuses) for offset in range(args.connections))
+        )
+        elapsed: float = time.perf_counter() - started
+    finally:
+        await server.close()
+    print(f"connections={args.connections} requests={args.count} statuses={dict(statuses)}")
+    print(f"{args.count / elapsed:.0f} requests/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--mode", default="both", choices=("pydantic", "schema", "both"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asyncio.run(_run(args, Path(temp_dir) / "cold"))
+
+
+if __name__ == "__main__":
+    main()
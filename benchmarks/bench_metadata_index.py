@@ -0,0 +1,84 @@
+"""Query latency of the SQLite metadata index over a synthetic corpus.
+
+Rows are inserted directly with ``MetadataIndex.add`` (no validation) so large corpora build
+quickly; use ``--count 10000000`` for the 10M-record target.
+
+Usage: python benchmarks/bench_metadata_index.py [--count N] [--sources 1000] [--repeats 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import MetadataIndex
+from opentsr.models import _generate_uuid7
+
+HOUR_NS: int = 3600 * 1_000_000_000
+
+
+def _report(label: str, repeats: int, run: Callable[[], List[object]]) -> None:
+    started: float = time.perf_counter()
+    for _ in range(repeats):
+        rows: List[object] = run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<44} {elapsed / repeats * 1e3:>8.2f} ms  ({len(rows)} rows)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--sources", type=int, default=1000)
+    parser.add_argument("--span-hours", type=int, default=24 * 30)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    now_ns: int = time.time_ns()
+    start_ns: int = now_ns - args.span_hours * HOUR_NS
+    step_ns: int = args.span_hours * HOUR_NS // args.count
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with MetadataIndex(Path(temp_dir) / "metadata.sqlite3", commit_batch_size=50_000) as index:
+            started: float = time.perf_counter()
+            for row in range(args.count):
+                index.add(
+                    {
+                        "tsr_id": _generate_uuid7(),
+                        "tsr_timestamp_ns": start_ns + row * step_ns,
+                        "env": "prod" if row % 3 else "dev",
+                        "source_id": f"sensor://bench/{rng.randrange(args.sources)}",
+                        "origin_kind": "sensor" if row % 4 else "service",
+                        "hazard_flag": rng.random() < 0.01,
+                        "veracity_score": rng.random(),
+                        "tags": ["line-a"] if row % 10 == 0 else [],
+                    }
+                )
+            index.flush()
+            elapsed: float = time.perf_counter() - started
+            print(f"indexed {args.count} records in {elapsed:.1f}s ({args.count / elapsed:.0f} records/sec)")
+
+            last_hour: int = now_ns - HOUR_NS
+            _report("hazard from one source, last hour", args.repeats, lambda: index.query(
+                since_ns=last_hour, source_id="sensor://bench/7", hazard_flag=True))
+            _report("hazard from one source, all time", args.repeats, lambda: index.query(
+                source_id="sensor://bench/7", hazard_flag=True))
+            _report("all hazards, last day", args.repeats, lambda: index.query(
+                since_ns=now_ns - 24 * HOUR_NS, hazard_flag=True))
+            _report("prod, veracity >= 0.9, last hour", args.repeats, lambda: index.query(
+                since_ns=last_hour, env="prod", min_veracity=0.9))
+            _report("tag line-a, last hour", args.repeats, lambda: index.query(
+                since_ns=last_hour, tags=["line-a"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Throughput of the process-pool ingest pipeline for 1, 2, 4 and 8 workers.
+
+Usage: python benchmarks/bench_parallel_ingest.py [--count N] [--workers 1,2,4,8] [--mode both]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import Origin, Safety, TSRSignal, ingest_batch
+from opentsr.parallel_ingest import ParallelIngestPipeline
+
+
+def _make_lines(count: int) -> List[str]:
+    lines: List[str] = []
+    for index in range(count):
+        signal = TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 16}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            safety=Safety(veracity_score=0.9, hazard_flag=index % 7 == 0),
+            vector=[1.0] + [0.0] * 1023 if index % 2 == 0 else None,
+        )
+        lines.append(json.dumps(signal.as_json_dict()))
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=4000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--mode", default="both", choices=("pydantic", "schema", "both"))
+    args = parser.parse_args()
+
+    lines: List[str] = _make_lines(args.count)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        started: float = time.perf_counter()
+        ingest_batch([json.loads(line) for line in lines], Path(temp_dir) / "cold", validation_mode=args.mode)
+        elapsed: float = time.perf_counter() - started
+    print(f"{'sequential ingest_batch':<26} {args.count / elapsed:>10.0f} signals/sec")
+
+    for workers in (int(value) for value in args.workers.split(",")):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with ParallelIngestPipeline(
+                Path(temp_dir) / "cold",
+                workers=workers,
+                chunk_size=args.chunk_size,
+                validation_mode=args.mode,
+                executor_kind="process",
+            ) as pipeline:
+                started = time.perf_counter()
+                for _ in pipeline.ingest(lines):
+                    pass
+                elapsed = time.perf_counter() - started
+        print(f"{f'parallel workers={workers}':<26} {args.count / elapsed:>10.0f} signals/sec")
+
+
+if __name__ == "__main__":
+    main()
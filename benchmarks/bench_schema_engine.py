@@ -0,0 +1,71 @@
+"""Schema validation throughput: jsonschema's Draft 2020-12 validator vs the compiled validator.
+
+Usage: python benchmarks/bench_schema_engine.py [--count N] [--vector-dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import Origin, Safety, TSRSignal
+from opentsr.models import JsonObject, _resolve_schema_validator, _validate_json_instance
+
+
+def _make_instances(count: int, vector_dim: int) -> List[JsonObject]:
+    instances: List[JsonObject] = []
+    for index in range(count):
+        signal = TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 64}", namespace="bench"),
+            payload={"event": "reading", "sequence": index},
+            vector=[(-1) ** (index + position) / vector_dim**0.5 for position in range(vector_dim)] if vector_dim else None,
+            safety=Safety(veracity_score=0.9),
+            tags=["bench", f"shard-{index % 8}"],
+        )
+        instances.append(signal.as_json_dict())
+    return instances
+
+
+def _report(label: str, count: int, run: Callable[[], object]) -> None:
+    started: float = time.perf_counter()
+    run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<40} {count / elapsed:>10.0f} signals/sec")
+
+
+def _rejections(instances: List[JsonObject], engine: str) -> int:
+    validator = _resolve_schema_validator(schema_engine=engine)  # type: ignore[arg-type]
+    rejected: int = 0
+    for instance in instances:
+        try:
+            _validate_json_instance(instance, validator)
+        except ValueError:
+            rejected += 1
+    return rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--vector-dim", type=int, default=1536, choices=(0, 1024, 1536))
+    args = parser.parse_args()
+
+    valid: List[JsonObject] = _make_instances(args.count, args.vector_dim)
+    invalid: List[JsonObject] = [{**instance, "env": "qa", "tags": "not-a-list"} for instance in valid]
+    for engine in ("jsonschema", "compiled"):
+        _rejections(valid[:1], engine)
+        _report(f"{engine} (valid)", args.count, lambda engine=engine: _rejections(valid, engine))
+        _report(f"{engine} (invalid, first error)", args.count, lambda engine=engine: _rejections(invalid, engine))
+
+
+if __name__ == "__main__":
+    main()
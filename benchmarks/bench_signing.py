@@ -0,0 +1,68 @@
+"""Signing and verification throughput: per-signal ``sign``/``verify_signature`` vs batch APIs.
+
+Usage: python benchmarks/bench_signing.py [--count N] [--payload-bytes 512] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import Keyring, Origin, Safety, TSRSignal, sign_many, verify_many
+
+KEY: bytes = b"benchmark-signing-key"
+
+
+def _make_signals(count: int, payload_bytes: int) -> List[TSRSignal]:
+    return [
+        TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id=f"sensor://bench/{index % 64}", namespace="bench"),
+            payload={"event": "reading", "sequence": index, "blob": "x" * payload_bytes},
+            safety=Safety(veracity_score=0.9),
+        )
+        for index in range(count)
+    ]
+
+
+def _report(label: str, count: int, run: Callable[[], object]) -> None:
+    started: float = time.perf_counter()
+    run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<36} {count / elapsed:>10.0f} signals/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--payload-bytes", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    keyring = Keyring({f"sensor://bench/{index}": KEY + bytes([index]) for index in range(64)})
+
+    signals: List[TSRSignal] = _make_signals(args.count, args.payload_bytes)
+    _report("sign (per signal)", args.count, lambda: [signal.sign(KEY) for signal in signals])
+    signals = _make_signals(args.count, args.payload_bytes)
+    _report("sign_many (single key)", args.count, lambda: sign_many(signals, KEY))
+    _report("verify_signature (per signal)", args.count, lambda: [signal.verify_signature(KEY) for signal in signals])
+    signals = _make_signals(args.count, args.payload_bytes)
+    sign_many(signals, KEY)
+    _report("verify_many (single key)", args.count, lambda: verify_many(signals, KEY))
+    signals = _make_signals(args.count, args.payload_bytes)
+    sign_many(signals, KEY)
+    _report(f"verify_many (workers={args.workers})", args.count, lambda: verify_many(signals, KEY, workers=args.workers))
+    signals = _make_signals(args.count, args.payload_bytes)
+    _report("sign_many (keyring, 64 keys)", args.count, lambda: sign_many(signals, keyring))
+
+
+if __name__ == "__main__":
+    main()
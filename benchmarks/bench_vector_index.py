@@ -0,0 +1,77 @@
+"""Top-k query latency for the exact hot vector index.
+
+Usage: python benchmarks/bench_vector_index.py [--sizes 100000,1000000] [--dim 1024]
+
+Memory is roughly ``size * dim * 4`` bytes (about 4 GB for 1M x 1024).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+import numpy as np
+
+from opentsr.vector_index import ENV_VALUES, ORIGIN_KIND_VALUES, VectorIndex
+
+BUILD_CHUNK: int = 50_000
+
+
+def _build(size: int, dim: int, rng: np.random.Generator) -> VectorIndex:
+    index = VectorIndex(initial_capacity=size)
+    for start in range(0, size, BUILD_CHUNK):
+        count: int = min(BUILD_CHUNK, size - start)
+        vectors = rng.standard_normal((count, dim), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index.add_batch(
+            tsr_ids=[f"bench-{start + offset}" for offset in range(count)],
+            vectors=vectors,
+            tsr_timestamps_ns=list(range(start, start + count)),
+            envs=[ENV_VALUES[offset % len(ENV_VALUES)] for offset in range(count)],
+            origin_kinds=[ORIGIN_KIND_VALUES[offset % len(ORIGIN_KIND_VALUES)] for offset in range(count)],
+            hazard_flags=[offset % 10 == 0 for offset in range(count)],
+        )
+    return index
+
+
+def _latency_ms(index: VectorIndex, queries: np.ndarray, k: int, **filters: object) -> List[float]:
+    samples: List[float] = []
+    for query in queries:
+        started: float = time.perf_counter()
+        index.search(query, k=k, **filters)  # type: ignore[arg-type]
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--dim", type=int, default=1024, choices=(1024, 1536))
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    for size in (int(value) for value in args.sizes.split(",")):
+        index: VectorIndex = _build(size, args.dim, rng)
+        queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+        for label, filters in (("unfiltered", {}), ("hazard+llm", {"hazard_flag": True, "origin_kind": "llm_agent"})):
+            samples: List[float] = _latency_ms(index, queries, args.k, **filters)
+            print(
+                f"n={size:<9} dim={args.dim} {label:<14} "
+                f"p50={statistics.median(samples):8.2f} ms  max={max(samples):8.2f} ms"
+            )
+        del index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Microbenchmark for TSRSignal vector validation.
+
+Compares the original generator-based norm check with ``opentsr.vector_checks``
+for single Python lists, single NumPy rows, and whole batches.
+
+Usage: python benchmarks/bench_vector_validation.py [--count N] [--dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+import numpy as np
+
+from opentsr.vector_checks import vector_error, vector_errors
+
+
+def _generator_norm_check(vector: List[float]) -> None:
+    # Pre-vectorization TSRSignal.validate_vector body.
+    if len(vector) not in (1024, 1536):
+        raise ValueError("vector length must be exactly 1024 or 1536")
+    l2_norm: float = math.sqrt(sum(component * component for component in vector))
+    if not math.isfinite(l2_norm) or l2_norm == 0.0:
+        raise ValueError("vector norm must be finite and non-zero")
+    if abs(l2_norm - 1.0) > 1e-3:
+        raise ValueError("vector must be L2-normalized (norm ~= 1.0)")
+
+
+def _report(label: str, count: int, run: Callable[[], object]) -> None:
+    started: float = time.perf_counter()
+    run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<34} {elapsed / count * 1e6:>8.2f} us/vector")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=1536, choices=(1024, 1536))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    matrix = rng.standard_normal((args.count, args.dim))
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    lists: List[List[float]] = matrix.tolist()
+    rows = list(matrix.astype(np.float32))
+
+    _report("generator (baseline), lists", args.count, lambda: [_generator_norm_check(vector) for vector in lists])
+    _report("vector_error, lists (hypot)", args.count, lambda: [vector_error(vector) for vector in lists])
+    _report("vector_error, numpy rows", args.count, lambda: [vector_error(row) for row in rows])
+    _report("vector_errors, numpy rows batch", args.count, lambda: vector_errors(rows))
+    _report("vector_errors, 2-D float32 array", args.count, lambda: vector_errors(matrix.astype(np.float32)))
+
+
+if __name__ == "__main__":
+    main()
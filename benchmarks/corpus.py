@@ -0,0 +1,159 @@
+"""Synthetic OpenTSR signal corpora for benchmarks and load tests.
+
+Usage: python -m benchmarks.corpus [--per-shape 200] [--seed 7] > corpus.ndjson
+
+Each shape exercises a different part of validation and ingest: every ``origin.kind``,
+1024- and 1536-dim vectors, signed and unsigned ``prod`` signals (the latter are rejected),
+payloads just under the 1 MB soft limit, and records mapped by the registered adapters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, get_args
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+if str(SDK_PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(SDK_PYTHON_DIR))
+
+from opentsr import ActionIntent, AdapterRuntime, Origin, Safety, TSRSignal
+from opentsr.models import MAX_PAYLOAD_SOFT_BYTES, JsonObject
+
+SIGNATURE_KEY: bytes = b"opentsr-benchmark-corpus-key"
+ORIGIN_KINDS: Tuple[str, ...] = get_args(Origin.model_fields["kind"].annotation)
+# Headroom under the soft limit for the payload's own keys and JSON punctuation.
+NEAR_LIMIT_PAYLOAD_CHARS: int = MAX_PAYLOAD_SOFT_BYTES - 4096
+# Near-limit payloads are about 1 MB each, so they get a smaller share of the corpus.
+NEAR_LIMIT_SHARE: int = 20
+
+
+@dataclass(frozen=True)
+class CorpusItem:
+    """One signal as a JSON-ready dict; ``valid`` is False for shapes ingest must reject."""
+
+    shape: str
+    fields: JsonObject
+    valid: bool = True
+
+
+def _unit_vector(rng: random.Random, dim: int) -> List[float]:
+    values: List[float] = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm: float = math.sqrt(sum(value * value for value in values))
+    return [value / norm for value in values]
+
+
+def _signal(rng: random.Random, sequence: int, kind: str = "sensor", env: str = "dev", **fields: object) -> TSRSignal:
+    payload: JsonObject = {"event": "bench", "sequence": sequence, "reading": round(rng.uniform(-50.0, 50.0), 3)}
+    payload.update(fields.pop("payload", {}))  # type: ignore[arg-type]
+    if kind == "llm_agent":
+        fields["agent_id"] = f"agent-{sequence % 8}"
+        fields["action_intent"] = ActionIntent(action="summarize", target=f"ticket-{sequence}", reason="triage")
+    return TSRSignal(
+        env=env,  # type: ignore[arg-type]
+        origin=Origin(kind=kind, source_id=f"{kind}://bench/{sequence % 32}", namespace="bench", region="eu-west-1"),  # type: ignore[arg-type]
+        payload=payload,
+        safety=Safety(veracity_score=round(rng.uniform(0.5, 1.0), 3), hazard_flag=sequence % 11 == 0),
+        tags=["bench", kind],
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+def _origin_kind(kind: str) -> Callable[[random.Random, int], CorpusItem]:
+    def build(rng: random.Random, sequence: int) -> CorpusItem:
+        return CorpusItem(f"kind:{kind}", _signal(rng, sequence, kind=kind).as_json_dict())
+
+    return build
+
+
+def _vector(dim: int) -> Callable[[random.Random, int], CorpusItem]:
+    def build(rng: random.Random, sequence: int) -> CorpusItem:
+        return CorpusItem(f"vector:{dim}", _signal(rng, sequence, vector=_unit_vector(rng, dim)).as_json_dict())
+
+    return build
+
+
+def _prod_signed(rng: random.Random, sequence: int) -> CorpusItem:
+    signal: TSRSignal = _signal(rng, sequence, kind="service", env="staging")
+    signal.env = "prod"
+    signal.sign(SIGNATURE_KEY)
+    return CorpusItem("prod:signed", signal.as_json_dict())
+
+
+def _prod_unsigned(rng: random.Random, sequence: int) -> CorpusItem:
+    fields: JsonObject = _signal(rng, sequence, kind="service").as_json_dict()
+    fields["env"] = "prod"
+    return CorpusItem("prod:unsigned", fields, valid=False)
+
+
+def _near_soft_limit(rng: random.Random, sequence: int) -> CorpusItem:
+    filler: str = "".join(rng.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=64)) * (NEAR_LIMIT_PAYLOAD_CHARS // 64)
+    return CorpusItem("payload:near-soft-limit", _signal(rng, sequence, payload={"blob": filler}).as_json_dict())
+
+
+def _adapter_examples() -> List[Tuple[str, JsonObject, AdapterRuntime]]:
+    runtime: AdapterRuntime = AdapterRuntime.from_registry()
+    examples: List[Tuple[str, JsonObject, AdapterRuntime]] = []
+    for adapter_id, adapter in runtime.adapters.items():
+        for example in adapter.manifest["examples"]:  # type: ignore[index]
+            source: JsonObject = json.loads((REPO_ROOT / example["source_path"]).read_text(encoding="utf-8"))
+            examples.append((adapter_id, source, runtime))
+    return examples
+
+
+def _adapter(adapter_id: str, source: JsonObject, runtime: AdapterRuntime) -> Callable[[random.Random, int], CorpusItem]:
+    def build(rng: random.Random, sequence: int) -> CorpusItem:
+        return CorpusItem(f"adapter:{adapter_id}", runtime.map_record(adapter_id, source))
+
+    return build
+
+
+def shape_builders() -> Dict[str, Callable[[random.Random, int], CorpusItem]]:
+    """Builders by shape name, in a stable order."""
+    builders: Dict[str, Callable[[random.Random, int], CorpusItem]] = {f"kind:{kind}": _origin_kind(kind) for kind in ORIGIN_KINDS}
+    builders["vector:1024"] = _vector(1024)
+    builders["vector:1536"] = _vector(1536)
+    builders["prod:signed"] = _prod_signed
+    builders["prod:unsigned"] = _prod_unsigned
+    builders["payload:near-soft-limit"] = _near_soft_limit
+    for adapter_id, source, runtime in _adapter_examples():
+        builders[f"adapter:{adapter_id}"] = _adapter(adapter_id, source, runtime)
+    return builders
+
+
+def generate_corpus(per_shape: int = 200, seed: int = 7, shapes: Optional[List[str]] = None) -> Iterator[CorpusItem]:
+    """``per_shape`` signals of each shape (``per_shape // 20`` near the soft limit), shape by shape.
+
+    Payload values and vectors are drawn from ``seed``; ``tsr_id`` and timestamps are fresh.
+    """
+    builders: Dict[str, Callable[[random.Random, int], CorpusItem]] = shape_builders()
+    for shape in shapes if shapes is not None else list(builders):
+        if shape not in builders:
+            raise ValueError(f"unsupported corpus shape: {shape}. Supported: {', '.join(builders)}")
+        rng = random.Random(f"{seed}:{shape}")
+        count: int = max(1, per_shape // NEAR_LIMIT_SHARE) if shape == "payload:near-soft-limit" else per_shape
+        for sequence in range(count):
+            yield builders[shape](rng, sequence)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-shape", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--shapes", default=None, help="comma-separated subset of shapes")
+    args = parser.parse_args()
+
+    shapes: Optional[List[str]] = args.shapes.split(",") if args.shapes else None
+    for item in generate_corpus(args.per_shape, args.seed, shapes):
+        sys.stdout.write(json.dumps(item.fields, separators=(",", ":"), sort_keys=True))
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
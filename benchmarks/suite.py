@@ -0,0 +1,184 @@
+"""Regression benchmark suite: signal construction, validation, signing and ingest over a synthetic corpus.
+
+Usage: python -m benchmarks.suite [--per-shape 200] [--repeat 3] [--output results.json] [--baseline baseline.json]
+
+Every case runs over every corpus shape (see :mod:`benchmarks.corpus`); cases that need a
+valid model skip shapes the model rejects. Results are written as JSON keyed by
+``<case>/<shape>``; with ``--baseline``, any key whose ops/sec dropped by more than
+``--tolerance`` is reported and the exit status is 1. Save a baseline per machine with
+``--output``, since absolute numbers do not transfer between hosts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SDK_PYTHON_DIR: Path = REPO_ROOT / "sdk" / "python"
+for path in (SDK_PYTHON_DIR, REPO_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from pydantic import ValidationError
+
+from benchmarks.corpus import SIGNATURE_KEY, CorpusItem, generate_corpus
+from opentsr import TSRSignal, ingest_signal, ingest_signal_json
+from opentsr.models import JsonObject
+
+RESULTS_FORMAT: int = 1
+DEFAULT_TOLERANCE: float = 0.15
+
+
+@dataclass(frozen=True)
+class Case:
+    """A timed operation; ``prepare`` builds its untimed input and ``needs_model`` skips invalid shapes."""
+
+    prepare: Callable[[CorpusItem], object]
+    run: Callable[[object, Path], object]
+    needs_model: bool = False
+
+
+def _construct(fields: object, _: Path) -> object:
+    try:
+        return TSRSignal.model_validate(fields)
+    except ValidationError:
+        return None
+
+
+def _model(item: CorpusItem) -> TSRSignal:
+    return TSRSignal.model_validate(item.fields)
+
+
+def _signed_model(item: CorpusItem) -> TSRSignal:
+    signal: TSRSignal = TSRSignal.model_validate(item.fields)
+    signal.sign(SIGNATURE_KEY)
+    return signal
+
+
+CASES: Dict[str, Case] = {
+    "construct": Case(prepare=lambda item: item.fields, run=_construct),
+    "validate": Case(prepare=_model, run=lambda signal, _: signal.validate(), needs_model=True),  # type: ignore[attr-defined]
+    "sign": Case(prepare=_model, run=lambda signal, _: signal.sign(SIGNATURE_KEY), needs_model=True),  # type: ignore[attr-defined]
+    "verify": Case(
+        prepare=_signed_model, run=lambda signal, _: signal.verify_signature(SIGNATURE_KEY), needs_model=True  # type: ignore[attr-defined]
+    ),
+    "ingest_signal": Case(prepare=lambda item: item.fields, run=lambda fields, cold: ingest_signal(fields, cold)),  # type: ignore[arg-type]
+    "ingest_signal_json": Case(
+        prepare=lambda item: json.dumps(item.fields, separators=(",", ":")),
+        run=lambda text, cold: ingest_signal_json(text, cold),  # type: ignore[arg-type]
+    ),
+}
+
+
+def _measure(case: Case, items: List[CorpusItem], repeat: int) -> Optional[JsonObject]:
+    """Best-of-``repeat`` throughput and per-operation percentiles for one case over ``items``."""
+    selected: List[CorpusItem] = [item for item in items if item.valid or not case.needs_model]
+    if not selected:
+        return None
+    best_seconds: float = float("inf")
+    samples_ns: List[int] = []
+    for _ in range(repeat):
+        inputs: List[object] = [case.prepare(item) for item in selected]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cold_store_dir: Path = Path(temp_dir) / "cold"
+            round_ns: List[int] = []
+            for value in inputs:
+                started: int = time.perf_counter_ns()
+                case.run(value, cold_store_dir)
+                round_ns.append(time.perf_counter_ns() - started)
+        best_seconds = min(best_seconds, sum(round_ns) / 1e9)
+        samples_ns.extend(round_ns)
+    samples_ns.sort()
+    return {
+        "count": len(selected),
+        "ops_per_sec": round(len(selected) / best_seconds, 1),
+        "p50_us": round(statistics.median(samples_ns) / 1000, 2),
+        "p99_us": round(samples_ns[min(len(samples_ns) - 1, int(len(samples_ns) * 0.99))] / 1000, 2),
+    }
+
+
+def run_suite(per_shape: int, seed: int, repeat: int, cases: List[str], shapes: Optional[List[str]] = None) -> JsonObject:
+    by_shape: Dict[str, List[CorpusItem]] = {}
+    for item in generate_corpus(per_shape, seed, shapes):
+        by_shape.setdefault(item.shape, []).append(item)
+
+    results: Dict[str, JsonObject] = {}
+    for case_name in cases:
+        for shape, items in by_shape.items():
+            measured: Optional[JsonObject] = _measure(CASES[case_name], items, repeat)
+            if measured is not None:
+                results[f"{case_name}/{shape}"] = measured
+    return {
+        "format": RESULTS_FORMAT,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {"per_shape": per_shape, "seed": seed, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(current: JsonObject, baseline: JsonObject, tolerance: float = DEFAULT_TOLERANCE) -> List[Tuple[str, float, float]]:
+    """``(key, baseline ops/sec, current ops/sec)`` for every result that slowed by more than ``tolerance``."""
+    if baseline.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"unsupported baseline format: {baseline.get('format')}. Supported: {RESULTS_FORMAT}")
+    regressions: List[Tuple[str, float, float]] = []
+    baseline_results: Dict[str, JsonObject] = baseline["results"]  # type: ignore[assignment]
+    for key, measured in current["results"].items():  # type: ignore[attr-defined]
+        reference: Optional[JsonObject] = baseline_results.get(key)
+        if reference is None:
+            continue
+        before: float = float(reference["ops_per_sec"])  # type: ignore[arg-type]
+        after: float = float(measured["ops_per_sec"])
+        if after < before * (1.0 - tolerance):
+            regressions.append((key, before, after))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-shape", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--shapes", default=None, help="comma-separated subset of corpus shapes")
+    parser.add_argument("--output", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    cases: List[str] = args.cases.split(",")
+    unknown: List[str] = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"unsupported case: {unknown[0]}. Supported: {', '.join(CASES)}")
+    report: JsonObject = run_suite(args.per_shape, args.seed, args.repeat, cases, args.shapes.split(",") if args.shapes else None)
+
+    for key, measured in report["results"].items():  # type: ignore[attr-defined]
+        print(f"{key:<60} {measured['ops_per_sec']:>12.0f} ops/sec  p50={measured['p50_us']:>10.1f} us  p99={measured['p99_us']:>10.1f} us")
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    if args.baseline is not None:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before:.0f} -> {after:.0f} ops/sec ({100 * (after - before) / before:+.1f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {100 * args.tolerance:.0f}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
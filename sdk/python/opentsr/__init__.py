@@ -1,14 +1,80 @@
-from .reference_ingest import IngestResult, ingest_signal, ingest_signal_json
-from .models import ActionIntent, Origin, ResourceRef, Safety, TSRSignal, Trace
-
-__all__ = [
-    "ActionIntent",
-    "IngestResult",
-    "Origin",
-    "ResourceRef",
-    "Safety",
-    "TSRSignal",
-    "Trace",
-    "ingest_signal",
-    "ingest_signal_json",
-]
+"""OpenTSR Python SDK.
+
+Public names are imported on first access, so ``from opentsr import TSRSignal`` loads the
+models without the ingest, storage or validation machinery.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from .adapter_runtime import AdapterRuntime, AdapterStats, read_records
+    from .blob_verify import BlobFinding, BlobVerifier
+    from .cold_store import ColdStore, DirectoryColdStore, SegmentedColdStore
+    from .columnar import ColumnBundle, export_columns
+    from .compact import CompactSignal, Environment, OriginKind
+    from .dedupe import DedupeIndex
+    from .ingest_server import IngestServer
+    from .ingest_session import IngestSession
+    from .metadata_index import MetadataIndex, SignalMetadata
+    from .metrics import IngestMetrics
+    from .models import ActionIntent, Origin, ResourceRef, Safety, TSRSignal, Trace
+    from .parallel_ingest import ParallelIngestPipeline, ingest_parallel
+    from .reference_ingest import IngestResult, ingest_batch, ingest_signal, ingest_signal_json, ingest_stream
+    from .signing import Keyring, sign_many, verify_many
+    from .vector_index import VectorHit, VectorIndex
+
+_EXPORTS: Dict[str, str] = {
+    "ActionIntent": ".models",
+    "AdapterRuntime": ".adapter_runtime",
+    "AdapterStats": ".adapter_runtime",
+    "BlobFinding": ".blob_verify",
+    "BlobVerifier": ".blob_verify",
+    "ColdStore": ".cold_store",
+    "ColumnBundle": ".columnar",
+    "CompactSignal": ".compact",
+    "DedupeIndex": ".dedupe",
+    "DirectoryColdStore": ".cold_store",
+    "Environment": ".compact",
+    "IngestMetrics": ".metrics",
+    "IngestResult": ".reference_ingest",
+    "IngestServer": ".ingest_server",
+    "IngestSession": ".ingest_session",
+    "Keyring": ".signing",
+    "MetadataIndex": ".metadata_index",
+    "Origin": ".models",
+    "OriginKind": ".compact",
+    "ParallelIngestPipeline": ".parallel_ingest",
+    "ResourceRef": ".models",
+    "Safety": ".models",
+    "SegmentedColdStore": ".cold_store",
+    "SignalMetadata": ".metadata_index",
+    "TSRSignal": ".models",
+    "Trace": ".models",
+    "VectorHit": ".vector_index",
+    "VectorIndex": ".vector_index",
+    "export_columns": ".columnar",
+    "ingest_batch": ".reference_ingest",
+    "ingest_parallel": ".parallel_ingest",
+    "ingest_signal": ".reference_ingest",
+    "ingest_signal_json": ".reference_ingest",
+    "ingest_stream": ".reference_ingest",
+    "read_records": ".adapter_runtime",
+    "sign_many": ".signing",
+    "verify_many": ".signing",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: object = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
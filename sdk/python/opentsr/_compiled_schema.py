@@ -0,0 +1,809 @@
+"""Compiled validator for spec/schema.json. Generated by ``python -m opentsr.codegen``; do not edit."""
+
+import re
+
+from .compiled_schema import _extras_message, _format_ok, _is_integer, _is_number, _is_uuid, _unique
+
+SCHEMA_SHA256 = "d73866ee522f028a6420453e44328bb07551de993719cc95d594d3d8f14b23c5"
+
+_PROPERTIES_0 = frozenset(['@context', '@type', 'schema_version', 'tsr_id', 'tsr_timestamp_ns', 'env', 'agent_id', 'action_intent', 'origin', 'payload', 'vector', 'safety', 'tags', 'trace', 'resources'])
+_PATTERN_1 = re.compile('^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$')
+_PROPERTIES_2 = frozenset(['action', 'target', 'reason', 'requested_by'])
+_PROPERTIES_3 = frozenset(['kind', 'source_id', 'namespace', 'device_id', 'software_version', 'region'])
+_PATTERN_4 = re.compile('^[A-Fa-f0-9]{64}$')
+_PATTERN_5 = re.compile('^[a-zA-Z0-9!#$&^_.+-]+/[a-zA-Z0-9!#$&^_.+-]+$')
+_PROPERTIES_6 = frozenset(['sensor_id', 'sensor_type', 'unit', 'value', 'location'])
+_ITEM_TYPES_7 = frozenset((float, int))
+_PROPERTIES_8 = frozenset(['veracity_score', 'hazard_flag', 'digital_signature', 'signature_alg'])
+_PROPERTIES_9 = frozenset(['trace_id', 'span_id', 'parent_span_id'])
+_PROPERTIES_10 = frozenset(['blob_url', 'sha256_hash', 'content_type', 'size_bytes'])
+_PATTERN_11 = re.compile('^[a-zA-Z0-9!#$&^_.+-]+/[a-zA-Z0-9!#$&^_.+-]+$')
+_REPRS_13 = ("{'properties': {'vector': {'minItems': 1024, 'maxItems': 1024}}}", "{'properties': {'vector': {'minItems': 1536, 'maxItems': 1536}}}")
+
+
+def _check_1(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if instance != 'https://opentsr.org/context/v1':
+        return (), "'https://opentsr.org/context/v1' was expected"
+    return None
+
+
+def _check_2(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if instance != 'OpenTSRSignal':
+        return (), "'OpenTSRSignal' was expected"
+    return None
+
+
+def _check_3(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if instance != '1.0.0-draft':
+        return (), "'1.0.0-draft' was expected"
+    return None
+
+
+def _check_4(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if not _is_uuid(instance):
+        return (), repr(instance) + " is not a 'uuid'"
+    if _PATTERN_1.search(instance) is None:
+        return (), repr(instance) + " does not match '^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'"
+    return None
+
+
+def _check_5(instance):
+    if not _is_integer(instance):
+        return (), repr(instance) + " is not of type 'integer'"
+    if instance < 0:
+        return (), repr(instance) + ' is less than the minimum of 0'
+    if instance > 9223372036854775807:
+        return (), repr(instance) + ' is greater than the maximum of 9223372036854775807'
+    return None
+
+
+def _check_6(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if instance not in ('dev', 'staging', 'prod'):
+        return (), repr(instance) + " is not one of ['dev', 'staging', 'prod']"
+    return None
+
+
+def _check_7(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if len(instance) < 1:
+        return (), repr(instance) + ' should be non-empty'
+    return None
+
+
+def _check_8(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_2.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_2), key=str))
+    if 'action' not in instance:
+        return (), "'action' is a required property"
+    if 'target' not in instance:
+        return (), "'target' is a required property"
+    if 'action' in instance:
+        error = _check_7(instance['action'])
+        if error is not None:
+            return ('action',) + error[0], error[1]
+    if 'target' in instance:
+        error = _check_7(instance['target'])
+        if error is not None:
+            return ('target',) + error[0], error[1]
+    if 'reason' in instance:
+        error = _check_7(instance['reason'])
+        if error is not None:
+            return ('reason',) + error[0], error[1]
+    if 'requested_by' in instance:
+        error = _check_7(instance['requested_by'])
+        if error is not None:
+            return ('requested_by',) + error[0], error[1]
+    return None
+
+
+def _check_10(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if instance not in ('llm_agent', 'sensor', 'service', 'human_operator', 'simulator'):
+        return (), repr(instance) + " is not one of ['llm_agent', 'sensor', 'service', 'human_operator', 'simulator']"
+    return None
+
+
+def _check_9(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_3.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_3), key=str))
+    if 'kind' not in instance:
+        return (), "'kind' is a required property"
+    if 'source_id' not in instance:
+        return (), "'source_id' is a required property"
+    if 'kind' in instance:
+        error = _check_10(instance['kind'])
+        if error is not None:
+            return ('kind',) + error[0], error[1]
+    if 'source_id' in instance:
+        error = _check_7(instance['source_id'])
+        if error is not None:
+            return ('source_id',) + error[0], error[1]
+    if 'namespace' in instance:
+        error = _check_7(instance['namespace'])
+        if error is not None:
+            return ('namespace',) + error[0], error[1]
+    if 'device_id' in instance:
+        error = _check_7(instance['device_id'])
+        if error is not None:
+            return ('device_id',) + error[0], error[1]
+    if 'software_version' in instance:
+        error = _check_7(instance['software_version'])
+        if error is not None:
+            return ('software_version',) + error[0], error[1]
+    if 'region' in instance:
+        error = _check_7(instance['region'])
+        if error is not None:
+            return ('region',) + error[0], error[1]
+    return None
+
+
+def _check_12(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if not _format_ok(instance, 'uri'):
+        return (), repr(instance) + " is not a 'uri'"
+    return None
+
+
+def _check_13(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if _PATTERN_4.search(instance) is None:
+        return (), repr(instance) + " does not match '^[A-Fa-f0-9]{64}$'"
+    return None
+
+
+def _check_14(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if _PATTERN_5.search(instance) is None:
+        return (), repr(instance) + " does not match '^[a-zA-Z0-9!#$&^_.+-]+/[a-zA-Z0-9!#$&^_.+-]+$'"
+    return None
+
+
+def _check_16(instance):
+    if not _is_number(instance):
+        return (), repr(instance) + " is not of type 'number'"
+    return None
+
+
+def _check_15(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_6.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_6), key=str))
+    if 'sensor_id' not in instance:
+        return (), "'sensor_id' is a required property"
+    if 'sensor_type' not in instance:
+        return (), "'sensor_type' is a required property"
+    if 'unit' not in instance:
+        return (), "'unit' is a required property"
+    if 'value' not in instance:
+        return (), "'value' is a required property"
+    if 'sensor_id' in instance:
+        error = _check_7(instance['sensor_id'])
+        if error is not None:
+            return ('sensor_id',) + error[0], error[1]
+    if 'sensor_type' in instance:
+        error = _check_7(instance['sensor_type'])
+        if error is not None:
+            return ('sensor_type',) + error[0], error[1]
+    if 'unit' in instance:
+        error = _check_7(instance['unit'])
+        if error is not None:
+            return ('unit',) + error[0], error[1]
+    if 'value' in instance:
+        error = _check_16(instance['value'])
+        if error is not None:
+            return ('value',) + error[0], error[1]
+    if 'location' in instance:
+        error = _check_7(instance['location'])
+        if error is not None:
+            return ('location',) + error[0], error[1]
+    return None
+
+
+def _check_11(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if 'blob_url' in instance:
+        error = _check_12(instance['blob_url'])
+        if error is not None:
+            return ('blob_url',) + error[0], error[1]
+    if 'sha256_hash' in instance:
+        error = _check_13(instance['sha256_hash'])
+        if error is not None:
+            return ('sha256_hash',) + error[0], error[1]
+    if 'content_type' in instance:
+        error = _check_14(instance['content_type'])
+        if error is not None:
+            return ('content_type',) + error[0], error[1]
+    if 'physical:sensor' in instance:
+        error = _check_15(instance['physical:sensor'])
+        if error is not None:
+            return ('physical:sensor',) + error[0], error[1]
+    return None
+
+
+def _check_18(instance):
+    if not _is_number(instance):
+        return (), repr(instance) + " is not of type 'number'"
+    if instance < -1.0:
+        return (), repr(instance) + ' is less than the minimum of -1.0'
+    if instance > 1.0:
+        return (), repr(instance) + ' is greater than the maximum of 1.0'
+    return None
+
+
+def _check_17(instance):
+    if not isinstance(instance, list):
+        return (), repr(instance) + " is not of type 'array'"
+    if not (_ITEM_TYPES_7.issuperset(map(type, instance)) and (not instance or (-1.0 <= min(instance) and max(instance) <= 1.0))):
+        for index, item in enumerate(instance):
+            if not ((type(item) is float or type(item) is int) and -1.0 <= item <= 1.0):
+                error = _check_18(item)
+                if error is not None:
+                    return (index,) + error[0], error[1]
+    if len(instance) < 1024:
+        return (), repr(instance) + ' is too short'
+    if len(instance) > 1536:
+        return (), repr(instance) + ' is too long'
+    return None
+
+
+def _check_20(instance):
+    if not _is_number(instance):
+        return (), repr(instance) + " is not of type 'number'"
+    if instance < 0.0:
+        return (), repr(instance) + ' is less than the minimum of 0.0'
+    if instance > 1.0:
+        return (), repr(instance) + ' is greater than the maximum of 1.0'
+    return None
+
+
+def _check_21(instance):
+    if not isinstance(instance, bool):
+        return (), repr(instance) + " is not of type 'boolean'"
+    return None
+
+
+def _check_22(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if len(instance) < 1:
+        return (), repr(instance) + ' should be non-empty'
+    return None
+
+
+def _check_23(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if len(instance) < 1:
+        return (), repr(instance) + ' should be non-empty'
+    return None
+
+
+def _check_19(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_8.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_8), key=str))
+    if 'veracity_score' not in instance:
+        return (), "'veracity_score' is a required property"
+    if 'hazard_flag' not in instance:
+        return (), "'hazard_flag' is a required property"
+    if 'veracity_score' in instance:
+        error = _check_20(instance['veracity_score'])
+        if error is not None:
+            return ('veracity_score',) + error[0], error[1]
+    if 'hazard_flag' in instance:
+        error = _check_21(instance['hazard_flag'])
+        if error is not None:
+            return ('hazard_flag',) + error[0], error[1]
+    if 'digital_signature' in instance:
+        error = _check_22(instance['digital_signature'])
+        if error is not None:
+            return ('digital_signature',) + error[0], error[1]
+    if 'signature_alg' in instance:
+        error = _check_23(instance['signature_alg'])
+        if error is not None:
+            return ('signature_alg',) + error[0], error[1]
+    return None
+
+
+def _check_24(instance):
+    if not isinstance(instance, list):
+        return (), repr(instance) + " is not of type 'array'"
+    if not _unique(instance):
+        return (), repr(instance) + ' has non-unique elements'
+    if len(instance) > 64:
+        return (), repr(instance) + ' is too long'
+    for index, item in enumerate(instance):
+        if not (type(item) is str and len(item) >= 1):
+            error = _check_7(item)
+            if error is not None:
+                return (index,) + error[0], error[1]
+    return None
+
+
+def _check_25(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_9.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_9), key=str))
+    if 'trace_id' in instance:
+        error = _check_7(instance['trace_id'])
+        if error is not None:
+            return ('trace_id',) + error[0], error[1]
+    if 'span_id' in instance:
+        error = _check_7(instance['span_id'])
+        if error is not None:
+            return ('span_id',) + error[0], error[1]
+    if 'parent_span_id' in instance:
+        error = _check_7(instance['parent_span_id'])
+        if error is not None:
+            return ('parent_span_id',) + error[0], error[1]
+    return None
+
+
+def _check_28(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if not _format_ok(instance, 'uri'):
+        return (), repr(instance) + " is not a 'uri'"
+    return None
+
+
+def _check_29(instance):
+    if not isinstance(instance, str):
+        return (), repr(instance) + " is not of type 'string'"
+    if _PATTERN_11.search(instance) is None:
+        return (), repr(instance) + " does not match '^[a-zA-Z0-9!#$&^_.+-]+/[a-zA-Z0-9!#$&^_.+-]+$'"
+    return None
+
+
+def _check_30(instance):
+    if not _is_integer(instance):
+        return (), repr(instance) + " is not of type 'integer'"
+    if instance < 0:
+        return (), repr(instance) + ' is less than the minimum of 0'
+    return None
+
+
+def _check_27(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_10.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_10), key=str))
+    if 'blob_url' not in instance:
+        return (), "'blob_url' is a required property"
+    if 'sha256_hash' not in instance:
+        return (), "'sha256_hash' is a required property"
+    if 'blob_url' in instance:
+        error = _check_28(instance['blob_url'])
+        if error is not None:
+            return ('blob_url',) + error[0], error[1]
+    if 'sha256_hash' in instance:
+        error = _check_13(instance['sha256_hash'])
+        if error is not None:
+            return ('sha256_hash',) + error[0], error[1]
+    if 'content_type' in instance:
+        error = _check_29(instance['content_type'])
+        if error is not None:
+            return ('content_type',) + error[0], error[1]
+    if 'size_bytes' in instance:
+        error = _check_30(instance['size_bytes'])
+        if error is not None:
+            return ('size_bytes',) + error[0], error[1]
+    return None
+
+
+def _check_26(instance):
+    if not isinstance(instance, list):
+        return (), repr(instance) + " is not of type 'array'"
+    for index, item in enumerate(instance):
+        error = _check_27(item)
+        if error is not None:
+            return (index,) + error[0], error[1]
+    return None
+
+
+def _valid_34(instance):
+    if instance != 'llm_agent':
+        return False
+    return True
+
+
+def _valid_33(instance):
+    if not isinstance(instance, dict):
+        return False
+    if 'kind' in instance:
+        if not _valid_34(instance['kind']):
+            return False
+    if 'kind' not in instance:
+        return False
+    return True
+
+
+def _valid_32(instance):
+    if isinstance(instance, dict):
+        if 'origin' in instance:
+            if not _valid_33(instance['origin']):
+                return False
+    if isinstance(instance, dict):
+        if 'origin' not in instance:
+            return False
+    return True
+
+
+def _check_35(instance):
+    if isinstance(instance, dict):
+        if 'agent_id' not in instance:
+            return (), "'agent_id' is a required property"
+        if 'action_intent' not in instance:
+            return (), "'action_intent' is a required property"
+    return None
+
+
+def _check_31(instance):
+    if _valid_32(instance):
+        error = _check_35(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def _valid_38(instance):
+    if instance != 'prod':
+        return False
+    return True
+
+
+def _valid_37(instance):
+    if isinstance(instance, dict):
+        if 'env' in instance:
+            if not _valid_38(instance['env']):
+                return False
+    if isinstance(instance, dict):
+        if 'env' not in instance:
+            return False
+    return True
+
+
+def _check_40(instance):
+    if isinstance(instance, dict):
+        if 'veracity_score' not in instance:
+            return (), "'veracity_score' is a required property"
+        if 'digital_signature' not in instance:
+            return (), "'digital_signature' is a required property"
+    return None
+
+
+def _check_39(instance):
+    if isinstance(instance, dict):
+        if 'safety' in instance:
+            error = _check_40(instance['safety'])
+            if error is not None:
+                return ('safety',) + error[0], error[1]
+    return None
+
+
+def _check_36(instance):
+    if _valid_37(instance):
+        error = _check_39(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def _valid_43(instance):
+    if not isinstance(instance, dict):
+        return False
+    if 'digital_signature' not in instance:
+        return False
+    return True
+
+
+def _valid_42(instance):
+    if isinstance(instance, dict):
+        if 'safety' in instance:
+            if not _valid_43(instance['safety']):
+                return False
+    if isinstance(instance, dict):
+        if 'safety' not in instance:
+            return False
+    return True
+
+
+def _check_45(instance):
+    if isinstance(instance, dict):
+        if 'signature_alg' not in instance:
+            return (), "'signature_alg' is a required property"
+    return None
+
+
+def _check_44(instance):
+    if isinstance(instance, dict):
+        if 'safety' in instance:
+            error = _check_45(instance['safety'])
+            if error is not None:
+                return ('safety',) + error[0], error[1]
+    return None
+
+
+def _check_41(instance):
+    if _valid_42(instance):
+        error = _check_44(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def _valid_48(instance):
+    if not isinstance(instance, dict):
+        return False
+    if 'signature_alg' not in instance:
+        return False
+    return True
+
+
+def _valid_47(instance):
+    if isinstance(instance, dict):
+        if 'safety' in instance:
+            if not _valid_48(instance['safety']):
+                return False
+    if isinstance(instance, dict):
+        if 'safety' not in instance:
+            return False
+    return True
+
+
+def _check_50(instance):
+    if isinstance(instance, dict):
+        if 'digital_signature' not in instance:
+            return (), "'digital_signature' is a required property"
+    return None
+
+
+def _check_49(instance):
+    if isinstance(instance, dict):
+        if 'safety' in instance:
+            error = _check_50(instance['safety'])
+            if error is not None:
+                return ('safety',) + error[0], error[1]
+    return None
+
+
+def _check_46(instance):
+    if _valid_47(instance):
+        error = _check_49(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def _valid_52(instance):
+    if isinstance(instance, dict):
+        if 'vector' not in instance:
+            return False
+    return True
+
+
+def _valid_55(instance):
+    if isinstance(instance, list):
+        if len(instance) < 1024:
+            return False
+    if isinstance(instance, list):
+        if len(instance) > 1024:
+            return False
+    return True
+
+
+def _valid_54(instance):
+    if isinstance(instance, dict):
+        if 'vector' in instance:
+            if not _valid_55(instance['vector']):
+                return False
+    return True
+
+
+def _valid_57(instance):
+    if isinstance(instance, list):
+        if len(instance) < 1536:
+            return False
+    if isinstance(instance, list):
+        if len(instance) > 1536:
+            return False
+    return True
+
+
+def _valid_56(instance):
+    if isinstance(instance, dict):
+        if 'vector' in instance:
+            if not _valid_57(instance['vector']):
+                return False
+    return True
+
+
+def _check_53(instance):
+    matched = next((position for position, check in enumerate(_CHECKS_12) if check(instance)), -1)
+    if matched < 0:
+        return (), repr(instance) + ' is not valid under any of the given schemas'
+    more = [position for position in range(matched + 1, 2) if _CHECKS_12[position](instance)]
+    if more:
+        return (), repr(instance) + " is valid under each of " + ", ".join(_REPRS_13[position] for position in more + [matched])
+    return None
+
+
+def _check_51(instance):
+    if _valid_52(instance):
+        error = _check_53(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def _valid_60(instance):
+    if not isinstance(instance, dict):
+        return False
+    if 'blob_url' not in instance:
+        return False
+    return True
+
+
+def _valid_59(instance):
+    if isinstance(instance, dict):
+        if 'payload' in instance:
+            if not _valid_60(instance['payload']):
+                return False
+    if isinstance(instance, dict):
+        if 'payload' not in instance:
+            return False
+    return True
+
+
+def _check_62(instance):
+    if isinstance(instance, dict):
+        if 'blob_url' not in instance:
+            return (), "'blob_url' is a required property"
+        if 'sha256_hash' not in instance:
+            return (), "'sha256_hash' is a required property"
+    return None
+
+
+def _check_61(instance):
+    if isinstance(instance, dict):
+        if 'payload' in instance:
+            error = _check_62(instance['payload'])
+            if error is not None:
+                return ('payload',) + error[0], error[1]
+    return None
+
+
+def _check_58(instance):
+    if _valid_59(instance):
+        error = _check_61(instance)
+        if error is not None:
+            return error
+    return None
+
+
+def first_error(instance):
+    if not isinstance(instance, dict):
+        return (), repr(instance) + " is not of type 'object'"
+    if not _PROPERTIES_0.issuperset(instance):
+        return (), _extras_message(sorted((key for key in instance if key not in _PROPERTIES_0), key=str))
+    if '@context' not in instance:
+        return (), "'@context' is a required property"
+    if '@type' not in instance:
+        return (), "'@type' is a required property"
+    if 'tsr_id' not in instance:
+        return (), "'tsr_id' is a required property"
+    if 'tsr_timestamp_ns' not in instance:
+        return (), "'tsr_timestamp_ns' is a required property"
+    if 'env' not in instance:
+        return (), "'env' is a required property"
+    if 'origin' not in instance:
+        return (), "'origin' is a required property"
+    if 'payload' not in instance:
+        return (), "'payload' is a required property"
+    if 'safety' not in instance:
+        return (), "'safety' is a required property"
+    if '@context' in instance:
+        error = _check_1(instance['@context'])
+        if error is not None:
+            return ('@context',) + error[0], error[1]
+    if '@type' in instance:
+        error = _check_2(instance['@type'])
+        if error is not None:
+            return ('@type',) + error[0], error[1]
+    if 'schema_version' in instance:
+        error = _check_3(instance['schema_version'])
+        if error is not None:
+            return ('schema_version',) + error[0], error[1]
+    if 'tsr_id' in instance:
+        error = _check_4(instance['tsr_id'])
+        if error is not None:
+            return ('tsr_id',) + error[0], error[1]
+    if 'tsr_timestamp_ns' in instance:
+        error = _check_5(instance['tsr_timestamp_ns'])
+        if error is not None:
+            return ('tsr_timestamp_ns',) + error[0], error[1]
+    if 'env' in instance:
+        error = _check_6(instance['env'])
+        if error is not None:
+            return ('env',) + error[0], error[1]
+    if 'agent_id' in instance:
+        error = _check_7(instance['agent_id'])
+        if error is not None:
+            return ('agent_id',) + error[0], error[1]
+    if 'action_intent' in instance:
+        error = _check_8(instance['action_intent'])
+        if error is not None:
+            return ('action_intent',) + error[0], error[1]
+    if 'origin' in instance:
+        error = _check_9(instance['origin'])
+        if error is not None:
+            return ('origin',) + error[0], error[1]
+    if 'payload' in instance:
+        error = _check_11(instance['payload'])
+        if error is not None:
+            return ('payload',) + error[0], error[1]
+    if 'vector' in instance:
+        error = _check_17(instance['vector'])
+        if error is not None:
+            return ('vector',) + error[0], error[1]
+    if 'safety' in instance:
+        error = _check_19(instance['safety'])
+        if error is not None:
+            return ('safety',) + error[0], error[1]
+    if 'tags' in instance:
+        error = _check_24(instance['tags'])
+        if error is not None:
+            return ('tags',) + error[0], error[1]
+    if 'trace' in instance:
+        error = _check_25(instance['trace'])
+        if error is not None:
+            return ('trace',) + error[0], error[1]
+    if 'resources' in instance:
+        error = _check_26(instance['resources'])
+        if error is not None:
+            return ('resources',) + error[0], error[1]
+    error = _check_31(instance)
+    if error is not None:
+        return error
+    error = _check_36(instance)
+    if error is not None:
+        return error
+    error = _check_41(instance)
+    if error is not None:
+        return error
+    error = _check_46(instance)
+    if error is not None:
+        return error
+    error = _check_51(instance)
+    if error is not None:
+        return error
+    error = _check_58(instance)
+    if error is not None:
+        return error
+    return None
+
+
+_CHECKS_12 = (_valid_54, _valid_56,)
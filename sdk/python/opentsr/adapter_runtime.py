@@ -0,0 +1,469 @@
+"""Execution engine for Adapter Hub adapters.
+
+Adapters listed in ``adapters/registry.json`` declare how vendor records map onto a signal in
+the ``mapping`` block of their manifest. Each mapping is compiled once into a Python function
+that builds the signal's JSON form with plain dictionary lookups, and mapped batches go
+straight to :func:`opentsr.reference_ingest.ingest_batch`.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union, cast
+
+from .cold_store import ColdStore, DirectoryColdStore
+from .models import SchemaEngine, _default_timestamp_ns, _generate_uuid7
+from .reference_ingest import DEFAULT_STREAM_BATCH_SIZE, IngestResult, ValidationMode, _rejected, ingest_batch
+from .signing import SigningKey
+
+if TYPE_CHECKING:
+    from .blob_verify import BlobVerifier
+    from .dedupe import DedupeIndex
+    from .metadata_index import MetadataIndex
+    from .metrics import IngestMetrics
+    from .vector_index import VectorIndex
+
+JsonObject = Dict[str, object]
+InputFormat = Literal["json", "ndjson", "csv"]
+MappingFunction = Callable[[JsonObject], JsonObject]
+
+INPUT_FORMATS: Tuple[str, ...] = ("json", "ndjson", "csv")
+FIELD_TRANSFORMS: Tuple[str, ...] = ("str", "int", "float", "bool", "timestamp_ns")
+SIGNAL_DEFAULTS: Dict[str, str] = {
+    "@context": "'https://opentsr.org/context/v1'",
+    "@type": "'OpenTSRSignal'",
+    "schema_version": "'1.0.0-draft'",
+    "tsr_id": "_generate_uuid7()",
+    "tsr_timestamp_ns": "_default_timestamp_ns()",
+}
+
+_EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_TRUE_STRINGS: Tuple[str, ...] = ("true", "1", "yes", "on")
+_FALSE_STRINGS: Tuple[str, ...] = ("false", "0", "no", "off")
+# Marks a missing source field whose mapping has ``"default": null``; the target is left out.
+_OMIT: object = object()
+
+
+def _default_registry_path() -> Path:
+    return Path(__file__).resolve().parents[3] / "adapters" / "registry.json"
+
+
+def _to_str(value: object) -> str:
+    if isinstance(value, (dict, list)) or value is None:
+        raise ValueError(f"cannot convert {type(value).__name__} to str")
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _to_int(value: object) -> int:
+    if isinstance(value, bool):
+        raise ValueError("cannot convert bool to int")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise ValueError(f"cannot convert {value!r} to int")
+
+
+def _to_float(value: object) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"cannot convert {value!r} to float")
+    converted: float = float(value)
+    if not math.isfinite(converted):
+        raise ValueError(f"cannot convert non-finite {value!r} to float")
+    return converted
+
+
+def _to_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _TRUE_STRINGS + _FALSE_STRINGS:
+        return value.strip().lower() in _TRUE_STRINGS
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"cannot convert {value!r} to bool")
+
+
+def _to_timestamp_ns(value: object) -> int:
+    """RFC 3339 strings with a UTC offset, or numbers of Unix seconds."""
+    if isinstance(value, bool):
+        raise ValueError("cannot convert bool to timestamp")
+    if isinstance(value, int):
+        return value * 1_000_000_000
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"cannot convert non-finite {value!r} to timestamp")
+        return round(value * 1_000_000_000)
+    if isinstance(value, str):
+        moment: datetime = datetime.fromisoformat(value.strip())
+        if moment.tzinfo is None:
+            raise ValueError(f"timestamp has no UTC offset: {value}")
+        elapsed: timedelta = moment - _EPOCH
+        return (elapsed.days * 86_400 + elapsed.seconds) * 1_000_000_000 + elapsed.microseconds * 1_000
+    raise ValueError(f"cannot convert {value!r} to timestamp")
+
+
+def _replace_prefix(value: object, old: str, new: str) -> str:
+    if not isinstance(value, str) or not value.startswith(old):
+        raise ValueError(f"{value!r} does not start with {old!r}")
+    return new + value[len(old) :]
+
+
+_RUNTIME_NAMESPACE: Dict[str, object] = {
+    "_OMIT": _OMIT,
+    "_to_str": _to_str,
+    "_to_int": _to_int,
+    "_to_float": _to_float,
+    "_to_bool": _to_bool,
+    "_to_timestamp_ns": _to_timestamp_ns,
+    "_replace_prefix": _replace_prefix,
+    "_generate_uuid7": _generate_uuid7,
+    "_default_timestamp_ns": _default_timestamp_ns,
+}
+
+
+class _MappingCompiler:
+    """Renders a manifest ``mapping`` as the source of one ``_map(record)`` function."""
+
+    def __init__(self, adapter_id: str) -> None:
+        self.adapter_id: str = adapter_id
+        self.lines: List[str] = []
+        self.omittable: List[Tuple[str, Tuple[str, ...]]] = []
+        self._variables: int = 0
+
+    def _variable(self) -> str:
+        self._variables += 1
+        return f"_v{self._variables}"
+
+    def value(self, target: str, field: JsonObject) -> Tuple[str, bool]:
+        """Expression for one mapped value, and whether it can be ``_OMIT``."""
+        if "const" in field:
+            return repr(field["const"]), False
+        if "items" in field:
+            items: List[Tuple[str, bool]] = [
+                self.value(f"{target}[{index}]", cast(JsonObject, item)) for index, item in enumerate(cast(List[object], field["items"]))
+            ]
+            expressions: str = ", ".join(expression for expression, _ in items)
+            if any(omittable for _, omittable in items):
+                return f"[_item for _item in ({expressions},) if _item is not _OMIT]", False
+            return f"[{expressions}]", False
+
+        source: str = cast(str, field["source"])
+        variable: str = self._variable()
+        lookup: str = "record" + "".join(f"[{key!r}]" for key in source.split("."))
+        converted: str = variable
+        transform: Optional[str] = cast(Optional[str], field.get("transform"))
+        if transform is not None:
+            if transform not in FIELD_TRANSFORMS:
+                supported: str = ", ".join(FIELD_TRANSFORMS)
+                raise ValueError(f"{self.adapter_id}: unsupported transform: {transform}. Supported: {supported}")
+            converted = f"_to_{transform}({converted})"
+        if "replace_prefix" in field:
+            old, new = cast(List[str], field["replace_prefix"])
+            converted = f"_replace_prefix({converted}, {old!r}, {new!r})"
+
+        self.lines += ["    try:", f"        {variable} = {lookup}", "    except (KeyError, TypeError):"]
+        omittable: bool = "default" in field and field["default"] is None
+        if omittable:
+            self.lines.append(f"        {variable} = _OMIT")
+        elif "default" in field:
+            self.lines.append(f"        {variable} = {field['default']!r}")
+        else:
+            self.lines.append(f"        raise ValueError({f'{target}: missing source field {source}'!r}) from None")
+        if converted != variable:
+            self.lines += [
+                "    else:",
+                "        try:",
+                f"            {variable} = {converted}",
+                "        except ValueError as exc:",
+                f"            raise ValueError({f'{target}: '!r} + str(exc)) from None",
+            ]
+        return variable, omittable
+
+    def render(self, fields: JsonObject) -> str:
+        tree: JsonObject = {}
+        for target, field in fields.items():
+            path: Tuple[str, ...] = tuple(target.split("."))
+            node: JsonObject = tree
+            for key in path[:-1]:
+                child: object = node.setdefault(key, {})
+                if not isinstance(child, dict):
+                    raise ValueError(f"{self.adapter_id}: mapping target {target} is nested under a mapped value")
+                node = cast(JsonObject, child)
+            if path[-1] in node:
+                raise ValueError(f"{self.adapter_id}: mapping target {target} overlaps another target")
+            expression, omittable = self.value(target, cast(JsonObject, field))
+            node[path[-1]] = expression
+            if omittable:
+                self.omittable.append((expression, path))
+        for key in reversed(SIGNAL_DEFAULTS):
+            if key not in tree:
+                tree = {key: SIGNAL_DEFAULTS[key], **tree}
+
+        lines: List[str] = ["def _map(record):", *self.lines, f"    signal = {_render_tree(tree)}"]
+        for variable, path in self.omittable:
+            parent: str = "signal" + "".join(f"[{key!r}]" for key in path[:-1])
+            lines += [f"    if {variable} is _OMIT:", f"        del {parent}[{path[-1]!r}]"]
+        lines.append("    return signal")
+        return "\n".join(lines) + "\n"
+
+
+def _render_tree(tree: JsonObject) -> str:
+    entries: List[str] = [
+        f"{key!r}: {_render_tree(cast(JsonObject, value)) if isinstance(value, dict) else value}" for key, value in tree.items()
+    ]
+    return "{" + ", ".join(entries) + "}"
+
+
+def compile_mapping(adapter_id: str, mapping: JsonObject) -> MappingFunction:
+    """Compile a manifest ``mapping`` block into a function from a vendor record to signal JSON.
+
+    Targets are dotted paths into the signal; ``@context``, ``@type``, ``schema_version``,
+    ``tsr_id`` and ``tsr_timestamp_ns`` get the SDK defaults when not mapped. The function
+    raises ``ValueError`` naming the target when a required source field is missing or a
+    transform fails. Its output is not validated; ingest does that.
+    """
+    source: str = _MappingCompiler(adapter_id).render(cast(JsonObject, mapping["fields"]))
+    namespace: Dict[str, object] = dict(_RUNTIME_NAMESPACE)
+    exec(compile(source, f"<adapter mapping {adapter_id}>", "exec"), namespace)
+    return cast(MappingFunction, namespace["_map"])
+
+
+def _nest(row: Dict[str, str]) -> JsonObject:
+    # Dotted CSV headers nest, so a mapping written for JSON exports also reads CSV exports.
+    record: JsonObject = {}
+    for column, value in row.items():
+        if column is None or value is None or value == "":
+            continue
+        keys: List[str] = column.split(".")
+        node: JsonObject = record
+        for key in keys[:-1]:
+            node = cast(JsonObject, node.setdefault(key, {}))
+        node[keys[-1]] = value
+    return record
+
+
+def read_records(source: Union[Path, IO[str]], input_format: InputFormat) -> Iterator[JsonObject]:
+    """Vendor records from a file export or a line-oriented stream such as a serial console.
+
+    ``json`` reads one object or an array of objects, ``ndjson`` one object per line, and
+    ``csv`` a header row followed by records; empty CSV cells are treated as missing fields.
+    """
+    if input_format not in INPUT_FORMATS:
+        supported: str = ", ".join(INPUT_FORMATS)
+        raise ValueError(f"unsupported input_format: {input_format}. Supported: {supported}")
+    if isinstance(source, Path):
+        with source.open("r", encoding="utf-8", newline="") as readable:
+            yield from read_records(readable, input_format)
+        return
+    if input_format == "csv":
+        for row in csv.DictReader(source):
+            yield _nest(row)
+        return
+    if input_format == "json":
+        document: object = json.load(source)
+        records: List[object] = document if isinstance(document, list) else [document]
+        for record in records:
+            if not isinstance(record, dict):
+                raise ValueError("JSON export must hold an object or an array of objects")
+            yield cast(JsonObject, record)
+        return
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {line_number}: invalid JSON: {exc}") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"line {line_number}: record must be an object")
+        yield cast(JsonObject, record)
+
+
+@dataclass
+class AdapterStats:
+    """Running totals for one adapter; ``rejected`` counts mapped signals that failed validation."""
+
+    records: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    mapping_errors: int = 0
+    rejected: int = 0
+    mapping_seconds: float = 0.0
+    ingest_seconds: float = 0.0
+
+    @property
+    def records_per_sec(self) -> float:
+        elapsed: float = self.mapping_seconds + self.ingest_seconds
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        return {
+            "records": self.records,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "mapping_errors": self.mapping_errors,
+            "rejected": self.rejected,
+            "records_per_sec": round(self.records_per_sec, 1),
+        }
+
+
+@dataclass(frozen=True)
+class Adapter:
+    adapter_id: str
+    manifest: JsonObject
+    map_record: Optional[MappingFunction]
+
+    @property
+    def input_interfaces(self) -> Tuple[str, ...]:
+        return tuple(cast(List[str], self.manifest["input_interfaces"]))
+
+
+class AdapterRuntime:
+    """Maps batches of vendor records through registered adapters into batch ingest."""
+
+    def __init__(self, adapters: Iterable[Adapter]) -> None:
+        self.adapters: Dict[str, Adapter] = {adapter.adapter_id: adapter for adapter in adapters}
+        self.stats: Dict[str, AdapterStats] = {adapter_id: AdapterStats() for adapter_id in self.adapters}
+
+    @classmethod
+    def from_registry(cls, registry_path: Optional[Path] = None) -> "AdapterRuntime":
+        """Load and compile every adapter in the registry.
+
+        Manifests are validated against ``manifest.schema.json`` next to the registry, and
+        manifest paths resolve from the directory that contains ``adapters/``. Adapters
+        without a ``mapping`` are listed but cannot map records.
+        """
+        from jsonschema import Draft202012Validator
+
+        path: Path = registry_path if registry_path is not None else _default_registry_path()
+        registry: JsonObject = json.loads(path.read_text(encoding="utf-8"))
+        manifest_schema: JsonObject = json.loads((path.parent / "manifest.schema.json").read_text(encoding="utf-8"))
+        validator = Draft202012Validator(manifest_schema)
+        adapters: List[Adapter] = []
+        for entry in cast(List[JsonObject], registry["adapters"]):
+            manifest_path: Path = path.parent.parent / cast(str, entry["manifest_path"])
+            manifest: JsonObject = json.loads(manifest_path.read_text(encoding="utf-8"))
+            error = next(iter(validator.iter_errors(manifest)), None)
+            if error is not None:
+                error_path: str = ".".join(str(part) for part in error.absolute_path) or "<root>"
+                raise ValueError(f"invalid adapter manifest {manifest_path} at {error_path}: {error.message}")
+            adapter_id: str = cast(str, manifest["adapter_id"])
+            if adapter_id != entry["adapter_id"]:
+                raise ValueError(f"registry entry {entry['adapter_id']} points to the manifest of {adapter_id}")
+            mapping: Optional[JsonObject] = cast(Optional[JsonObject], manifest.get("mapping"))
+            adapters.append(Adapter(adapter_id, manifest, compile_mapping(adapter_id, mapping) if mapping is not None else None))
+        return cls(adapters)
+
+    def __contains__(self, adapter_id: object) -> bool:
+        return adapter_id in self.adapters
+
+    def _adapter(self, adapter_id: str) -> Adapter:
+        adapter: Optional[Adapter] = self.adapters.get(adapter_id)
+        if adapter is None:
+            raise ValueError(f"unknown adapter: {adapter_id}")
+        if adapter.map_record is None:
+            raise ValueError(f"adapter {adapter_id} has no declarative mapping")
+        return adapter
+
+    def map_record(self, adapter_id: str, record: JsonObject) -> JsonObject:
+        """The signal JSON for one vendor record; raises ``ValueError`` when mapping fails."""
+        return cast(MappingFunction, self._adapter(adapter_id).map_record)(record)
+
+    def ingest(
+        self,
+        adapter_id: str,
+        records: Iterable[JsonObject],
+        cold_store_dir: Path,
+        hot_index_path: Optional[Path] = None,
+        schema_path: Optional[Path] = None,
+        verify_signatures: bool = False,
+        signature_key: Optional[SigningKey] = None,
+        validation_mode: ValidationMode = "both",
+        cold_store: Optional[ColdStore] = None,
+        vector_index: Optional[VectorIndex] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        schema_engine: SchemaEngine = "jsonschema",
+        metrics: Optional[IngestMetrics] = None,
+        blob_verifier: Optional[BlobVerifier] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[Tuple[int, IngestResult]]:
+        """Map vendor records in batches of ``batch_size`` and ingest each batch with :func:`ingest_batch`.
+
+        Yields ``(record_number, result)`` pairs in input order, counting from 1. Records that
+        fail to map get a 400 ``adapter mapping failed`` result and are not ingested. Counts
+        and timings accumulate in ``stats[adapter_id]``.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        map_record: MappingFunction = cast(MappingFunction, self._adapter(adapter_id).map_record)
+        stats: AdapterStats = self.stats[adapter_id]
+        target_cold_store: ColdStore = cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir)
+        iterator: Iterator[JsonObject] = iter(records)
+        record_number: int = 0
+        exhausted: bool = False
+        while not exhausted:
+            started: float = time.perf_counter()
+            batch_results: List[Optional[IngestResult]] = []
+            signals: List[JsonObject] = []
+            for record in iterator:
+                try:
+                    signals.append(map_record(record))
+                    batch_results.append(None)
+                except (ValueError, OverflowError) as exc:
+                    failed: IngestResult = _rejected(f"adapter mapping failed: {exc}")
+                    batch_results.append(failed)
+                    stats.mapping_errors += 1
+                    if metrics is not None:
+                        metrics.record(failed)
+                if len(batch_results) >= batch_size:
+                    break
+            else:
+                exhausted = True
+            mapped: float = time.perf_counter()
+            accepted: Iterator[IngestResult] = iter(
+                ingest_batch(
+                    payloads=signals,
+                    cold_store_dir=cold_store_dir,
+                    hot_index_path=hot_index_path,
+                    schema_path=schema_path,
+                    verify_signatures=verify_signatures,
+                    signature_key=signature_key,
+                    validation_mode=validation_mode,
+                    cold_store=target_cold_store,
+                    vector_index=vector_index,
+                    dedupe_index=dedupe_index,
+                    metadata_index=metadata_index,
+                    schema_engine=schema_engine,
+                    metrics=metrics,
+                    blob_verifier=blob_verifier,
+                )
+                if signals
+                else ()
+            )
+            stats.mapping_seconds += mapped - started
+            stats.ingest_seconds += time.perf_counter() - mapped
+            stats.records += len(batch_results)
+            for result in batch_results:
+                record_number += 1
+                if result is None:
+                    result = next(accepted)
+                    if result.status_code == 202:
+                        stats.accepted += 1
+                    elif result.status_code == 200:
+                        stats.duplicates += 1
+                    else:
+                        stats.rejected += 1
+                yield record_number, result
+
+    def report(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Per-adapter counts and records/sec, for adapters that have seen records."""
+        return {adapter_id: stats.as_dict() for adapter_id, stats in self.stats.items() if stats.records}
@@ -0,0 +1,300 @@
+"""Content-hash verification of externalized blobs (``payload.blob_url`` and ``resources``).
+
+The schema only checks that ``sha256_hash`` is 64 hex characters. :class:`BlobVerifier`
+resolves each reference to a local file, hashes it with chunked memory-mapped reads on a
+thread pool (``hashlib`` releases the GIL while hashing), and reports a :class:`BlobFinding`
+for every blob that is missing or does not match its digest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from stat import S_ISREG
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple, cast
+from urllib.parse import unquote, urlsplit
+
+JsonObject = Dict[str, object]
+BlobVerificationMode = Literal["reject", "audit"]
+FindingKind = Literal["mismatch", "size_mismatch", "missing", "unreadable", "unresolved"]
+
+BLOB_VERIFICATION_MODES: Tuple[str, ...] = ("reject", "audit")
+DEFAULT_CHUNK_BYTES: int = 8 * 1024 * 1024
+DEFAULT_CACHE_ENTRIES: int = 65_536
+# (resolved path, st_mtime_ns, st_size): a rewritten file gets a new key and is hashed again.
+_CacheKey = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """One externalized blob: ``location`` is ``payload`` or ``resources[i]``."""
+
+    location: str
+    blob_url: str
+    sha256_hash: str
+    size_bytes: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BlobFinding:
+    tsr_id: str
+    location: str
+    blob_url: str
+    kind: FindingKind
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        """Client-facing text: the ``actual`` digest or size stays out so it cannot probe server files."""
+        detail: str = f" (expected {self.expected})" if self.expected is not None else ""
+        return f"blob {self.kind} for {self.location}: {self.blob_url}{detail}"
+
+
+def blob_refs(instance: JsonObject) -> Tuple[BlobRef, ...]:
+    """The blob references a signal dict carries, in document order."""
+    refs: List[BlobRef] = []
+    payload: object = instance.get("payload")
+    if isinstance(payload, dict) and isinstance(payload.get("blob_url"), str) and isinstance(payload.get("sha256_hash"), str):
+        refs.append(BlobRef("payload", payload["blob_url"], payload["sha256_hash"]))
+    resources: object = instance.get("resources")
+    if isinstance(resources, list):
+        for position, resource in enumerate(resources):
+            if isinstance(resource, dict):
+                size_bytes: object = resource.get("size_bytes")
+                refs.append(
+                    BlobRef(
+                        f"resources[{position}]",
+                        cast(str, resource["blob_url"]),
+                        cast(str, resource["sha256_hash"]),
+                        size_bytes if isinstance(size_bytes, int) else None,
+                    )
+                )
+    return tuple(refs)
+
+
+def sha256_file(path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> str:
+    """Hex SHA-256 of a file, fed to ``hashlib`` in ``chunk_bytes`` slices of a read-only mmap."""
+    digest = hashlib.sha256()
+    with path.open("rb") as blob_file:
+        size: int = os.fstat(blob_file.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, size, chunk_bytes):
+                    digest.update(view[start : start + chunk_bytes])
+            finally:
+                view.release()
+    return digest.hexdigest()
+
+
+def _is_within(real_path: str, real_root: str) -> bool:
+    return os.path.commonpath([real_path, real_root]) == real_root
+
+
+def _confined(root: Path, relative: Path) -> Optional[Path]:
+    """``root / relative`` if it stays inside ``root`` after resolving symlinks."""
+    if relative.is_absolute() or ".." in relative.parts:
+        return None
+    path: Path = root / relative
+    return path if _is_within(os.path.realpath(path), os.path.realpath(root)) else None
+
+
+class BlobVerifier:
+    """Resolve blob references to local files and check them against their SHA-256 digests.
+
+    Relative paths resolve against ``base_dir``; other URLs resolve when they start with a key
+    of ``url_prefixes``, whose remainder is joined onto the mapped directory, e.g.
+    ``{"s3://evidence/": Path("/mnt/evidence")}``. Absolute paths and ``file://`` URLs resolve
+    only inside ``base_dir`` or a mapped directory, unless ``allow_local_paths`` is set.
+    References containing ``..`` or escaping their directory through a symlink never resolve,
+    and anything but a regular file is ``unreadable``. Unresolvable URLs are skipped unless
+    ``require_resolvable`` is set.
+
+    Digests are cached by ``(path, mtime_ns, size)``, and concurrent checks of the same file
+    share one hash. In ``reject`` mode the ingest entry points turn findings into 400 results;
+    in ``audit`` mode signals are accepted and findings arrive later on ``findings`` and
+    ``on_finding`` (called from pool threads).
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        url_prefixes: Optional[Mapping[str, Path]] = None,
+        mode: BlobVerificationMode = "reject",
+        workers: int = 4,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        require_resolvable: bool = False,
+        on_finding: Optional[Callable[[BlobFinding], None]] = None,
+        allow_local_paths: bool = False,
+    ) -> None:
+        if mode not in BLOB_VERIFICATION_MODES:
+            raise ValueError(f"unsupported blob verification mode: {mode}. Supported: {', '.join(BLOB_VERIFICATION_MODES)}")
+        if workers < 1 or chunk_bytes < 1:
+            raise ValueError("workers and chunk_bytes must be >= 1")
+        self.base_dir: Optional[Path] = base_dir
+        # Longest prefix first so nested mappings win.
+        self.url_prefixes: List[Tuple[str, Path]] = sorted((url_prefixes or {}).items(), key=lambda item: -len(item[0]))
+        self.mode: BlobVerificationMode = mode
+        self.workers: int = workers
+        self.chunk_bytes: int = chunk_bytes
+        self.cache_entries: int = cache_entries
+        self.require_resolvable: bool = require_resolvable
+        self.allow_local_paths: bool = allow_local_paths
+        roots: List[Path] = [directory for _, directory in self.url_prefixes]
+        if base_dir is not None:
+            roots.append(base_dir)
+        self._real_roots: List[str] = [os.path.realpath(root) for root in roots]
+        self.on_finding: Optional[Callable[[BlobFinding], None]] = on_finding
+        self.findings: List[BlobFinding] = []
+        self.hashed_bytes: int = 0
+        self.cache_hits: int = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="opentsr-blob")
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[_CacheKey, Future[str]]" = OrderedDict()
+
+    def __enter__(self) -> "BlobVerifier":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for outstanding checks, including audits, and stop the pool."""
+        self._executor.shutdown(wait=True)
+
+    def resolve(self, blob_url: str) -> Optional[Path]:
+        """The local file behind ``blob_url``, or None when it is not one this verifier may read."""
+        for prefix, directory in self.url_prefixes:
+            if blob_url.startswith(prefix):
+                return _confined(directory, Path(unquote(blob_url[len(prefix) :]).lstrip("/")))
+        parts = urlsplit(blob_url)
+        path: Path
+        if parts.scheme == "file":
+            path = Path(unquote(parts.path))
+        elif parts.scheme and len(parts.scheme) > 1:
+            # A one-letter scheme is a Windows drive, not a URL.
+            return None
+        else:
+            path = Path(blob_url)
+        if ".." in path.parts:
+            return None
+        if not path.is_absolute():
+            if self.base_dir is not None:
+                return _confined(self.base_dir, path)
+            return path if self.allow_local_paths else None
+        if self.allow_local_paths:
+            return path
+        real: str = os.path.realpath(path)
+        return path if any(_is_within(real, root) for root in self._real_roots) else None
+
+    def _digest(self, path: Path, stat: os.stat_result) -> str:
+        key: _CacheKey = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached: Optional[Future[str]] = self._digests.get(key)
+            if cached is not None:
+                self._digests.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                pending: Future[str] = Future()
+                self._digests[key] = pending
+                if len(self._digests) > self.cache_entries:
+                    self._digests.popitem(last=False)
+        if cached is not None:
+            # Either a finished digest or another thread hashing the same file right now.
+            return cached.result()
+        try:
+            digest: str = sha256_file(path, self.chunk_bytes)
+        except BaseException as exc:
+            with self._lock:
+                self._digests.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self.hashed_bytes += stat.st_size
+        pending.set_result(digest)
+        return digest
+
+    def check(self, tsr_id: str, ref: BlobRef) -> Optional[BlobFinding]:
+        """Verify one reference in the calling thread."""
+        path: Optional[Path] = self.resolve(ref.blob_url)
+        if path is None:
+            return BlobFinding(tsr_id, ref.location, ref.blob_url, "unresolved") if self.require_resolvable else None
+        try:
+            stat: os.stat_result = path.stat()
+            if not S_ISREG(stat.st_mode):
+                return BlobFinding(tsr_id, ref.location, ref.blob_url, "unreadable")
+            if ref.size_bytes is not None and ref.size_bytes != stat.st_size:
+                return BlobFinding(tsr_id, ref.location, ref.blob_url, "size_mismatch", str(ref.size_bytes), str(stat.st_size))
+            digest: str = self._digest(path, stat)
+        except (FileNotFoundError, NotADirectoryError):
+            return BlobFinding(tsr_id, ref.location, ref.blob_url, "missing")
+        except OSError:
+            # Permissions, over-long names, I/O errors: a finding for this signal, not a failed batch.
+            return BlobFinding(tsr_id, ref.location, ref.blob_url, "unreadable")
+        if digest != ref.sha256_hash.lower():
+            return BlobFinding(tsr_id, ref.location, ref.blob_url, "mismatch", ref.sha256_hash.lower(), digest)
+        return None
+
+    def submit(self, tsr_id: str, refs: Iterable[BlobRef]) -> "Future[List[BlobFinding]]":
+        """Check every reference on the pool; the future holds the findings in reference order."""
+        checks: List[Future[Optional[BlobFinding]]] = [self._executor.submit(self.check, tsr_id, ref) for ref in refs]
+        combined: Future[List[BlobFinding]] = Future()
+        remaining: List[int] = [len(checks)]
+
+        def collect(_: object) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                combined.set_result([finding for check in checks if (finding := check.result()) is not None])
+            except BaseException as exc:
+                combined.set_exception(exc)
+
+        if not checks:
+            combined.set_result([])
+        for check in checks:
+            check.add_done_callback(collect)
+        return combined
+
+    def submit_audit(self, tsr_id: str, refs: Iterable[BlobRef]) -> "Future[List[BlobFinding]]":
+        """Like :meth:`submit`, but findings are also appended to ``findings`` and passed to ``on_finding``."""
+        verification: Future[List[BlobFinding]] = self.submit(tsr_id, refs)
+        verification.add_done_callback(self._report)
+        return verification
+
+    def _report(self, verification: "Future[List[BlobFinding]]") -> None:
+        if verification.exception() is not None:
+            return
+        for finding in verification.result():
+            with self._lock:
+                self.findings.append(finding)
+            if self.on_finding is not None:
+                self.on_finding(finding)
+
+    def verify(self, instance: JsonObject) -> List[BlobFinding]:
+        """Check one signal dict's blobs, hashing them in parallel."""
+        return self.submit(cast(str, instance.get("tsr_id", "")), blob_refs(instance)).result()
+
+    def audit(self, instances: Iterable[JsonObject]) -> Iterator[BlobFinding]:
+        """Findings for already-stored signals, e.g. read back from a cold store.
+
+        Up to ``2 * workers`` signals are checked at once; findings come out in input order.
+        """
+        window: Deque[Future[List[BlobFinding]]] = deque()
+        for instance in instances:
+            window.append(self.submit(cast(str, instance.get("tsr_id", "")), blob_refs(instance)))
+            if len(window) >= 2 * self.workers:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
@@ -0,0 +1,479 @@
+"""Generate the precompiled schema modules bundled with the SDK.
+
+Usage: python -m opentsr.codegen [--schema spec/schema.json] [--output opentsr/_schema.py]
+       [--validator-output opentsr/_compiled_schema.py]
+
+``_schema.py`` holds the schema as a Python literal. ``_compiled_schema.py`` holds the schema
+compiled to plain Python checks that stop at the first error (see :mod:`opentsr.compiled_schema`).
+Re-run after every change to ``spec/schema.json``; ``tests/test_schema_artifact.py`` and
+``tests/test_compiled_schema.py`` fail while the generated modules are out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pprint
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union, cast
+
+JsonObject = Dict[str, object]
+
+PACKAGE_DIR: Path = Path(__file__).resolve().parent
+SCHEMA_MODULE_PATH: Path = PACKAGE_DIR / "_schema.py"
+VALIDATOR_MODULE_PATH: Path = PACKAGE_DIR / "_compiled_schema.py"
+
+Schema = Union[bool, JsonObject]
+
+_ANNOTATION_KEYWORDS: Tuple[str, ...] = (
+    "$schema",
+    "$id",
+    "$defs",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "then",
+    "else",
+)
+_TYPE_CHECKS: Dict[str, str] = {
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    "integer": "_is_integer({0})",
+    "number": "_is_number({0})",
+}
+_FAST_TYPE_CHECKS: Dict[str, str] = {
+    "number": "(type({0}) is float or type({0}) is int)",
+    "integer": "type({0}) is int",
+    "string": "type({0}) is str",
+}
+_BULK_TYPES: Dict[str, str] = {"number": "frozenset((float, int))", "integer": "frozenset((int,))"}
+
+
+def _default_schema_source() -> Path:
+    return PACKAGE_DIR.parents[2] / "spec" / "schema.json"
+
+
+def schema_digest(schema_bytes: bytes) -> str:
+    return hashlib.sha256(schema_bytes).hexdigest()
+
+
+def render_schema_module(schema_bytes: bytes) -> str:
+    """Python source that defines ``SCHEMA`` as a literal, so loading it needs no JSON parse or file read."""
+    schema: JsonObject = cast(JsonObject, json.loads(schema_bytes))
+    return (
+        '"""Precompiled copy of spec/schema.json. Generated by ``python -m opentsr.codegen``; do not edit."""\n'
+        "\n"
+        f'SCHEMA_SHA256 = "{schema_digest(schema_bytes)}"\n'
+        "\n"
+        f"SCHEMA = {pprint.pformat(schema, indent=1, width=100, sort_dicts=False)}\n"
+    )
+
+
+def _indent(lines: List[str]) -> List[str]:
+    return ["    " + line for line in lines]
+
+
+def _satisfies(known_type: Optional[str], type_name: str) -> bool:
+    return known_type == type_name or (known_type == "integer" and type_name == "number")
+
+
+class _ValidatorCompiler:
+    """Compile one schema document into check functions, one per distinct subschema.
+
+    Keywords are emitted in schema order, the order jsonschema evaluates them in, and each
+    check returns at its first error, so the result is the first error ``iter_errors`` yields.
+    Subschemas that are only tested for validity (``if``, ``oneOf``, ``anyOf``, ``not``) also get
+    a boolean variant that never builds error messages.
+    """
+
+    def __init__(self, root: JsonObject) -> None:
+        self.root: JsonObject = root
+        self.functions: List[List[str]] = []
+        self.constants: List[str] = []
+        self.tables: List[str] = []
+        self.helpers: Set[str] = set()
+        self._names: Dict[Tuple[int, bool], str] = {}
+        self._boolean: bool = False
+
+    def compile(self, preamble: str) -> str:
+        """Module source: imports, then ``preamble``, constants, check functions and function tables."""
+        root_name: Optional[str] = self.check_function(self.root, name="first_error")
+        if root_name is None:
+            self.functions.append(["def first_error(instance):", "    return None"])
+        elif root_name != "first_error":
+            self.functions.append([f"first_error = {root_name}"])
+        imports: List[str] = ["import re"] if any("re.compile" in line for line in self.constants) else []
+        if self.helpers:
+            imports.extend(["" if imports else "", f"from .compiled_schema import {', '.join(sorted(self.helpers))}"])
+        sections: List[str] = ["\n".join(imports).strip("\n"), preamble.rstrip("\n"), "\n".join(self.constants)]
+        source: str = "\n\n".join(section for section in sections if section)
+        source += "\n\n\n" + "\n\n\n".join("\n".join(function) for function in self.functions) + "\n"
+        if self.tables:
+            source += "\n\n" + "\n".join(self.tables) + "\n"
+        return source
+
+    def resolve(self, schema: Schema) -> Schema:
+        """Follow schemas that are nothing but a ``$ref`` to the schema they point at."""
+        seen: Set[int] = set()
+        while isinstance(schema, dict) and id(schema) not in seen:
+            keywords: List[str] = [keyword for keyword in schema if keyword not in _ANNOTATION_KEYWORDS]
+            if keywords != ["$ref"]:
+                break
+            seen.add(id(schema))
+            schema = self._lookup(cast(str, schema["$ref"]))
+        return schema
+
+    def check_function(self, schema: Schema, name: Optional[str] = None, boolean: bool = False) -> Optional[str]:
+        """Name of the function checking ``schema``, or None when it accepts everything.
+
+        Check functions return None or ``(path, message)``; boolean ones return True or False.
+        """
+        target: Schema = self.resolve(schema)
+        if target is True or (isinstance(target, dict) and self._is_trivial(target)):
+            return None
+        existing: Optional[str] = self._names.get((id(target), boolean))
+        if existing is not None:
+            return existing
+        function_name: str = name or f"_{'valid' if boolean else 'check'}_{len(self._names)}"
+        self._names[(id(target), boolean)] = function_name
+        outer_mode: bool = self._boolean
+        self._boolean = boolean
+        lines: List[str] = [f"def {function_name}(instance):"]
+        if target is False:
+            lines.append("    return False" if boolean else '    return (), "False schema does not allow " + repr(instance)')
+        else:
+            lines.extend(_indent(self._body(cast(JsonObject, target))))
+        self._boolean = outer_mode
+        self.functions.append(lines)
+        return function_name
+
+    def _is_trivial(self, schema: JsonObject) -> bool:
+        return all(keyword in _ANNOTATION_KEYWORDS for keyword in schema)
+
+    def _lookup(self, reference: str) -> Schema:
+        if not reference.startswith("#"):
+            raise ValueError(f"unsupported $ref: {reference}. Supported: local JSON pointers")
+        node: object = self.root
+        for token in (part for part in reference[1:].split("/") if part):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if not isinstance(node, dict) or token not in node:
+                raise ValueError(f"unresolvable $ref: {reference}")
+            node = node[token]
+        if not isinstance(node, (bool, dict)):
+            raise ValueError(f"unresolvable $ref: {reference}")
+        return node
+
+    def _constant(self, prefix: str, expression: str, after_functions: bool = False) -> str:
+        """Module-level constant; tables of check functions must follow the functions they name."""
+        name: str = f"_{prefix}_{len(self.constants) + len(self.tables)}"
+        (self.tables if after_functions else self.constants).append(f"{name} = {expression}")
+        return name
+
+    def _type_check(self, type_name: str, variable: str = "instance") -> str:
+        template: Optional[str] = _TYPE_CHECKS.get(type_name)
+        if template is None:
+            raise ValueError(f"unsupported schema type: {type_name}. Supported: {', '.join(_TYPE_CHECKS)}")
+        if type_name in ("integer", "number"):
+            self.helpers.add(f"_is_{type_name}")
+        return template.format(variable)
+
+    def _gate(self, type_name: str, known_type: Optional[str], lines: List[str]) -> List[str]:
+        if not lines or _satisfies(known_type, type_name):
+            return lines
+        return [f"if {self._type_check(type_name)}:"] + _indent(lines)
+
+    def _descend(self, schema: Schema, argument: str = "instance", path_part: Optional[str] = None) -> List[str]:
+        name: Optional[str] = self.check_function(schema, boolean=self._boolean)
+        if name is None:
+            return []
+        if self._boolean:
+            return [f"if not {name}({argument}):", "    return False"]
+        result: str = f"return ({path_part},) + error[0], error[1]" if path_part else "return error"
+        return [f"error = {name}({argument})", "if error is not None:", f"    {result}"]
+
+    def _fail(self, message_suffix: str, instance_repr: bool = True) -> str:
+        if self._boolean:
+            return "return False"
+        if instance_repr:
+            return f"return (), repr(instance) + {message_suffix!r}"
+        return f"return (), {message_suffix!r}"
+
+    def _fast_accept(self, schema: Schema, variable: str) -> Optional[str]:
+        """A cheap expression that implies ``variable`` is valid, for simple array items."""
+        target: Schema = self.resolve(schema)
+        if not isinstance(target, dict):
+            return None
+        keywords: Set[str] = {keyword for keyword in target if keyword not in _ANNOTATION_KEYWORDS}
+        type_name: object = target.get("type")
+        if not isinstance(type_name, str) or type_name not in _FAST_TYPE_CHECKS:
+            return None
+        if not keywords <= {"type", "minimum", "maximum", "minLength", "maxLength"}:
+            return None
+        terms: List[str] = [_FAST_TYPE_CHECKS[type_name].format(variable)]
+        if "minimum" in target or "maximum" in target:
+            if type_name == "string":
+                return None
+            bounds: str = variable
+            if "minimum" in target:
+                bounds = f"{target['minimum']!r} <= {bounds}"
+            if "maximum" in target:
+                bounds = f"{bounds} <= {target['maximum']!r}"
+            terms.append(bounds)
+        if "minLength" in target:
+            terms.append(f"len({variable}) >= {target['minLength']!r}")
+        if "maxLength" in target:
+            terms.append(f"len({variable}) <= {target['maxLength']!r}")
+        return " and ".join(terms)
+
+    def _bulk_accept(self, schema: Schema) -> Optional[str]:
+        """An expression that implies every item of a numeric array is valid, using C-level scans.
+
+        NaN items can only make ``min``/``max`` fail the bounds; they are valid under jsonschema
+        (every comparison is false), so the per-item fallback reaches the same result.
+        """
+        target: Schema = self.resolve(schema)
+        if not isinstance(target, dict) or target.get("type") not in _BULK_TYPES:
+            return None
+        if not {keyword for keyword in target if keyword not in _ANNOTATION_KEYWORDS} <= {"type", "minimum", "maximum"}:
+            return None
+        types: str = self._constant("ITEM_TYPES", _BULK_TYPES[cast(str, target["type"])])
+        terms: List[str] = []
+        if "minimum" in target:
+            terms.append(f"{target['minimum']!r} <= min(instance)")
+        if "maximum" in target:
+            terms.append(f"max(instance) <= {target['maximum']!r}")
+        if not terms:
+            return f"{types}.issuperset(map(type, instance))"
+        return f"{types}.issuperset(map(type, instance)) and (not instance or ({' and '.join(terms)}))"
+
+    def _body(self, schema: JsonObject) -> List[str]:
+        lines: List[str] = []
+        known_type: Optional[str] = None
+        for keyword, value in schema.items():
+            if keyword in _ANNOTATION_KEYWORDS:
+                continue
+            handler = getattr(self, f"_keyword_{keyword.lstrip('$')}", None)
+            if handler is None:
+                raise ValueError(f"unsupported schema keyword: {keyword}")
+            lines.extend(handler(value, schema, known_type))
+            if keyword == "type" and isinstance(value, str):
+                known_type = value
+        lines.append("return True" if self._boolean else "return None")
+        return lines
+
+    def _keyword_type(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        types: List[str] = [value] if isinstance(value, str) else list(cast(List[str], value))
+        checks: List[str] = [self._type_check(type_name) for type_name in types]
+        check: str = checks[0] if len(checks) == 1 else f"({' or '.join(checks)})"
+        reprs: str = ", ".join(repr(type_name) for type_name in types)
+        return [f"if not {check}:", "    " + self._fail(f" is not of type {reprs}")]
+
+    def _keyword_const(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        if isinstance(value, str):
+            condition: str = f"instance != {value!r}"
+        else:
+            self.helpers.add("_equal")
+            condition = f"not _equal(instance, {value!r})"
+        return [f"if {condition}:", "    " + self._fail(f"{value!r} was expected", instance_repr=False)]
+
+    def _keyword_enum(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        enums: List[object] = list(cast(List[object], value))
+        if all(isinstance(each, str) for each in enums):
+            condition: str = f"instance not in {tuple(enums)!r}"
+        else:
+            self.helpers.add("_equal")
+            name: str = self._constant("ENUM", repr(tuple(enums)))
+            condition = f"not any(_equal(instance, each) for each in {name})"
+        return [f"if {condition}:", "    " + self._fail(f" is not one of {enums!r}")]
+
+    def _length_limit(self, type_name: str, operator: str, limit: object, message: str, known_type: Optional[str]) -> List[str]:
+        return self._gate(type_name, known_type, [f"if len(instance) {operator} {limit!r}:", "    " + self._fail(f" {message}")])
+
+    def _keyword_minLength(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        message: str = "should be non-empty" if value == 1 else "is too short"
+        return self._length_limit("string", "<", value, message, known_type)
+
+    def _keyword_maxLength(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        message: str = "is expected to be empty" if value == 0 else "is too long"
+        return self._length_limit("string", ">", value, message, known_type)
+
+    def _keyword_minItems(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        message: str = "should be non-empty" if value == 1 else "is too short"
+        return self._length_limit("array", "<", value, message, known_type)
+
+    def _keyword_maxItems(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        message: str = "is expected to be empty" if value == 0 else "is too long"
+        return self._length_limit("array", ">", value, message, known_type)
+
+    def _keyword_minimum(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        lines: List[str] = [f"if instance < {value!r}:", "    " + self._fail(f" is less than the minimum of {value!r}")]
+        return self._gate("number", known_type, lines)
+
+    def _keyword_maximum(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        lines: List[str] = [f"if instance > {value!r}:", "    " + self._fail(f" is greater than the maximum of {value!r}")]
+        return self._gate("number", known_type, lines)
+
+    def _keyword_pattern(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        name: str = self._constant("PATTERN", f"re.compile({value!r})")
+        lines: List[str] = [f"if {name}.search(instance) is None:", "    " + self._fail(f" does not match {value!r}")]
+        return self._gate("string", known_type, lines)
+
+    def _keyword_format(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        failure: str = "    " + self._fail(f" is not a {value!r}")
+        if value == "uuid":
+            self.helpers.add("_is_uuid")
+            return self._gate("string", known_type, ["if not _is_uuid(instance):", failure])
+        self.helpers.add("_format_ok")
+        return [f"if not _format_ok(instance, {value!r}):", failure]
+
+    def _keyword_uniqueItems(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        if not value:
+            return []
+        self.helpers.add("_unique")
+        return self._gate("array", known_type, ["if not _unique(instance):", "    " + self._fail(" has non-unique elements")])
+
+    def _keyword_required(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        lines: List[str] = []
+        for name in cast(List[str], value):
+            lines.extend([f"if {name!r} not in instance:", "    " + self._fail(f"{name!r} is a required property", instance_repr=False)])
+        return self._gate("object", known_type, lines)
+
+    def _keyword_additionalProperties(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        if "patternProperties" in schema:
+            raise ValueError("unsupported schema keyword: patternProperties")
+        if value is True:
+            return []
+        known: List[str] = list(cast(JsonObject, schema.get("properties", {})))
+        name: str = self._constant("PROPERTIES", f"frozenset({known!r})")
+        if value is False and self._boolean:
+            lines: List[str] = [f"if not {name}.issuperset(instance):", "    return False"]
+        elif value is False:
+            self.helpers.add("_extras_message")
+            lines = [
+                f"if not {name}.issuperset(instance):",
+                f"    return (), _extras_message(sorted((key for key in instance if key not in {name}), key=str))",
+            ]
+        else:
+            descend: List[str] = self._descend(cast(Schema, value), "instance[key]", "key")
+            if not descend:
+                return []
+            lines = ["for key in instance:", f"    if key not in {name}:"] + _indent(_indent(descend))
+        return self._gate("object", known_type, lines)
+
+    def _keyword_properties(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        lines: List[str] = []
+        for name, subschema in cast(JsonObject, value).items():
+            descend: List[str] = self._descend(cast(Schema, subschema), f"instance[{name!r}]", repr(name))
+            if descend:
+                lines.extend([f"if {name!r} in instance:"] + _indent(descend))
+        return self._gate("object", known_type, lines)
+
+    def _keyword_items(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        if "prefixItems" in schema:
+            raise ValueError("unsupported schema keyword: prefixItems")
+        descend: List[str] = self._descend(cast(Schema, value), "item", "index")
+        if not descend:
+            return []
+        accept: Optional[str] = self._fast_accept(cast(Schema, value), "item")
+        loop_body: List[str] = [f"if not ({accept}):"] + _indent(descend) if accept else descend
+        loop: List[str] = ["for index, item in enumerate(instance):"] + _indent(loop_body)
+        bulk: Optional[str] = self._bulk_accept(cast(Schema, value))
+        return self._gate("array", known_type, [f"if not ({bulk}):"] + _indent(loop) if bulk else loop)
+
+    def _keyword_ref(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        return self._descend(self._lookup(cast(str, value)))
+
+    def _keyword_allOf(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        lines: List[str] = []
+        for subschema in cast(List[Schema], value):
+            lines.extend(self._descend(subschema))
+        return lines
+
+    def _subschema_checks(self, subschemas: List[Schema]) -> str:
+        names: List[str] = []
+        for subschema in subschemas:
+            name: Optional[str] = self.check_function(subschema, boolean=True)
+            if name is None:
+                name = self._constant("ACCEPT", "lambda instance: True")
+            names.append(name)
+        return self._constant("CHECKS", f"({', '.join(names)},)", after_functions=True)
+
+    def _keyword_anyOf(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        checks: str = self._subschema_checks(cast(List[Schema], value))
+        return [
+            f"if not any(check(instance) for check in {checks}):",
+            "    " + self._fail(" is not valid under any of the given schemas"),
+        ]
+
+    def _keyword_oneOf(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        subschemas: List[Schema] = list(cast(List[Schema], value))
+        checks: str = self._subschema_checks(subschemas)
+        if self._boolean:
+            return [f"if sum(1 for check in {checks} if check(instance)) != 1:", "    return False"]
+        reprs: str = self._constant("REPRS", repr(tuple(repr(subschema) for subschema in subschemas)))
+        return [
+            f"matched = next((position for position, check in enumerate({checks}) if check(instance)), -1)",
+            "if matched < 0:",
+            "    " + self._fail(" is not valid under any of the given schemas"),
+            f"more = [position for position in range(matched + 1, {len(subschemas)}) if {checks}[position](instance)]",
+            "if more:",
+            f'    return (), repr(instance) + " is valid under each of " + ", ".join({reprs}[position] for position in more + [matched])',
+        ]
+
+    def _keyword_not(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        name: Optional[str] = self.check_function(cast(Schema, value), boolean=True)
+        check: str = f"{name}(instance)" if name else "True"
+        return [f"if {check}:", "    " + self._fail(f" should not be valid under {value!r}")]
+
+    def _keyword_if(self, value: object, schema: JsonObject, known_type: Optional[str]) -> List[str]:
+        name: Optional[str] = self.check_function(cast(Schema, value), boolean=True)
+        then_lines: List[str] = self._descend(cast(Schema, schema["then"])) if "then" in schema else []
+        else_lines: List[str] = self._descend(cast(Schema, schema["else"])) if "else" in schema else []
+        if name is None:
+            return then_lines
+        lines: List[str] = []
+        if then_lines:
+            lines.extend([f"if {name}(instance):"] + _indent(then_lines))
+            if else_lines:
+                lines.extend(["else:"] + _indent(else_lines))
+        elif else_lines:
+            lines.extend([f"if not {name}(instance):"] + _indent(else_lines))
+        return lines
+
+
+def render_validator_module(schema_bytes: bytes) -> str:
+    """Python source defining ``first_error(instance)``, the schema compiled to plain checks.
+
+    Raises ValueError for keywords the compiler does not support, so a schema change that needs
+    one fails at generation time rather than silently accepting more than jsonschema would.
+    """
+    schema: JsonObject = cast(JsonObject, json.loads(schema_bytes))
+    return (
+        '"""Compiled validator for spec/schema.json. Generated by ``python -m opentsr.codegen``; do not edit."""\n'
+        "\n"
+        + _ValidatorCompiler(schema).compile(f'SCHEMA_SHA256 = "{schema_digest(schema_bytes)}"')
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate opentsr/_schema.py and opentsr/_compiled_schema.py from spec/schema.json.")
+    parser.add_argument("--schema", type=Path, default=_default_schema_source())
+    parser.add_argument("--output", type=Path, default=SCHEMA_MODULE_PATH)
+    parser.add_argument("--validator-output", type=Path, default=VALIDATOR_MODULE_PATH)
+    args = parser.parse_args()
+
+    schema_bytes: bytes = args.schema.read_bytes()
+    args.output.write_text(render_schema_module(schema_bytes), encoding="utf-8")
+    print(f"wrote {args.output}")
+    args.validator_output.write_text(render_validator_module(schema_bytes), encoding="utf-8")
+    print(f"wrote {args.validator_output}")
+
+
+if __name__ == "__main__":
+    main()
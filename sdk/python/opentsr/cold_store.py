@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Protocol, Tuple, cast
+from uuid import UUID
+
+JsonObject = Dict[str, object]
+
+SEGMENT_PREFIX: str = "segment-"
+SEGMENT_SUFFIX: str = ".log"
+INDEX_FILE_NAME: str = "index.bin"
+SEGMENT_MAGIC: bytes = b"OTSRCSEG"
+SEGMENT_VERSION: int = 1
+
+# magic, version; padded to 16 bytes.
+_SEGMENT_HEADER = struct.Struct(">8sH6x")
+# Record length and CRC-32 of the record bytes.
+_RECORD_HEADER = struct.Struct(">II")
+# tsr_id (16 raw UUID bytes), segment number, record offset, record length.
+_INDEX_ENTRY = struct.Struct(">16sIQI")
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist directory entries (new or renamed files); a no-op where directories cannot be opened."""
+    try:
+        descriptor: int = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _record_key(record: bytes) -> Optional[bytes]:
+    """The raw UUID of a record's ``tsr_id``, or None when the bytes are not a signal."""
+    try:
+        return UUID(cast(str, cast(JsonObject, json.loads(record))["tsr_id"])).bytes
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+class ColdStore(Protocol):
+    """Persistence backend for the raw canonical JSON of accepted signals."""
+
+    def put(self, tsr_id: str, record: bytes) -> str:
+        """Persist one canonical JSON record and return its locator."""
+        ...
+
+    def get_bytes(self, tsr_id: str) -> Optional[bytes]:
+        ...
+
+    @property
+    def pending(self) -> int:
+        """Records accepted but not yet durable."""
+        ...
+
+    def flush(self) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class DirectoryColdStore:
+    """One ``<tsr_id>.json`` document per signal, the original reference layout.
+
+    With ``fsync=True``, :meth:`flush` fsyncs every document written since the last flush,
+    then the directory; otherwise durability is left to the operating system.
+    """
+
+    def __init__(self, root: Path, fsync: bool = False) -> None:
+        self.root: Path = root
+        self.fsync: bool = fsync
+        self._root_ready: bool = False
+        self._unsynced: List[Path] = []
+
+    def put(self, tsr_id: str, record: bytes) -> str:
+        if not self._root_ready:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._root_ready = True
+        cold_path: Path = self.root / f"{tsr_id}.json"
+        cold_path.write_bytes(record)
+        if self.fsync:
+            self._unsynced.append(cold_path)
+        return str(cold_path)
+
+    def locator(self, tsr_id: str) -> Optional[str]:
+        cold_path: Path = self.root / f"{tsr_id}.json"
+        return str(cold_path) if cold_path.is_file() else None
+
+    def get_bytes(self, tsr_id: str) -> Optional[bytes]:
+        cold_path: Path = self.root / f"{tsr_id}.json"
+        if not cold_path.is_file():
+            return None
+        return cold_path.read_bytes()
+
+    def get(self, tsr_id: str) -> Optional[JsonObject]:
+        record: Optional[bytes] = self.get_bytes(tsr_id)
+        return None if record is None else cast(JsonObject, json.loads(record))
+
+    def tsr_ids(self) -> List[str]:
+        """IDs of the stored signals, sorted (UUIDv7 IDs sort by creation time)."""
+        if not self.root.is_dir():
+            return []
+        return sorted(entry.name[:-5] for entry in os.scandir(self.root) if entry.name.endswith(".json") and entry.is_file())
+
+    @property
+    def pending(self) -> int:
+        return len(self._unsynced)
+
+    def flush(self) -> None:
+        if not self._unsynced:
+            return
+        for cold_path in self._unsynced:
+            descriptor: int = os.open(cold_path, os.O_RDONLY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+        self._unsynced.clear()
+        _fsync_directory(self.root)
+
+    def close(self) -> None:
+        return None
+
+
+class SegmentedColdStore:
+    """Append-only cold store of checksummed canonical JSON records in rolling segment files.
+
+    Each segment starts with a 16-byte header (magic ``OTSRCSEG``, version); each record is a
+    big-endian length and CRC-32 followed by the canonical JSON bytes. ``index.bin`` holds fixed-size
+    ``tsr_id -> (segment, offset, length)`` entries, and segments plus index are fsynced
+    together once ``fsync_batch_size`` records are pending or, checked on each ``put``,
+    ``fsync_interval_s`` has elapsed since the last sync; an idle store syncs only on
+    :meth:`flush` or :meth:`close`. Opening a store replays any records missing from the index
+    and truncates the tail from the first record that is torn, zero-filled or fails its checksum.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        fsync_batch_size: int = 256,
+        fsync_interval_s: float = 1.0,
+    ) -> None:
+        if segment_max_bytes <= _SEGMENT_HEADER.size + _RECORD_HEADER.size:
+            raise ValueError("segment_max_bytes must be larger than the segment and record headers")
+        if fsync_batch_size < 1:
+            raise ValueError("fsync_batch_size must be >= 1")
+
+        self.root: Path = root
+        self.segment_max_bytes: int = segment_max_bytes
+        self.fsync_batch_size: int = fsync_batch_size
+        self.fsync_interval_s: float = fsync_interval_s
+
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._readers: Dict[int, BinaryIO] = {}
+        self._pending: int = 0
+        self._last_sync: float = time.monotonic()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index_file: BinaryIO = (self.root / INDEX_FILE_NAME).open("ab")
+        try:
+            self._recover()
+        except ValueError:
+            self._index_file.close()
+            raise
+        segment_numbers: List[int] = self._segment_numbers()
+        self._segment_number: int = segment_numbers[-1] if segment_numbers else 0
+        self._segment_file: BinaryIO = self._open_segment(self._segment_number)
+        self._segment_offset: int = self._segment_file.tell()
+
+    def __enter__(self) -> "SegmentedColdStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, tsr_id: object) -> bool:
+        return isinstance(tsr_id, str) and UUID(tsr_id).bytes in self._index
+
+    @property
+    def pending(self) -> int:
+        """Records written since the last fsync."""
+        return self._pending
+
+    def _segment_path(self, segment_number: int) -> Path:
+        return self.root / f"{SEGMENT_PREFIX}{segment_number:06d}{SEGMENT_SUFFIX}"
+
+    def _segment_numbers(self) -> List[int]:
+        numbers: List[int] = []
+        for segment_path in self.root.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            digits: str = segment_path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+            if digits.isdigit():
+                numbers.append(int(digits))
+        return sorted(numbers)
+
+    def _open_segment(self, segment_number: int) -> BinaryIO:
+        """Open a segment for appending, writing its header if it has none yet."""
+        segment_file: BinaryIO = self._segment_path(segment_number).open("ab")
+        if segment_file.tell() == 0:
+            segment_file.write(_SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION))
+        return segment_file
+
+    def locator(self, tsr_id: str) -> Optional[str]:
+        entry: Optional[Tuple[int, int, int]] = self._index.get(UUID(tsr_id).bytes)
+        if entry is None:
+            return None
+        segment_number, offset, length = entry
+        return f"{self._segment_path(segment_number)}@{offset}:{length}"
+
+    @staticmethod
+    def _read_record(segment_file: BinaryIO) -> Optional[bytes]:
+        """The next record at the file position, or None at the end or at a torn or corrupt record."""
+        header: bytes = segment_file.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return None
+        length, checksum = _RECORD_HEADER.unpack(header)
+        record: bytes = segment_file.read(length)
+        if length == 0 or len(record) < length or zlib.crc32(record) != checksum:
+            return None
+        return record
+
+    def _recover(self) -> None:
+        expected_header: bytes = _SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION)
+        for segment_number in self._segment_numbers():
+            segment_path: Path = self._segment_path(segment_number)
+            with segment_path.open("r+b") as segment_file:
+                head: bytes = segment_file.read(_SEGMENT_HEADER.size)
+                if head == expected_header:
+                    continue
+                if not expected_header.startswith(head) and head.strip(b"\x00"):
+                    raise ValueError(f"not an OpenTSR cold store segment: {segment_path}")
+                # Created but its header never fully reached the disk, so it holds no records.
+                segment_file.truncate(0)
+
+        indexed_end: Dict[int, int] = {}
+        index_path: Path = self.root / INDEX_FILE_NAME
+        raw_index: bytes = index_path.read_bytes()
+        complete_bytes: int = len(raw_index) - len(raw_index) % _INDEX_ENTRY.size
+        segment_sizes: Dict[int, int] = {
+            segment_number: self._segment_path(segment_number).stat().st_size for segment_number in self._segment_numbers()
+        }
+        for position in range(0, complete_bytes, _INDEX_ENTRY.size):
+            key, segment_number, offset, length = _INDEX_ENTRY.unpack_from(raw_index, position)
+            record_end: int = offset + _RECORD_HEADER.size + length
+            if record_end > segment_sizes.get(segment_number, 0):
+                # Index entry outlived its segment bytes; the record was never durable.
+                continue
+            self._index[key] = (segment_number, offset, length)
+            indexed_end[segment_number] = max(indexed_end.get(segment_number, 0), record_end)
+        if complete_bytes != len(raw_index):
+            self._index_file.truncate(complete_bytes)
+
+        replayed: bool = False
+        for segment_number in self._segment_numbers():
+            segment_path = self._segment_path(segment_number)
+            with segment_path.open("r+b") as segment_file:
+                position = max(indexed_end.get(segment_number, 0), _SEGMENT_HEADER.size)
+                if position > segment_sizes[segment_number]:
+                    continue
+                segment_file.seek(position)
+                while True:
+                    record: Optional[bytes] = self._read_record(segment_file)
+                    key = _record_key(record) if record is not None else None
+                    if record is None or key is None:
+                        if position < segment_sizes[segment_number]:
+                            segment_file.truncate(position)
+                        break
+                    entry: Tuple[int, int, int] = (segment_number, position, len(record))
+                    self._index[key] = entry
+                    self._index_file.write(_INDEX_ENTRY.pack(key, *entry))
+                    replayed = True
+                    position = segment_file.tell()
+        if replayed:
+            self._index_file.flush()
+            os.fsync(self._index_file.fileno())
+
+    def _roll_segment(self) -> None:
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        self._segment_file.close()
+        self._segment_number += 1
+        self._segment_file = self._open_segment(self._segment_number)
+        self._segment_offset = self._segment_file.tell()
+
+    def put(self, tsr_id: str, record: bytes) -> str:
+        record_size: int = _RECORD_HEADER.size + len(record)
+        if self._segment_offset > _SEGMENT_HEADER.size and self._segment_offset + record_size > self.segment_max_bytes:
+            self._roll_segment()
+
+        offset: int = self._segment_offset
+        self._segment_file.write(_RECORD_HEADER.pack(len(record), zlib.crc32(record)))
+        self._segment_file.write(record)
+        self._segment_offset += record_size
+
+        key: bytes = UUID(tsr_id).bytes
+        self._index[key] = (self._segment_number, offset, len(record))
+        self._index_file.write(_INDEX_ENTRY.pack(key, self._segment_number, offset, len(record)))
+
+        self._pending += 1
+        if self._pending >= self.fsync_batch_size or time.monotonic() - self._last_sync >= self.fsync_interval_s:
+            self.flush()
+        return f"{self._segment_path(self._segment_number)}@{offset}:{len(record)}"
+
+    def get_bytes(self, tsr_id: str) -> Optional[bytes]:
+        entry: Optional[Tuple[int, int, int]] = self._index.get(UUID(tsr_id).bytes)
+        if entry is None:
+            return None
+        segment_number, offset, length = entry
+        if segment_number == self._segment_number:
+            self._segment_file.flush()
+        reader: Optional[BinaryIO] = self._readers.get(segment_number)
+        if reader is None:
+            reader = self._segment_path(segment_number).open("rb")
+            self._readers[segment_number] = reader
+        reader.seek(offset + _RECORD_HEADER.size)
+        return reader.read(length)
+
+    def get(self, tsr_id: str) -> Optional[JsonObject]:
+        record: Optional[bytes] = self.get_bytes(tsr_id)
+        return None if record is None else cast(JsonObject, json.loads(record))
+
+    def scan(self, start: Tuple[int, int] = (0, 0)) -> Iterator[Tuple[Tuple[int, int], bytes]]:
+        """Records in append order from ``start`` (segment, offset), each with the position after it.
+
+        Passing the last yielded position back resumes the scan with records appended since.
+        A record still being written at the tail is not yielded.
+        """
+        if not self._segment_file.closed:
+            self._segment_file.flush()
+        start_segment, start_offset = start
+        for segment_number in self._segment_numbers():
+            if segment_number < start_segment:
+                continue
+            position: int = start_offset if segment_number == start_segment else 0
+            with self._segment_path(segment_number).open("rb") as segment_file:
+                segment_file.seek(max(position, _SEGMENT_HEADER.size))
+                while True:
+                    record: Optional[bytes] = self._read_record(segment_file)
+                    if record is None:
+                        break
+                    yield (segment_number, segment_file.tell()), record
+
+    def flush(self) -> None:
+        """Group commit: fsync the active segment and the index."""
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._segment_file.closed:
+            return
+        self.flush()
+        self._segment_file.close()
+        self._index_file.close()
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
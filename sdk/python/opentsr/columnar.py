@@ -0,0 +1,289 @@
+"""Incremental columnar export of the cold store for analytics.
+
+A column bundle is a directory of parts, each a set of ``.npy`` files with one file per
+flattened field, plus ``manifest.json`` listing the parts and the export cursor. Strings are
+dictionary-encoded (``int32`` codes, ``-1`` for missing values) and vectors are stored as
+fixed-size float32 matrices per dimension. Columns load memory-mapped, so a scan reads only
+the columns it touches.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+
+from pydantic_core import from_json
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    np = None  # type: ignore[assignment]
+
+from .cold_store import DirectoryColdStore, SegmentedColdStore
+from .vector_checks import SUPPORTED_VECTOR_DIMS
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+JsonObject = Dict[str, object]
+
+BUNDLE_FORMAT: str = "opentsr-columns"
+BUNDLE_VERSION: int = 1
+MANIFEST_NAME: str = "manifest.json"
+DICTIONARIES_NAME: str = "dictionaries.json"
+PART_PREFIX: str = "part-"
+DEFAULT_PART_ROWS: int = 65_536
+TSR_ID_BYTES: int = 36
+
+# Flattened field -> (JSON object holding it, key). Top-level fields use None.
+STRING_COLUMNS: Dict[str, Tuple[Optional[str], str]] = {
+    "env": (None, "env"),
+    "agent_id": (None, "agent_id"),
+    "origin.kind": ("origin", "kind"),
+    "origin.source_id": ("origin", "source_id"),
+    "origin.namespace": ("origin", "namespace"),
+    "origin.device_id": ("origin", "device_id"),
+    "origin.software_version": ("origin", "software_version"),
+    "origin.region": ("origin", "region"),
+    "safety.digital_signature": ("safety", "digital_signature"),
+    "safety.signature_alg": ("safety", "signature_alg"),
+    "trace.trace_id": ("trace", "trace_id"),
+    "trace.span_id": ("trace", "span_id"),
+    "trace.parent_span_id": ("trace", "parent_span_id"),
+}
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "tsr_timestamp_ns": "<i8",
+    "safety.veracity_score": "<f8",
+    "safety.hazard_flag": "bool",
+    "vector_dim": "<i2",
+}
+
+ColdStoreSource = Union[DirectoryColdStore, SegmentedColdStore]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("opentsr.columnar requires numpy. Install with: pip install 'opentsr[vector]'")
+
+
+def _part_name(part_number: int) -> str:
+    return f"{PART_PREFIX}{part_number:06d}"
+
+
+class _PartBuilder:
+    """Accumulates flattened rows for one part and writes them as ``.npy`` columns."""
+
+    def __init__(self) -> None:
+        self.tsr_ids: List[bytes] = []
+        self.numbers: Dict[str, List[object]] = {name: [] for name in NUMERIC_COLUMNS}
+        self.codes: Dict[str, List[int]] = {name: [] for name in STRING_COLUMNS}
+        self.dictionaries: Dict[str, Dict[str, int]] = {name: {} for name in STRING_COLUMNS}
+        self.vectors: Dict[int, List[List[float]]] = {dim: [] for dim in SUPPORTED_VECTOR_DIMS}
+
+    def __len__(self) -> int:
+        return len(self.tsr_ids)
+
+    def add(self, instance: JsonObject) -> None:
+        safety: JsonObject = cast(JsonObject, instance["safety"])
+        vector: Optional[List[float]] = cast(Optional[List[float]], instance.get("vector"))
+        self.tsr_ids.append(cast(str, instance["tsr_id"]).encode("ascii"))
+        self.numbers["tsr_timestamp_ns"].append(instance["tsr_timestamp_ns"])
+        self.numbers["safety.veracity_score"].append(safety["veracity_score"])
+        self.numbers["safety.hazard_flag"].append(safety.get("hazard_flag", False))
+        self.numbers["vector_dim"].append(len(vector) if vector is not None else 0)
+        if vector is not None:
+            self.vectors.setdefault(len(vector), []).append(vector)
+        for name, (parent, key) in STRING_COLUMNS.items():
+            holder: object = instance if parent is None else instance.get(parent)
+            value: object = holder.get(key) if isinstance(holder, dict) else None
+            if value is None:
+                self.codes[name].append(-1)
+                continue
+            dictionary: Dict[str, int] = self.dictionaries[name]
+            self.codes[name].append(dictionary.setdefault(cast(str, value), len(dictionary)))
+
+    def write(self, part_dir: Path) -> None:
+        if part_dir.exists():
+            # Left behind by an export that failed before its manifest update.
+            shutil.rmtree(part_dir)
+        part_dir.mkdir(parents=True)
+        np.save(part_dir / "tsr_id.npy", np.array(self.tsr_ids, dtype=f"S{TSR_ID_BYTES}"))
+        for name, dtype in NUMERIC_COLUMNS.items():
+            np.save(part_dir / f"{name}.npy", np.array(self.numbers[name], dtype=dtype))
+        for name in STRING_COLUMNS:
+            np.save(part_dir / f"{name}.npy", np.array(self.codes[name], dtype="<i4"))
+        for dim, rows in self.vectors.items():
+            if rows:
+                np.save(part_dir / f"vector_{dim}.npy", np.array(rows, dtype="<f4"))
+        dictionaries: Dict[str, List[str]] = {name: list(values) for name, values in self.dictionaries.items()}
+        (part_dir / DICTIONARIES_NAME).write_text(json.dumps(dictionaries), encoding="utf-8")
+
+
+class ColumnBundle:
+    """Read side of a column bundle; columns are concatenated across parts on access."""
+
+    def __init__(self, directory: Path) -> None:
+        _require_numpy()
+        self.directory: Path = directory
+        self.manifest: JsonObject = _read_manifest(directory)
+        self.parts: List[str] = [cast(str, part["name"]) for part in cast(List[JsonObject], self.manifest["parts"])]
+        self._dictionaries: Optional[List[Dict[str, List[str]]]] = None
+
+    def __len__(self) -> int:
+        return cast(int, self.manifest["rows"])
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return ("tsr_id",) + tuple(NUMERIC_COLUMNS) + tuple(STRING_COLUMNS)
+
+    def _load(self, part: str, file_name: str) -> NDArray:
+        return np.load(self.directory / part / file_name, mmap_mode="r")
+
+    def _concatenate(self, file_name: str, empty: NDArray) -> NDArray:
+        arrays: List[NDArray] = [self._load(part, file_name) for part in self.parts]
+        if not arrays:
+            return empty
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    def _part_dictionaries(self) -> List[Dict[str, List[str]]]:
+        if self._dictionaries is None:
+            self._dictionaries = [
+                json.loads((self.directory / part / DICTIONARIES_NAME).read_text(encoding="utf-8")) for part in self.parts
+            ]
+        return self._dictionaries
+
+    def categories(self, name: str) -> Tuple[NDArray, List[str]]:
+        """``int32`` codes into one dictionary for a string column; ``-1`` marks missing values."""
+        if name not in STRING_COLUMNS:
+            raise ValueError(f"unsupported string column: {name}. Supported: {', '.join(STRING_COLUMNS)}")
+        if len(self.parts) == 1:
+            return self._load(self.parts[0], f"{name}.npy"), self._part_dictionaries()[0][name]
+        merged: Dict[str, int] = {}
+        remapped: List[NDArray] = []
+        for part, dictionaries in zip(self.parts, self._part_dictionaries()):
+            mapping: NDArray = np.array([merged.setdefault(value, len(merged)) for value in dictionaries[name]] + [-1], dtype="<i4")
+            # Missing values (-1) index the trailing -1 of ``mapping``.
+            remapped.append(mapping[self._load(part, f"{name}.npy")])
+        codes_all: NDArray = np.concatenate(remapped) if remapped else np.empty(0, dtype="<i4")
+        return codes_all, list(merged)
+
+    def column(self, name: str) -> NDArray:
+        """One column across all parts; string columns decode to an object array with None for missing values."""
+        if name == "tsr_id":
+            return self._concatenate("tsr_id.npy", np.empty(0, dtype=f"S{TSR_ID_BYTES}"))
+        if name in NUMERIC_COLUMNS:
+            return self._concatenate(f"{name}.npy", np.empty(0, dtype=NUMERIC_COLUMNS[name]))
+        codes, dictionary = self.categories(name)
+        lookup: NDArray = np.array(dictionary + [None], dtype=object)
+        return lookup[codes]
+
+    def vectors(self, dim: int) -> Tuple[NDArray, NDArray]:
+        """Row numbers and the ``(rows, dim)`` float32 matrix of the signals with ``dim``-sized vectors."""
+        if dim not in SUPPORTED_VECTOR_DIMS:
+            raise ValueError(f"unsupported vector dimension: {dim}. Supported: {', '.join(map(str, SUPPORTED_VECTOR_DIMS))}")
+        rows: List[NDArray] = []
+        matrices: List[NDArray] = []
+        offset: int = 0
+        for part in cast(List[JsonObject], self.manifest["parts"]):
+            part_name: str = cast(str, part["name"])
+            dims: NDArray = self._load(part_name, "vector_dim.npy")
+            part_rows: NDArray = np.flatnonzero(dims == dim)
+            if len(part_rows):
+                rows.append(part_rows + offset)
+                matrices.append(self._load(part_name, f"vector_{dim}.npy"))
+            offset += cast(int, part["rows"])
+        if not matrices:
+            return np.empty(0, dtype=np.int64), np.empty((0, dim), dtype="<f4")
+        if len(matrices) == 1:
+            return rows[0], matrices[0]
+        return np.concatenate(rows), np.concatenate(matrices)
+
+
+def _read_manifest(directory: Path) -> JsonObject:
+    manifest_path: Path = directory / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "source": None, "rows": 0, "parts": [], "cursor": None}
+    manifest: JsonObject = cast(JsonObject, json.loads(manifest_path.read_text(encoding="utf-8")))
+    if manifest.get("format") != BUNDLE_FORMAT or manifest.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"not an {BUNDLE_FORMAT} v{BUNDLE_VERSION} bundle: {directory}")
+    return manifest
+
+
+def _write_manifest(directory: Path, manifest: JsonObject) -> None:
+    temporary: Path = directory / f"{MANIFEST_NAME}.tmp"
+    temporary.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(temporary, directory / MANIFEST_NAME)
+
+
+def _exported_ids(directory: Path, manifest: JsonObject) -> Set[str]:
+    if not manifest["parts"]:
+        return set()
+    return {tsr_id.decode("ascii") for tsr_id in ColumnBundle(directory).column("tsr_id").tolist()}
+
+
+def _new_records(cold_store: ColdStoreSource, directory: Path, manifest: JsonObject) -> Iterator[Tuple[object, bytes]]:
+    if isinstance(cold_store, SegmentedColdStore):
+        start: Tuple[int, int] = tuple(cast(List[int], manifest["cursor"] or [0, 0]))  # type: ignore[assignment]
+        yield from cold_store.scan(start)
+        return
+    exported: Set[str] = _exported_ids(directory, manifest)
+    for tsr_id in cold_store.tsr_ids():
+        if tsr_id not in exported:
+            record: Optional[bytes] = cold_store.get_bytes(tsr_id)
+            if record is not None:
+                yield None, record
+
+
+def export_columns(cold_store: ColdStoreSource, bundle_dir: Path, part_rows: int = DEFAULT_PART_ROWS) -> int:
+    """Append the signals stored since the last export to the bundle at ``bundle_dir``; returns rows added.
+
+    A :class:`SegmentedColdStore` resumes from the (segment, offset) cursor kept in the
+    manifest. A :class:`DirectoryColdStore` has no append order, so its file listing is
+    compared against the exported ``tsr_id`` column. Records that do not parse yet (a file
+    still being written) are left for the next export. Parts are written before the manifest
+    names them, so an interrupted export leaves the bundle as it was.
+    """
+    _require_numpy()
+    if part_rows < 1:
+        raise ValueError("part_rows must be >= 1")
+    source: str = "segmented" if isinstance(cold_store, SegmentedColdStore) else "directory"
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    manifest: JsonObject = _read_manifest(bundle_dir)
+    if manifest["source"] not in (None, source):
+        raise ValueError(f"bundle was exported from a {manifest['source']} cold store, not a {source} one")
+    manifest["source"] = source
+    parts: List[JsonObject] = cast(List[JsonObject], manifest["parts"])
+
+    added: int = 0
+    builder: _PartBuilder = _PartBuilder()
+    cursor: object = manifest["cursor"]
+
+    def commit() -> None:
+        nonlocal builder, added
+        if len(builder):
+            name: str = _part_name(len(parts))
+            builder.write(bundle_dir / name)
+            parts.append({"name": name, "rows": len(builder)})
+            manifest["rows"] = cast(int, manifest["rows"]) + len(builder)
+            added += len(builder)
+            builder = _PartBuilder()
+        manifest["cursor"] = list(cast(Tuple[int, int], cursor)) if cursor is not None else None
+        _write_manifest(bundle_dir, manifest)
+
+    for position, record in _new_records(cold_store, bundle_dir, manifest):
+        try:
+            instance: JsonObject = cast(JsonObject, from_json(record))
+        except ValueError:
+            if position is not None:
+                raise
+            continue
+        builder.add(instance)
+        if position is not None:
+            cursor = position
+        if len(builder) >= part_rows:
+            commit()
+    commit()
+    return added
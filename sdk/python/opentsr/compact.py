@@ -0,0 +1,214 @@
+"""Compact, slotted records for holding large numbers of already-validated signals in memory."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union, cast
+
+from pydantic_core import from_json
+
+from .models import ActionIntent, Origin, ResourceRef, Safety, TSRSignal, Trace
+
+JsonObject = Dict[str, object]
+VectorDtype = Literal["auto", "float32", "float64"]
+
+VECTOR_DTYPES: Tuple[str, ...] = ("auto", "float32", "float64")
+DEFAULT_CONTEXT: str = "https://opentsr.org/context/v1"
+DEFAULT_SIGNAL_TYPE: str = "OpenTSRSignal"
+DEFAULT_SCHEMA_VERSION: str = "1.0.0-draft"
+
+_ORIGIN_OPTIONAL_FIELDS: Tuple[str, ...] = ("namespace", "device_id", "software_version", "region")
+# Decoded JSON strings are not interned; repeated values are stored once per process instead.
+_SHARED_STRINGS: Dict[str, str] = {
+    value: value for value in (DEFAULT_CONTEXT, DEFAULT_SIGNAL_TYPE, DEFAULT_SCHEMA_VERSION, "hmac-sha256")
+}
+
+
+class OriginKind(Enum):
+    LLM_AGENT = "llm_agent"
+    SENSOR = "sensor"
+    SERVICE = "service"
+    HUMAN_OPERATOR = "human_operator"
+    SIMULATOR = "simulator"
+
+
+class Environment(Enum):
+    DEV = "dev"
+    STAGING = "staging"
+    PROD = "prod"
+
+
+def _shared(value: Optional[str]) -> Optional[str]:
+    return _SHARED_STRINGS.get(value, value) if value is not None else None
+
+
+def _pack_vector(vector: Sequence[float], vector_dtype: VectorDtype) -> array:
+    if vector_dtype == "float64":
+        return array("d", vector)
+    packed: array = array("f", vector)
+    if vector_dtype == "float32" or packed.tolist() == (vector if isinstance(vector, list) else list(vector)):
+        return packed
+    return array("d", vector)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactSignal:
+    """A trusted, memory-compact view of a validated signal.
+
+    ``origin`` and ``safety`` are flattened into slots, ``env`` and ``origin.kind`` are enums
+    and the vector is a packed ``array`` (``numpy.frombuffer(signal.vector, dtype=...)`` views
+    it without copying). Records are not validated; build them from signals that already
+    passed ingest. ``payload`` and the rarely set ``action_intent``, ``trace`` and ``resources``
+    keep their JSON form and are shared with :meth:`as_json_dict`, so they must not be mutated.
+    """
+
+    tsr_id: str
+    tsr_timestamp_ns: int
+    env: Environment
+    origin_kind: OriginKind
+    source_id: str
+    payload: JsonObject
+    veracity_score: float
+    hazard_flag: bool = False
+    digital_signature: Optional[str] = None
+    signature_alg: Optional[str] = None
+    namespace: Optional[str] = None
+    device_id: Optional[str] = None
+    software_version: Optional[str] = None
+    region: Optional[str] = None
+    agent_id: Optional[str] = None
+    action_intent: Optional[JsonObject] = None
+    vector: Optional[array] = None
+    tags: Optional[Tuple[str, ...]] = None
+    trace: Optional[JsonObject] = None
+    resources: Optional[Tuple[JsonObject, ...]] = None
+    context: str = DEFAULT_CONTEXT
+    signal_type: str = DEFAULT_SIGNAL_TYPE
+    schema_version: str = DEFAULT_SCHEMA_VERSION
+
+    @classmethod
+    def from_json_dict(cls, instance: JsonObject, vector_dtype: VectorDtype = "auto") -> "CompactSignal":
+        """Pack the JSON form of a valid signal.
+
+        ``vector_dtype="auto"`` stores the vector as float32 when that is exact (vectors that
+        came from float32 buffers) and as float64 otherwise, so conversion back is lossless.
+        ``"float32"`` always halves the vector at the cost of rounding.
+        """
+        if vector_dtype not in VECTOR_DTYPES:
+            supported: str = ", ".join(VECTOR_DTYPES)
+            raise ValueError(f"unsupported vector_dtype: {vector_dtype}. Supported: {supported}")
+        origin: JsonObject = cast(JsonObject, instance["origin"])
+        safety: JsonObject = cast(JsonObject, instance["safety"])
+        vector: Optional[Sequence[float]] = cast(Optional[Sequence[float]], instance.get("vector"))
+        tags: Optional[List[str]] = cast(Optional[List[str]], instance.get("tags"))
+        resources: Optional[List[JsonObject]] = cast(Optional[List[JsonObject]], instance.get("resources"))
+        return cls(
+            tsr_id=cast(str, instance["tsr_id"]),
+            tsr_timestamp_ns=cast(int, instance["tsr_timestamp_ns"]),
+            env=Environment(instance["env"]),
+            origin_kind=OriginKind(origin["kind"]),
+            source_id=cast(str, origin["source_id"]),
+            payload=cast(JsonObject, instance["payload"]),
+            veracity_score=cast(float, safety["veracity_score"]),
+            hazard_flag=cast(bool, safety.get("hazard_flag", False)),
+            digital_signature=cast(Optional[str], safety.get("digital_signature")),
+            signature_alg=_shared(cast(Optional[str], safety.get("signature_alg"))),
+            namespace=cast(Optional[str], origin.get("namespace")),
+            device_id=cast(Optional[str], origin.get("device_id")),
+            software_version=cast(Optional[str], origin.get("software_version")),
+            region=cast(Optional[str], origin.get("region")),
+            agent_id=cast(Optional[str], instance.get("agent_id")),
+            action_intent=cast(Optional[JsonObject], instance.get("action_intent")),
+            vector=_pack_vector(vector, vector_dtype) if vector is not None else None,
+            tags=tuple(tags) if tags is not None else None,
+            trace=cast(Optional[JsonObject], instance.get("trace")),
+            resources=tuple(resources) if resources is not None else None,
+            context=cast(str, _shared(cast(str, instance.get("@context", DEFAULT_CONTEXT)))),
+            signal_type=cast(str, _shared(cast(str, instance.get("@type", DEFAULT_SIGNAL_TYPE)))),
+            schema_version=cast(str, _shared(cast(str, instance.get("schema_version", DEFAULT_SCHEMA_VERSION)))),
+        )
+
+    @classmethod
+    def from_json(cls, record: Union[str, bytes], vector_dtype: VectorDtype = "auto") -> "CompactSignal":
+        """Pack one stored JSON document, such as a cold-store record.
+
+        Parsed with pydantic-core's JSON parser, which is several times faster than ``json.loads``
+        for vector-heavy records and shares repeated strings between documents.
+        """
+        return cls.from_json_dict(cast(JsonObject, from_json(record)), vector_dtype)
+
+    @classmethod
+    def from_signal(cls, signal: TSRSignal, vector_dtype: VectorDtype = "auto") -> "CompactSignal":
+        return cls.from_json_dict(signal._canonical().json_dict, vector_dtype)
+
+    def as_json_dict(self) -> JsonObject:
+        """The same dictionary, key order included, as ``TSRSignal.as_json_dict()``."""
+        origin: JsonObject = {"kind": self.origin_kind.value, "source_id": self.source_id}
+        for name in _ORIGIN_OPTIONAL_FIELDS:
+            value: Optional[str] = getattr(self, name)
+            if value is not None:
+                origin[name] = value
+        safety: JsonObject = {"veracity_score": self.veracity_score, "hazard_flag": self.hazard_flag}
+        if self.digital_signature is not None:
+            safety["digital_signature"] = self.digital_signature
+        if self.signature_alg is not None:
+            safety["signature_alg"] = self.signature_alg
+        instance: JsonObject = {
+            "@context": self.context,
+            "@type": self.signal_type,
+            "schema_version": self.schema_version,
+            "tsr_id": self.tsr_id,
+            "tsr_timestamp_ns": self.tsr_timestamp_ns,
+            "env": self.env.value,
+            "origin": origin,
+            "payload": self.payload,
+            "safety": safety,
+        }
+        if self.agent_id is not None:
+            instance["agent_id"] = self.agent_id
+        if self.action_intent is not None:
+            instance["action_intent"] = self.action_intent
+        if self.vector is not None:
+            instance["vector"] = self.vector.tolist()
+        if self.tags is not None:
+            instance["tags"] = list(self.tags)
+        if self.trace is not None:
+            instance["trace"] = self.trace
+        if self.resources is not None:
+            instance["resources"] = list(self.resources)
+        return instance
+
+    def to_signal(self) -> TSRSignal:
+        """Rebuild the model without re-running validation."""
+        origin: Origin = Origin.model_construct(
+            kind=self.origin_kind.value,
+            source_id=self.source_id,
+            namespace=self.namespace,
+            device_id=self.device_id,
+            software_version=self.software_version,
+            region=self.region,
+        )
+        safety: Safety = Safety.model_construct(
+            veracity_score=self.veracity_score,
+            hazard_flag=self.hazard_flag,
+            digital_signature=self.digital_signature,
+            signature_alg=self.signature_alg,
+        )
+        return TSRSignal.model_construct(
+            **{"@context": self.context, "@type": self.signal_type},
+            schema_version=self.schema_version,
+            tsr_id=self.tsr_id,
+            tsr_timestamp_ns=self.tsr_timestamp_ns,
+            env=self.env.value,
+            origin=origin,
+            payload=self.payload,
+            safety=safety,
+            agent_id=self.agent_id,
+            action_intent=ActionIntent.model_construct(**self.action_intent) if self.action_intent is not None else None,
+            vector=self.vector.tolist() if self.vector is not None else None,
+            tags=list(self.tags) if self.tags is not None else None,
+            trace=Trace.model_construct(**self.trace) if self.trace is not None else None,
+            resources=[ResourceRef.model_construct(**resource) for resource in self.resources] if self.resources is not None else None,
+        )
@@ -0,0 +1,135 @@
+"""Runtime support for validators compiled from JSON Schema by :mod:`opentsr.codegen`.
+
+A compiled check function takes a JSON instance and returns ``None`` when it is valid, or the
+``(path, message)`` of the first error jsonschema's ``iter_errors`` would yield for it.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from numbers import Number
+from pathlib import Path
+from typing import Callable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from uuid import UUID
+
+ErrorPath = Tuple[Union[str, int], ...]
+CheckResult = Optional[Tuple[ErrorPath, str]]
+CheckFunction = Callable[[object], CheckResult]
+
+_format_checker: Optional[object] = None
+
+
+def _is_number(instance: object) -> bool:
+    instance_type: type = type(instance)
+    if instance_type is float or instance_type is int:
+        return True
+    return instance_type is not bool and isinstance(instance, Number)
+
+
+def _is_integer(instance: object) -> bool:
+    if isinstance(instance, bool):
+        return False
+    return isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())
+
+
+def _is_uuid(instance: str) -> bool:
+    try:
+        UUID(instance)
+    except ValueError:
+        return False
+    return all(instance[position] == "-" for position in (8, 13, 18, 23))
+
+
+def _format_ok(instance: object, format_name: str) -> bool:
+    # Formats without a native check defer to jsonschema, so results match its installed format
+    # extras (e.g. ``uri`` is only checked when ``rfc3987`` is available).
+    global _format_checker
+    if _format_checker is None:
+        from jsonschema import FormatChecker
+
+        _format_checker = FormatChecker()
+    return cast(bool, _format_checker.conforms(instance, format_name))  # type: ignore[attr-defined]
+
+
+def _unbool(element: object, true: object = object(), false: object = object()) -> object:
+    if element is True:
+        return true
+    if element is False:
+        return false
+    return element
+
+
+def _equal(one: object, two: object) -> bool:
+    """JSON equality that keeps ``True``/``1`` and ``False``/``0`` distinct, as jsonschema does."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(left, right) for left, right in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return one.keys() == two.keys() and all(_equal(one[key], two[key]) for key in one)
+    return _unbool(one) == _unbool(two)
+
+
+def _unique(values: List[object]) -> bool:
+    if all(type(value) is str for value in values):
+        return len(set(values)) == len(values)
+    seen: List[object] = []
+    for value in values:
+        if any(_equal(value, previous) for previous in seen):
+            return False
+        seen.append(value)
+    return True
+
+
+def _extras_message(extras: List[object]) -> str:
+    verb: str = "was" if len(extras) == 1 else "were"
+    joined: str = ", ".join(repr(extra) for extra in extras)
+    return f"Additional properties are not allowed ({joined} {verb} unexpected)"
+
+
+class CompiledSchemaError:
+    """The first validation error, shaped like ``jsonschema.ValidationError`` for reporting."""
+
+    __slots__ = ("absolute_path", "message")
+
+    def __init__(self, absolute_path: ErrorPath, message: str) -> None:
+        self.absolute_path: ErrorPath = absolute_path
+        self.message: str = message
+
+
+class CompiledSchemaValidator:
+    """Drop-in for ``Draft202012Validator.iter_errors`` that stops at the first error."""
+
+    def __init__(self, check: CheckFunction, schema_sha256: str) -> None:
+        self.check: CheckFunction = check
+        self.schema_sha256: str = schema_sha256
+
+    def iter_errors(self, instance: object) -> Iterator[CompiledSchemaError]:
+        result: CheckResult = self.check(instance)
+        if result is not None:
+            yield CompiledSchemaError(*result)
+
+    def is_valid(self, instance: object) -> bool:
+        return self.check(instance) is None
+
+
+@lru_cache(maxsize=8)
+def compiled_validator(schema_path: Optional[str] = None) -> CompiledSchemaValidator:
+    """The bundled validator for ``spec/schema.json``, or one compiled at runtime for ``schema_path``."""
+    if schema_path is None:
+        try:
+            from ._compiled_schema import SCHEMA_SHA256, first_error
+        except ImportError:
+            from .models import _default_schema_path
+
+            return compiled_validator(str(_default_schema_path()))
+        return CompiledSchemaValidator(first_error, SCHEMA_SHA256)
+
+    from .codegen import render_validator_module, schema_digest
+
+    schema_bytes: bytes = Path(schema_path).read_bytes()
+    namespace: dict = {"__name__": "opentsr._compiled_runtime", "__package__": "opentsr"}
+    exec(compile(render_validator_module(schema_bytes), schema_path, "exec"), namespace)
+    return CompiledSchemaValidator(cast(CheckFunction, namespace["first_error"]), schema_digest(schema_bytes))
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+DEDUPE_MAGIC: bytes = b"OTSRDDUP"
+BLOOM_MAGIC: bytes = b"OTSRBLOM"
+DEDUPE_VERSION: int = 1
+GENERATION_PREFIX: str = "generation-"
+
+DEFAULT_WINDOW_NS: int = 24 * 3600 * 1_000_000_000
+DEFAULT_GENERATION_NS: int = 3600 * 1_000_000_000
+DEFAULT_MAX_FUTURE_NS: int = 5 * 60 * 1_000_000_000
+DEFAULT_EXPECTED_PER_GENERATION: int = 1_000_000
+DEFAULT_FALSE_POSITIVE_RATE: float = 0.001
+MAX_LOAD_FACTOR: float = 0.5
+
+SLOT_BYTES: int = 16
+_EMPTY_SLOT: bytes = bytes(SLOT_BYTES)
+_SCAN_BLOCK_BYTES: int = 4096
+# magic, version; zero-padded to one slot so slots stay aligned.
+_SET_HEADER = struct.Struct("<8sH6x")
+# magic, version, hash count, bit count.
+_BLOOM_HEADER = struct.Struct("<8sHHQ")
+
+
+def _tsr_id_key(tsr_id: str) -> bytes:
+    try:
+        key: bytes = bytes.fromhex(tsr_id.replace("-", ""))
+    except ValueError:
+        key = b""
+    if len(key) != SLOT_BYTES or key == _EMPTY_SLOT:
+        raise ValueError(f"tsr_id must be a UUID: {tsr_id}")
+    return key
+
+
+def _key_hashes(key: bytes) -> Tuple[int, int]:
+    digest: bytes = hashlib.blake2b(key, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a blake2b digest of the key."""
+
+    def __init__(self, bit_count: int, hash_count: int, bits: Optional[bytearray] = None) -> None:
+        self.bit_count: int = bit_count
+        self.hash_count: int = hash_count
+        self.bits: bytearray = bits if bits is not None else bytearray((bit_count + 7) // 8)
+
+    @classmethod
+    def sized(cls, expected_items: int, false_positive_rate: float) -> "_BloomFilter":
+        bit_count: int = max(64, math.ceil(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        hash_count: int = max(1, round(bit_count / expected_items * math.log(2)))
+        return cls(bit_count, hash_count)
+
+    def add(self, first: int, step: int) -> None:
+        for index in range(self.hash_count):
+            position: int = (first + index * step) % self.bit_count
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, first: int, step: int) -> bool:
+        for index in range(self.hash_count):
+            position: int = (first + index * step) % self.bit_count
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def save(self, path: Path) -> None:
+        with path.open("wb") as bloom_file:
+            bloom_file.write(_BLOOM_HEADER.pack(BLOOM_MAGIC, DEDUPE_VERSION, self.hash_count, self.bit_count))
+            bloom_file.write(self.bits)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["_BloomFilter"]:
+        data: bytes = path.read_bytes()
+        if len(data) < _BLOOM_HEADER.size:
+            return None
+        magic, version, hash_count, bit_count = _BLOOM_HEADER.unpack_from(data)
+        bits = bytearray(data[_BLOOM_HEADER.size :])
+        if magic != BLOOM_MAGIC or version != DEDUPE_VERSION or len(bits) != (bit_count + 7) // 8:
+            return None
+        return cls(bit_count, hash_count, bits)
+
+
+class _SlotTable:
+    """Memory-mapped open-addressing hash set of 16-byte keys with linear probing."""
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        self.path: Path = path
+        if not path.exists():
+            _create_table(path, capacity)
+        self._file = path.open("r+b")
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, version = _SET_HEADER.unpack_from(self._map)
+        if magic != DEDUPE_MAGIC or version != DEDUPE_VERSION:
+            self.close()
+            raise ValueError(f"not an OpenTSR dedupe set: {path}")
+        self.capacity: int = (len(self._map) - _SET_HEADER.size) // SLOT_BYTES
+        self.count: int = 0
+
+    def keys(self) -> Iterator[bytes]:
+        view: mmap.mmap = self._map
+        for block_start in range(_SET_HEADER.size, len(view), _SCAN_BLOCK_BYTES):
+            block: bytes = view[block_start : block_start + _SCAN_BLOCK_BYTES]
+            if block.count(0) == len(block):
+                continue
+            for offset in range(0, len(block), SLOT_BYTES):
+                key: bytes = block[offset : offset + SLOT_BYTES]
+                if key != _EMPTY_SLOT:
+                    yield key
+
+    def _find(self, key: bytes, first: int) -> Tuple[int, bool]:
+        mask: int = self.capacity - 1
+        slot: int = first & mask
+        while True:
+            offset: int = _SET_HEADER.size + slot * SLOT_BYTES
+            existing: bytes = self._map[offset : offset + SLOT_BYTES]
+            if existing == key:
+                return offset, True
+            if existing == _EMPTY_SLOT:
+                return offset, False
+            slot = (slot + 1) & mask
+
+    def contains(self, key: bytes, first: int) -> bool:
+        return self._find(key, first)[1]
+
+    def add(self, key: bytes, first: int) -> bool:
+        if (self.count + 1) > self.capacity * MAX_LOAD_FACTOR:
+            self._grow()
+        offset, found = self._find(key, first)
+        if found:
+            return False
+        self._map[offset : offset + SLOT_BYTES] = key
+        self.count += 1
+        return True
+
+    def _grow(self) -> None:
+        temp_path: Path = self.path.with_suffix(".tmp")
+        temp_path.unlink(missing_ok=True)
+        grown = _SlotTable(temp_path, self.capacity * 2)
+        for key in self.keys():
+            grown.add(key, _key_hashes(key)[0])
+        grown.flush()
+        grown.close()
+        self.close()
+        os.replace(temp_path, self.path)
+        self._file = self.path.open("r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self.capacity *= 2
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+
+def _create_table(path: Path, capacity: int) -> None:
+    with path.open("wb") as table_file:
+        table_file.write(_SET_HEADER.pack(DEDUPE_MAGIC, DEDUPE_VERSION))
+        # Sparse on most filesystems: disk is only used for pages that receive keys.
+        table_file.truncate(_SET_HEADER.size + capacity * SLOT_BYTES)
+
+
+class _Generation:
+    def __init__(self, set_path: Path, capacity: int, expected_items: int, false_positive_rate: float) -> None:
+        self.set_path: Path = set_path
+        self.bloom_path: Path = set_path.with_suffix(".bloom")
+        self.table = _SlotTable(set_path, capacity)
+
+        # A saved filter is only trusted after a clean close; it is removed while the set is
+        # open so a crash forces a rebuild from the exact set.
+        bloom: Optional[_BloomFilter] = _BloomFilter.load(self.bloom_path) if self.bloom_path.exists() else None
+        self.bloom_path.unlink(missing_ok=True)
+        rebuild: bool = bloom is None
+        self.bloom: _BloomFilter = bloom if bloom is not None else _BloomFilter.sized(expected_items, false_positive_rate)
+        for key in self.table.keys():
+            self.table.count += 1
+            if rebuild:
+                self.bloom.add(*_key_hashes(key))
+
+    def close(self) -> None:
+        self.table.flush()
+        self.table.close()
+        self.bloom.save(self.bloom_path)
+
+
+class DedupeIndex:
+    """Persistent set of accepted ``tsr_id`` values for idempotent ingest.
+
+    IDs are partitioned into generations of ``generation_ns`` by their UUIDv7 timestamp.
+    Each generation pairs an in-memory Bloom filter with an exact, memory-mapped hash set
+    on disk, so a lookup is O(1): new IDs are usually answered by the filter alone and only
+    filter hits probe the set. Generations older than ``window_ns`` are deleted, which
+    bounds memory and disk; an ID older than the window is no longer recognized. IDs dated
+    more than ``max_future_ns`` ahead of the clock are not recorded either, so client-chosen
+    timestamps cannot open generations beyond ``max_generations``.
+    Filters are saved on :meth:`close` and rebuilt from the sets after an unclean shutdown.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        window_ns: int = DEFAULT_WINDOW_NS,
+        generation_ns: int = DEFAULT_GENERATION_NS,
+        expected_per_generation: int = DEFAULT_EXPECTED_PER_GENERATION,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        clock: Callable[[], int] = time.time_ns,
+        max_future_ns: int = DEFAULT_MAX_FUTURE_NS,
+    ) -> None:
+        if generation_ns < 1_000_000 or window_ns < generation_ns:
+            raise ValueError("generation_ns must be >= 1 ms and window_ns must be >= generation_ns")
+        if expected_per_generation < 1:
+            raise ValueError("expected_per_generation must be >= 1")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        if max_future_ns < 0:
+            raise ValueError("max_future_ns must be >= 0")
+
+        self.directory: Path = directory
+        self.window_ns: int = window_ns
+        self.generation_ns: int = generation_ns
+        self.expected_per_generation: int = expected_per_generation
+        self.false_positive_rate: float = false_positive_rate
+        self._clock: Callable[[], int] = clock
+        self.max_future_ns: int = max_future_ns
+        # Every generation from the oldest in the window to the newest allowed by the skew.
+        self.max_generations: int = (window_ns + max_future_ns) // generation_ns + 2
+        self._capacity: int = 1 << math.ceil(math.log2(expected_per_generation / MAX_LOAD_FACTOR))
+        self._generations: Dict[int, _Generation] = {}
+
+        directory.mkdir(parents=True, exist_ok=True)
+        oldest: int = self._oldest_generation()
+        newest: int = self._newest_generation()
+        for set_path in sorted(directory.glob(f"{GENERATION_PREFIX}*.set")):
+            generation: int = int(set_path.stem[len(GENERATION_PREFIX) :])
+            if generation < oldest or generation > newest:
+                _remove_generation_files(set_path)
+            else:
+                self._generations[generation] = self._open_generation(set_path)
+
+    def __enter__(self) -> "DedupeIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(generation.table.count for generation in self._generations.values())
+
+    def __contains__(self, tsr_id: object) -> bool:
+        if not isinstance(tsr_id, str):
+            return False
+        try:
+            key: bytes = _tsr_id_key(tsr_id)
+        except ValueError:
+            return False
+        generation: Optional[_Generation] = self._generations.get(self._generation_of(key))
+        if generation is None:
+            return False
+        first, step = _key_hashes(key)
+        return generation.bloom.might_contain(first, step) and generation.table.contains(key, first)
+
+    def add(self, tsr_id: str) -> bool:
+        """Record ``tsr_id``; returns False if it was already present or is outside the window."""
+        key: bytes = _tsr_id_key(tsr_id)
+        generation_number: int = self._generation_of(key)
+        oldest: int = self._oldest_generation()
+        if generation_number < oldest or generation_number > self._newest_generation():
+            return False
+        generation: Optional[_Generation] = self._generations.get(generation_number)
+        if generation is None:
+            self._expire(oldest)
+            if len(self._generations) >= self.max_generations:
+                # Only reachable if the clock moved backwards; never grow past the bound.
+                return False
+            set_path: Path = self.directory / f"{GENERATION_PREFIX}{generation_number:012d}.set"
+            generation = self._open_generation(set_path)
+            self._generations[generation_number] = generation
+
+        first, step = _key_hashes(key)
+        if generation.bloom.might_contain(first, step) and generation.table.contains(key, first):
+            return False
+        generation.table.add(key, first)
+        generation.bloom.add(first, step)
+        return True
+
+    def expire(self) -> int:
+        """Delete generations older than the window; returns how many were dropped."""
+        return self._expire(self._oldest_generation())
+
+    def flush(self) -> None:
+        for generation in self._generations.values():
+            generation.table.flush()
+
+    def close(self) -> None:
+        for generation in self._generations.values():
+            generation.close()
+        self._generations.clear()
+
+    def _generation_of(self, key: bytes) -> int:
+        unix_ms: int = int.from_bytes(key[:6], "big")
+        return unix_ms * 1_000_000 // self.generation_ns
+
+    def _oldest_generation(self) -> int:
+        return (self._clock() - self.window_ns) // self.generation_ns
+
+    def _newest_generation(self) -> int:
+        return (self._clock() + self.max_future_ns) // self.generation_ns
+
+    def _open_generation(self, set_path: Path) -> _Generation:
+        return _Generation(set_path, self._capacity, self.expected_per_generation, self.false_positive_rate)
+
+    def _expire(self, oldest: int) -> int:
+        expired = [number for number in self._generations if number < oldest]
+        for number in expired:
+            generation: _Generation = self._generations.pop(number)
+            generation.table.close()
+            _remove_generation_files(generation.set_path)
+        return len(expired)
+
+
+def _remove_generation_files(set_path: Path) -> None:
+    set_path.unlink(missing_ok=True)
+    set_path.with_suffix(".bloom").unlink(missing_ok=True)
@@ -0,0 +1,377 @@
+"""asyncio HTTP stand-in for the Ingest API Service.
+
+Run locally with ``python -m opentsr.ingest_server --cold-store-dir ./var/cold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from .cold_store import ColdStore, DirectoryColdStore
+from .metrics import IngestMetrics, SignalObservation
+from .models import SCHEMA_ENGINES, SchemaEngine, _check_schema_engine
+from .parallel_ingest import CheckedItem, _CheckConfig, _check_chunk, _warm_worker
+from .reference_ingest import (
+    DEFAULT_MAX_LINE_BYTES,
+    IngestResult,
+    ValidationMode,
+    _AcceptedSignal,
+    _check_validation_mode,
+    _default_hot_index_path,
+    _IngestWriter,
+)
+from .signing import SigningKey
+
+if TYPE_CHECKING:
+    from .dedupe import DedupeIndex
+    from .metadata_index import MetadataIndex
+    from .vector_index import VectorIndex
+
+JsonObject = Dict[str, object]
+_WriteItem = Tuple[_AcceptedSignal, "asyncio.Future[IngestResult]", Optional[SignalObservation]]
+_WriteOutcome = Union[IngestResult, Exception]
+
+INGEST_PATH: str = "/v1/signals"
+HEALTH_PATH: str = "/healthz"
+METRICS_PATH: str = "/metrics"
+MAX_HEADER_COUNT: int = 100
+DEFAULT_MAX_IN_FLIGHT: int = 1024
+DEFAULT_WRITE_BATCH_SIZE: int = 256
+
+
+class _HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status: HTTPStatus = status
+        self.message: str = message
+
+
+class IngestServer:
+    """HTTP/1.1 ingest endpoint with the ``ingest_signal_json`` 400/202 contract.
+
+    ``POST /v1/signals`` validates the body on ``executor`` (threads by default; a
+    ``ProcessPoolExecutor`` spreads validation across cores) and hands accepted signals to
+    one writer task that persists them in coalesced batches. Bodies larger than
+    ``max_body_bytes`` are refused with 413 from ``Content-Length`` or while reading chunks,
+    before the whole body is buffered. More than ``max_in_flight`` concurrent requests get
+    429, and a full write queue (the stores are falling behind) gets 503 with ``Retry-After``.
+    Every queued write holds an in-flight slot, so ``write_queue_size`` (default: half of
+    ``max_in_flight``) must be smaller than ``max_in_flight`` for the queue to ever fill.
+    A signal whose write raises gets 500, and buffered hot index lines and metadata rows are
+    flushed after every write batch (fsync is left to the stores' own group commits).
+    With ``metrics``, every result is recorded and ``GET /metrics`` serves them in the
+    Prometheus text format.
+    """
+
+    def __init__(
+        self,
+        cold_store_dir: Path,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        hot_index_path: Optional[Path] = None,
+        schema_path: Optional[Path] = None,
+        verify_signatures: bool = False,
+        signature_key: Optional[SigningKey] = None,
+        validation_mode: ValidationMode = "both",
+        cold_store: Optional[ColdStore] = None,
+        vector_index: Optional[VectorIndex] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        schema_engine: SchemaEngine = "jsonschema",
+        metrics: Optional[IngestMetrics] = None,
+        executor: Optional[Executor] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        write_queue_size: Optional[int] = None,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        max_body_bytes: int = DEFAULT_MAX_LINE_BYTES,
+    ) -> None:
+        _check_validation_mode(validation_mode)
+        _check_schema_engine(schema_engine)
+        if write_queue_size is None:
+            write_queue_size = max(1, max_in_flight // 2)
+        elif not 1 <= write_queue_size < max_in_flight:
+            raise ValueError("write_queue_size must be >= 1 and smaller than max_in_flight")
+        self.host: str = host
+        self.port: int = port
+        self.max_in_flight: int = max_in_flight
+        self.write_batch_size: int = write_batch_size
+        self.max_body_bytes: int = max_body_bytes
+        self._config = _CheckConfig(
+            validation_mode=validation_mode,
+            schema_path=schema_path,
+            schema_engine=schema_engine,
+            verify_signatures=verify_signatures,
+            signature_key=signature_key,
+            observe=metrics is not None,
+            capture_attributes=metrics is not None and bool(metrics.sinks),
+        )
+        self.metrics: Optional[IngestMetrics] = metrics
+        self._writer = _IngestWriter(
+            cold_store=cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir),
+            hot_index_path=_default_hot_index_path(cold_store_dir, hot_index_path),
+            vector_index=vector_index,
+            dedupe_index=dedupe_index,
+            metadata_index=metadata_index,
+        )
+        self._owns_executor: bool = executor is None
+        self._executor: Executor = executor if executor is not None else ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self._write_executor = ThreadPoolExecutor(max_workers=1)
+        self._write_queue_size: int = write_queue_size
+        self._write_queue: Optional[asyncio.Queue[_WriteItem]] = None
+        self._write_task: Optional[asyncio.Task[None]] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.in_flight: int = 0
+
+    async def start(self) -> None:
+        _warm_worker(self._config)
+        self._write_queue = asyncio.Queue(maxsize=self._write_queue_size)
+        self._write_task = asyncio.create_task(self._write_loop())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        sockets = self._server.sockets
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        if self._write_task is not None:
+            self._write_task.cancel()
+            try:
+                await self._write_task
+            except asyncio.CancelledError:
+                pass
+            self._write_task = None
+        self._write_executor.shutdown(wait=True)
+        self._writer.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def _ingest_body(self, body: bytes) -> Tuple[HTTPStatus, JsonObject]:
+        """Validate one request body off the event loop and queue it for the batched writer."""
+        loop = asyncio.get_running_loop()
+        checked, observations = await loop.run_in_executor(self._executor, _check_chunk, [body], self._config)
+        outcome: CheckedItem = checked[0]
+        observation: Optional[SignalObservation] = observations[0] if observations else None
+        result: IngestResult
+        if isinstance(outcome, IngestResult):
+            result = outcome
+        else:
+            assert self._write_queue is not None
+            written: asyncio.Future[IngestResult] = loop.create_future()
+            try:
+                self._write_queue.put_nowait((outcome, written, observation))
+            except asyncio.QueueFull:
+                raise _HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "write queue is full; retry later") from None
+            try:
+                result = await written
+            except Exception as exc:
+                raise _HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, f"write failed: {exc}") from exc
+        if self.metrics is not None:
+            self.metrics.record(result, observation)
+        return HTTPStatus(result.status_code), asdict(result)
+
+    async def _write_loop(self) -> None:
+        assert self._write_queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_WriteItem] = [await self._write_queue.get()]
+            while len(batch) < self.write_batch_size and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+            try:
+                outcomes: List[_WriteOutcome] = await loop.run_in_executor(
+                    self._write_executor, self._write_batch, [(accepted, observation) for accepted, _, observation in batch]
+                )
+            except Exception as exc:
+                for _, written, _ in batch:
+                    if not written.done():
+                        written.set_exception(exc)
+            else:
+                for (_, written, _), outcome in zip(batch, outcomes):
+                    if written.done():
+                        continue
+                    if isinstance(outcome, Exception):
+                        written.set_exception(outcome)
+                    else:
+                        written.set_result(outcome)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[_AcceptedSignal, Optional[SignalObservation]]]) -> List[_WriteOutcome]:
+        """Write each signal, keeping a failure to the signal that raised it, then flush the writer."""
+        outcomes: List[_WriteOutcome] = []
+        for accepted, observation in batch:
+            try:
+                outcomes.append(self._writer.write(accepted, observation))
+            except Exception as exc:
+                outcomes.append(exc)
+        self._writer.flush()
+        return outcomes
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive: bool = True
+            while keep_alive:
+                request_line: bytes = await reader.readline()
+                if not request_line:
+                    break
+                status, payload, keep_alive = await self._handle_request(request_line, reader)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(
+        self, request_line: bytes, reader: asyncio.StreamReader
+    ) -> Tuple[HTTPStatus, Union[JsonObject, str], bool]:
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"status_code": 400, "message": "malformed request line"}, False
+        headers: Dict[str, str] = await _read_headers(reader)
+        keep_alive: bool = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+        try:
+            if target == HEALTH_PATH and method == "GET":
+                return HTTPStatus.OK, {"status": "ok", "in_flight": self.in_flight}, keep_alive
+            if target == METRICS_PATH and method == "GET" and self.metrics is not None:
+                return HTTPStatus.OK, self.metrics.prometheus_text(), keep_alive
+            if target != INGEST_PATH:
+                raise _HttpError(HTTPStatus.NOT_FOUND, f"unknown path: {target}")
+            if method != "POST":
+                raise _HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+            if self.in_flight >= self.max_in_flight:
+                # The body is left unread, so the connection cannot be reused.
+                keep_alive = False
+                raise _HttpError(HTTPStatus.TOO_MANY_REQUESTS, "too many in-flight requests; retry later")
+
+            self.in_flight += 1
+            try:
+                body: bytes = await self._read_body(headers, reader)
+                status, payload = await self._ingest_body(body)
+            finally:
+                self.in_flight -= 1
+            return status, payload, keep_alive
+        except _HttpError as error:
+            if error.status in (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, HTTPStatus.BAD_REQUEST):
+                # The rest of the body is unread or unparseable.
+                keep_alive = False
+            return error.status, {"status_code": int(error.status), "message": error.message}, keep_alive
+
+    async def _read_body(self, headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks: List[bytes] = []
+            total: int = 0
+            while True:
+                size_line: bytes = await reader.readline()
+                chunk_size: int = _chunk_size(size_line)
+                if chunk_size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                total += chunk_size
+                if total > self.max_body_bytes:
+                    raise _HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body exceeds {self.max_body_bytes} bytes")
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readline()
+
+        content_length: str = headers.get("content-length", "")
+        if not content_length.isdigit():
+            raise _HttpError(HTTPStatus.LENGTH_REQUIRED, "Content-Length or chunked Transfer-Encoding is required")
+        length: int = int(content_length)
+        if length > self.max_body_bytes:
+            raise _HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"body exceeds {self.max_body_bytes} bytes")
+        return await reader.readexactly(length)
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADER_COUNT + 1):
+        line: bytes = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise ValueError("too many request headers")
+
+
+def _chunk_size(size_line: bytes) -> int:
+    """The size from a chunk-size line; 400 when it is not a hexadecimal count."""
+    size_field: bytes = size_line.split(b";", 1)[0].strip() or b"0"
+    try:
+        chunk_size: int = int(size_field, 16)
+    except ValueError:
+        chunk_size = -1
+    if chunk_size < 0:
+        raise _HttpError(HTTPStatus.BAD_REQUEST, f"malformed chunk size: {size_field.decode('latin-1')}")
+    return chunk_size
+
+
+def _response(status: HTTPStatus, payload: Union[JsonObject, str], keep_alive: bool) -> bytes:
+    body: bytes
+    content_type: str
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+    else:
+        body, content_type = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8"), "application/json"
+    lines: List[str] = [
+        f"HTTP/1.1 {int(status)} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status in (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE):
+        lines.append("Retry-After: 1")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the OpenTSR reference ingest HTTP server.")
+    parser.add_argument("--cold-store-dir", type=Path, required=True)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--validation-mode", default="both", choices=("pydantic", "schema", "both"))
+    parser.add_argument("--schema-engine", default="jsonschema", choices=SCHEMA_ENGINES)
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--metrics", action="store_true", help=f"record ingest metrics and serve them at {METRICS_PATH}")
+    args = parser.parse_args()
+
+    server = IngestServer(
+        cold_store_dir=args.cold_store_dir,
+        host=args.host,
+        port=args.port,
+        validation_mode=args.validation_mode,
+        schema_engine=args.schema_engine,
+        max_in_flight=args.max_in_flight,
+        metrics=IngestMetrics() if args.metrics else None,
+    )
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+
+from .cold_store import ColdStore, DirectoryColdStore, _fsync_directory
+from .models import SchemaEngine, SchemaValidator
+from .reference_ingest import (
+    IngestResult,
+    ValidationMode,
+    _accepted_from_record,
+    _AcceptedSignal,
+    _check_payload,
+    _check_validation_mode,
+    _default_hot_index_path,
+    _duplicate,
+    _IngestWriter,
+    _invalid_json,
+    _rejected,
+    _schema_validator_for,
+)
+from .signing import SigningKey
+
+if TYPE_CHECKING:
+    from .blob_verify import BlobVerifier
+    from .dedupe import DedupeIndex
+    from .metadata_index import MetadataIndex
+    from .metrics import IngestMetrics, SignalObservation
+    from .vector_index import VectorIndex
+
+JsonObject = Dict[str, object]
+
+WAL_PREFIX: str = "wal-"
+WAL_SUFFIX: str = ".log"
+CHECKPOINT_FILE_NAME: str = "checkpoint.json"
+DEFAULT_GROUP_COMMIT_RECORDS: int = 256
+DEFAULT_CHECKPOINT_BYTES: int = 64 * 1024 * 1024
+
+# Record length and CRC-32 of the canonical JSON record that follows.
+_WAL_FRAME = struct.Struct(">II")
+
+
+@dataclass(frozen=True)
+class _Logged:
+    """A signal appended to the WAL and waiting for its group commit."""
+
+    seq: int
+    accepted: _AcceptedSignal
+    observation: Optional[SignalObservation]
+
+
+def _record_tsr_id(record: bytes) -> str:
+    return cast(str, cast(JsonObject, json.loads(record))["tsr_id"])
+
+
+class IngestSession:
+    """Long-lived ingest with a write-ahead log, group commit and crash recovery.
+
+    Accepted signals are appended to ``wal-NNNNNN.log`` under ``wal_dir`` (default
+    ``cold_store_dir / "wal"``) as CRC-checked frames. A commit fsyncs the WAL once for every
+    signal appended since the previous commit, then writes them to the cold store, hot index
+    and optional indexes in order; a 202 is returned only after that fsync. Concurrent
+    :meth:`ingest_signal` callers share commits, and :meth:`ingest` commits every
+    ``group_commit_records`` accepted signals.
+
+    Once the WAL reaches ``checkpoint_bytes`` (and on :meth:`close`), the stores are flushed and
+    fsynced, ``checkpoint.json`` records the new WAL segment and hot index size, and older
+    segments are deleted. Opening a session truncates a torn WAL or hot index tail and replays
+    the WAL since the last checkpoint, writing only what each store is missing.
+
+    The default cold store is a :class:`DirectoryColdStore` with ``fsync=True``.
+    """
+
+    def __init__(
+        self,
+        cold_store_dir: Path,
+        hot_index_path: Optional[Path] = None,
+        schema_path: Optional[Path] = None,
+        verify_signatures: bool = False,
+        signature_key: Optional[SigningKey] = None,
+        validation_mode: ValidationMode = "both",
+        cold_store: Optional[ColdStore] = None,
+        vector_index: Optional[VectorIndex] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        schema_engine: SchemaEngine = "jsonschema",
+        metrics: Optional[IngestMetrics] = None,
+        blob_verifier: Optional[BlobVerifier] = None,
+        wal_dir: Optional[Path] = None,
+        group_commit_records: int = DEFAULT_GROUP_COMMIT_RECORDS,
+        checkpoint_bytes: int = DEFAULT_CHECKPOINT_BYTES,
+    ) -> None:
+        _check_validation_mode(validation_mode)
+        if group_commit_records < 1:
+            raise ValueError("group_commit_records must be >= 1")
+        if checkpoint_bytes < 1:
+            raise ValueError("checkpoint_bytes must be >= 1")
+
+        self.validation_mode: ValidationMode = validation_mode
+        self.verify_signatures: bool = verify_signatures
+        self.signature_key: Optional[SigningKey] = signature_key
+        self.metrics: Optional[IngestMetrics] = metrics
+        self.blob_verifier: Optional[BlobVerifier] = blob_verifier
+        self.wal_dir: Path = wal_dir if wal_dir is not None else cold_store_dir / "wal"
+        self.group_commit_records: int = group_commit_records
+        self.checkpoint_bytes: int = checkpoint_bytes
+        self.commits: int = 0
+        self.recovered: int = 0
+
+        self._validator: Optional[SchemaValidator] = _schema_validator_for(validation_mode, schema_path, schema_engine)
+        self._writer = _IngestWriter(
+            cold_store=cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir, fsync=True),
+            hot_index_path=_default_hot_index_path(cold_store_dir, hot_index_path),
+            vector_index=vector_index,
+            dedupe_index=dedupe_index,
+            metadata_index=metadata_index,
+        )
+        # Appends take only the append lock, so callers keep logging while a commit fsyncs.
+        self._append_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        # The dedupe index is not thread-safe; callers check it while a commit adds to it.
+        self._dedupe_lock = threading.Lock()
+        self._logged: List[_Logged] = []
+        self._results: Dict[int, IngestResult] = {}
+        self._next_seq: int = 0
+        self._committed_seq: int = -1
+        self._wal_bytes: int = 0
+        self._failure: Optional[BaseException] = None
+        self._closed: bool = False
+
+        self.wal_dir.mkdir(parents=True, exist_ok=True)
+        self._segment_number: int = self._recover()
+        self._wal_file: BinaryIO = self._start_segment(self._segment_number)
+
+    def __enter__(self) -> "IngestSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def ingest(self, payloads: Iterable[JsonObject]) -> List[IngestResult]:
+        """Ingest payloads with :func:`ingest_batch` semantics; one result per payload, in order."""
+        results: List[Optional[IngestResult]] = []
+        waiting: List[Tuple[int, int]] = []
+        for payload in payloads:
+            checked, observation = self._check(payload)
+            if isinstance(checked, IngestResult):
+                self._record(checked, observation)
+                results.append(checked)
+                continue
+            seq: int = self._log(checked, observation)
+            waiting.append((len(results), seq))
+            results.append(None)
+            if len(waiting) % self.group_commit_records == 0:
+                self._commit_through(seq)
+        if waiting:
+            self._commit_through(waiting[-1][1])
+        for position, seq in waiting:
+            results[position] = self._results.pop(seq)
+        return cast(List[IngestResult], results)
+
+    def ingest_signal(self, payload: JsonObject) -> IngestResult:
+        """Ingest one payload; safe to call from many threads, which then share WAL fsyncs."""
+        checked, observation = self._check(payload)
+        if isinstance(checked, IngestResult):
+            self._record(checked, observation)
+            return checked
+        seq: int = self._log(checked, observation)
+        self._commit_through(seq)
+        return self._results.pop(seq)
+
+    def ingest_signal_json(self, payload_json: str) -> IngestResult:
+        try:
+            payload: object = json.loads(payload_json)
+        except json.JSONDecodeError as exc:
+            return self._record(_invalid_json(str(exc)))
+        if not isinstance(payload, dict):
+            return self._record(_invalid_json("root must be an object"))
+        return self.ingest_signal(payload)
+
+    def commit(self) -> None:
+        """Make every signal logged so far durable in the WAL and apply it to the stores."""
+        with self._commit_lock:
+            self._check_open()
+            self._commit()
+
+    def checkpoint(self) -> None:
+        """Commit, flush the stores and start a fresh WAL segment."""
+        with self._commit_lock:
+            self._check_open()
+            self._checkpoint()
+
+    def close(self) -> None:
+        with self._commit_lock:
+            if self._closed:
+                return
+            if self._failure is None:
+                self._checkpoint()
+            with self._append_lock:
+                self._closed = True
+                self._wal_file.close()
+            self._writer.close()
+
+    def _check(self, payload: JsonObject) -> Tuple[Union[IngestResult, _AcceptedSignal], Optional[SignalObservation]]:
+        observation: Optional[SignalObservation] = self.metrics.observation() if self.metrics is not None else None
+        if self._writer.dedupe_index is not None and isinstance(payload, dict):
+            with self._dedupe_lock:
+                if payload.get("tsr_id") in self._writer.dedupe_index:
+                    return _duplicate(), observation
+        checked: Union[IngestResult, _AcceptedSignal] = _check_payload(
+            payload, self.validation_mode, self._validator, self.verify_signatures, self.signature_key, observation
+        )
+        if (
+            self.blob_verifier is not None
+            and self.blob_verifier.mode == "reject"
+            and isinstance(checked, _AcceptedSignal)
+            and checked.blobs
+        ):
+            findings = self.blob_verifier.submit(checked.tsr_id, checked.blobs).result()
+            if findings:
+                checked = _rejected(f"invalid signal: {findings[0].message}")
+        return checked, observation
+
+    def _record(self, result: IngestResult, observation: Optional[SignalObservation] = None) -> IngestResult:
+        if self.metrics is not None:
+            with self._metrics_lock:
+                self.metrics.record(result, observation)
+        return result
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("ingest session is closed")
+        if self._failure is not None:
+            raise RuntimeError("ingest session failed to apply a commit; reopen it to replay the WAL") from self._failure
+
+    def _log(self, accepted: _AcceptedSignal, observation: Optional[SignalObservation]) -> int:
+        frame: bytes = _WAL_FRAME.pack(len(accepted.record), zlib.crc32(accepted.record)) + accepted.record
+        with self._append_lock:
+            self._check_open()
+            self._wal_file.write(frame)
+            self._wal_bytes += len(frame)
+            seq: int = self._next_seq
+            self._next_seq += 1
+            self._logged.append(_Logged(seq, accepted, observation))
+        return seq
+
+    def _commit_through(self, seq: int) -> None:
+        with self._commit_lock:
+            if seq <= self._committed_seq:
+                return
+            self._check_open()
+            self._commit()
+            if self._wal_bytes >= self.checkpoint_bytes:
+                self._checkpoint()
+
+    def _take_logged(self) -> List[_Logged]:
+        logged: List[_Logged] = self._logged
+        self._logged = []
+        self._wal_file.flush()
+        return logged
+
+    def _commit(self) -> None:
+        with self._append_lock:
+            logged: List[_Logged] = self._take_logged()
+        self._apply(logged)
+
+    def _apply(self, logged: List[_Logged]) -> None:
+        if not logged:
+            return
+        try:
+            os.fsync(self._wal_file.fileno())
+            self.commits += 1
+            for entry in logged:
+                with self._dedupe_lock:
+                    result: IngestResult = self._writer.write(entry.accepted, entry.observation)
+                if (
+                    self.blob_verifier is not None
+                    and self.blob_verifier.mode == "audit"
+                    and result.status_code == 202
+                    and entry.accepted.blobs
+                ):
+                    self.blob_verifier.submit_audit(entry.accepted.tsr_id, entry.accepted.blobs)
+                self._results[entry.seq] = self._record(result, entry.observation)
+        except BaseException as exc:
+            self._failure = exc
+            raise
+        self._committed_seq = logged[-1].seq
+
+    def _checkpoint(self) -> None:
+        with self._append_lock:
+            self._apply(self._take_logged())
+            self._writer.sync()
+            self._wal_file.close()
+            self._segment_number += 1
+            self._wal_file = self._start_segment(self._segment_number)
+
+    def _segment_path(self, segment_number: int) -> Path:
+        return self.wal_dir / f"{WAL_PREFIX}{segment_number:06d}{WAL_SUFFIX}"
+
+    def _segment_numbers(self) -> List[int]:
+        numbers: List[int] = []
+        for segment_path in self.wal_dir.glob(f"{WAL_PREFIX}*{WAL_SUFFIX}"):
+            digits: str = segment_path.name[len(WAL_PREFIX) : -len(WAL_SUFFIX)]
+            if digits.isdigit():
+                numbers.append(int(digits))
+        return sorted(numbers)
+
+    def _hot_index_size(self) -> int:
+        hot_index_path: Path = self._writer.hot_index_path
+        return hot_index_path.stat().st_size if hot_index_path.is_file() else 0
+
+    def _start_segment(self, segment_number: int) -> BinaryIO:
+        """Point the checkpoint at ``segment_number`` and drop the segments it supersedes."""
+        checkpoint_path: Path = self.wal_dir / CHECKPOINT_FILE_NAME
+        temporary_path: Path = checkpoint_path.with_suffix(".tmp")
+        with temporary_path.open("w", encoding="utf-8") as checkpoint_file:
+            json.dump({"wal_segment": segment_number, "hot_index_bytes": self._hot_index_size()}, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_path, checkpoint_path)
+        _fsync_directory(self.wal_dir)
+        for number in self._segment_numbers():
+            if number < segment_number:
+                self._segment_path(number).unlink()
+        self._wal_bytes = 0
+        return self._segment_path(segment_number).open("ab")
+
+    def _recover(self) -> int:
+        """Replay the WAL since the last checkpoint; returns the number of the next segment."""
+        segment_numbers: List[int] = self._segment_numbers()
+        checkpoint_path: Path = self.wal_dir / CHECKPOINT_FILE_NAME
+        first_segment: int = segment_numbers[0] if segment_numbers else 0
+        hot_index_bytes: int = 0
+        if checkpoint_path.is_file():
+            checkpoint: JsonObject = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+            first_segment = cast(int, checkpoint["wal_segment"])
+            hot_index_bytes = cast(int, checkpoint["hot_index_bytes"])
+
+        records: List[bytes] = []
+        for segment_number in segment_numbers:
+            if segment_number < first_segment:
+                continue
+            complete: bool = self._read_segment(self._segment_path(segment_number), records)
+            if not complete:
+                # Nothing after a torn or corrupt frame was acknowledged.
+                for later in segment_numbers:
+                    if later > segment_number:
+                        self._segment_path(later).unlink()
+                break
+
+        if records:
+            tsr_ids: Set[str] = {_record_tsr_id(record) for record in records}
+            hot_ids: Set[str] = self._repair_hot_index(hot_index_bytes, tsr_ids)
+            # Vectors are only sealed at checkpoints, so a hot line on disk says nothing about them.
+            vector_index: Optional[VectorIndex] = self._writer.vector_index
+            vector_ids: Set[str] = vector_index.indexed(tsr_ids) if vector_index is not None else set()
+            for record in records:
+                self._replay(record, hot_ids, vector_ids)
+            self._writer.sync()
+        self.recovered = len(records)
+        return segment_numbers[-1] + 1 if segment_numbers else 0
+
+    def _read_segment(self, segment_path: Path, records: List[bytes]) -> bool:
+        """Append the intact frames of one segment to ``records``; truncates a bad tail."""
+        data: bytes = segment_path.read_bytes()
+        position: int = 0
+        while position + _WAL_FRAME.size <= len(data):
+            length, checksum = _WAL_FRAME.unpack_from(data, position)
+            end: int = position + _WAL_FRAME.size + length
+            record: bytes = data[position + _WAL_FRAME.size : end]
+            if end > len(data) or zlib.crc32(record) != checksum:
+                break
+            records.append(record)
+            position = end
+        if position == len(data):
+            return True
+        with segment_path.open("r+b") as segment_file:
+            segment_file.truncate(position)
+            os.fsync(segment_file.fileno())
+        return False
+
+    def _repair_hot_index(self, hot_index_bytes: int, tsr_ids: Set[str]) -> Set[str]:
+        """Drop a partial last line from the hot index; returns which of ``tsr_ids`` it already holds.
+
+        The whole file is scanned, so a replayed signal that was indexed before the checkpoint
+        (a resent duplicate) is not appended again.
+        """
+        hot_index_path: Path = self._writer.hot_index_path
+        if not hot_index_path.is_file():
+            return set()
+        with hot_index_path.open("r+b") as hot_file:
+            hot_file.seek(min(hot_index_bytes, hot_file.seek(0, os.SEEK_END)))
+            start: int = hot_file.tell()
+            tail: bytes = hot_file.read()
+            complete: int = tail.rfind(b"\n") + 1
+            if complete < len(tail):
+                hot_file.truncate(start + complete)
+        present: Set[str] = set()
+        with hot_index_path.open("rb") as hot_file:
+            for line in hot_file:
+                if line.strip():
+                    tsr_id: str = cast(str, json.loads(line)["tsr_id"])
+                    if tsr_id in tsr_ids:
+                        present.add(tsr_id)
+        return present
+
+    def _replay(self, record: bytes, hot_ids: Set[str], vector_ids: Set[str]) -> None:
+        accepted: _AcceptedSignal = _accepted_from_record(record)
+        cold_store: ColdStore = self._writer.cold_store
+        cold_path: Optional[str]
+        # A missing, empty or torn record (possible before the cold store's fsync) is rewritten.
+        if cold_store.get_bytes(accepted.tsr_id) != record:
+            cold_path = cold_store.put(accepted.tsr_id, record)
+        else:
+            locator = getattr(cold_store, "locator", None)
+            cold_path = locator(accepted.tsr_id) if locator is not None else None
+        if accepted.hot_entry is not None:
+            if accepted.tsr_id not in hot_ids:
+                self._writer.append_hot_line(accepted)
+                hot_ids.add(accepted.tsr_id)
+            if self._writer.vector_index is not None and accepted.tsr_id not in vector_ids:
+                self._writer.add_vector(accepted)
+                vector_ids.add(accepted.tsr_id)
+        if self._writer.metadata_index is not None:
+            self._writer.metadata_index.add(accepted.metadata, cold_path)
+        dedupe_index: Optional[DedupeIndex] = self._writer.dedupe_index
+        if dedupe_index is not None and accepted.tsr_id not in dedupe_index:
+            dedupe_index.add(accepted.tsr_id)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
+from uuid import UUID
+
+JsonObject = Dict[str, object]
+
+DEFAULT_COMMIT_BATCH_SIZE: int = 1024
+DEFAULT_QUERY_LIMIT: int = 1000
+
+# (tsr_timestamp_ns, tsr_id) is the clustered key: rows are stored in time order, so time
+# ranges are contiguous B-tree scans. The partial hazard index stays small because hazard
+# signals are rare, and the tag table is clustered by tag then time.
+_SCHEMA: Tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS signals (
+        tsr_timestamp_ns INTEGER NOT NULL,
+        tsr_id BLOB NOT NULL,
+        env TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        origin_kind TEXT NOT NULL,
+        hazard_flag INTEGER NOT NULL,
+        veracity_score REAL NOT NULL,
+        cold_path TEXT,
+        PRIMARY KEY (tsr_timestamp_ns, tsr_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS signals_tsr_id ON signals (tsr_id)",
+    "CREATE INDEX IF NOT EXISTS signals_source_time ON signals (source_id, tsr_timestamp_ns)",
+    "CREATE INDEX IF NOT EXISTS signals_hazard_time ON signals (tsr_timestamp_ns) WHERE hazard_flag = 1",
+    """
+    CREATE TABLE IF NOT EXISTS signal_tags (
+        tag TEXT NOT NULL,
+        tsr_timestamp_ns INTEGER NOT NULL,
+        tsr_id BLOB NOT NULL,
+        PRIMARY KEY (tag, tsr_timestamp_ns, tsr_id)
+    ) WITHOUT ROWID
+    """,
+)
+
+_SignalRow = Tuple[int, bytes, str, str, str, int, float, Optional[str]]
+_TagRow = Tuple[str, int, bytes]
+# tsr_id first, as selected by query().
+_QueryRow = Tuple[bytes, int, str, str, str, int, float, Optional[str]]
+
+
+@dataclass(frozen=True)
+class SignalMetadata:
+    tsr_id: str
+    tsr_timestamp_ns: int
+    env: str
+    source_id: str
+    origin_kind: str
+    hazard_flag: bool
+    veracity_score: float
+    cold_path: Optional[str]
+
+
+def metadata_entry(instance: JsonObject) -> JsonObject:
+    """Queryable fields of a canonical signal dict."""
+    origin: JsonObject = cast(JsonObject, instance["origin"])
+    safety: JsonObject = cast(JsonObject, instance["safety"])
+    return {
+        "tsr_id": instance["tsr_id"],
+        "tsr_timestamp_ns": instance["tsr_timestamp_ns"],
+        "env": instance["env"],
+        "source_id": origin["source_id"],
+        "origin_kind": origin["kind"],
+        "hazard_flag": bool(safety.get("hazard_flag", False)),
+        "veracity_score": safety["veracity_score"],
+        "tags": instance.get("tags") or [],
+    }
+
+
+class MetadataIndex:
+    """SQLite index of signal metadata for time-range and attribute queries.
+
+    Inserts are buffered and written ``commit_batch_size`` rows per transaction; queries
+    and :meth:`flush` write the buffer first. A ``tsr_id`` is indexed at most once: a re-ingest,
+    with the same or another timestamp, keeps the first row and adds no tags. One index may be shared
+    between a writer thread and query callers.
+    Pass ``":memory:"`` as ``path`` for a throwaway index.
+    """
+
+    def __init__(self, path: Union[Path, str], commit_batch_size: int = DEFAULT_COMMIT_BATCH_SIZE) -> None:
+        if commit_batch_size < 1:
+            raise ValueError("commit_batch_size must be >= 1")
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path: Union[Path, str] = path
+        self.commit_batch_size: int = commit_batch_size
+        self._connection: sqlite3.Connection = sqlite3.connect(str(path), check_same_thread=False)
+        # Guards the pending buffers and the shared connection.
+        self._lock: threading.Lock = threading.Lock()
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+        # Each buffered signal row with the tag rows that belong to it.
+        self._pending: List[Tuple[_SignalRow, List[_TagRow]]] = []
+
+    def __enter__(self) -> "MetadataIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush_pending()
+            return cast(int, self._connection.execute("SELECT COUNT(*) FROM signals").fetchone()[0])
+
+    def add(self, entry: JsonObject, cold_path: Optional[str] = None) -> None:
+        """Index one :func:`metadata_entry`; ``cold_path`` is stored for retrieval."""
+        tsr_id: bytes = UUID(cast(str, entry["tsr_id"])).bytes
+        timestamp_ns: int = cast(int, entry["tsr_timestamp_ns"])
+        row: _SignalRow = (
+            timestamp_ns,
+            tsr_id,
+            cast(str, entry["env"]),
+            cast(str, entry["source_id"]),
+            cast(str, entry["origin_kind"]),
+            1 if entry["hazard_flag"] else 0,
+            cast(float, entry["veracity_score"]),
+            cold_path,
+        )
+        with self._lock:
+            tag_rows: List[_TagRow] = [(tag, timestamp_ns, tsr_id) for tag in cast(Iterable[str], entry.get("tags") or [])]
+            self._pending.append((row, tag_rows))
+            if len(self._pending) >= self.commit_batch_size:
+                self._flush_pending()
+
+    def add_instance(self, instance: JsonObject, cold_path: Optional[str] = None) -> None:
+        self.add(metadata_entry(instance), cold_path)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        with self._connection:
+            # The unique tsr_id index makes a second row for an indexed ID a no-op; tags are
+            # only written for the rows this flush inserted.
+            inserted_tags: List[_TagRow] = []
+            for row, tag_rows in self._pending:
+                if self._connection.execute("INSERT OR IGNORE INTO signals VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row).rowcount:
+                    inserted_tags.extend(tag_rows)
+            self._connection.executemany("INSERT OR IGNORE INTO signal_tags VALUES (?, ?, ?)", inserted_tags)
+        self._pending.clear()
+
+    def query(
+        self,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+        source_id: Optional[str] = None,
+        origin_kind: Optional[str] = None,
+        env: Optional[str] = None,
+        hazard_flag: Optional[bool] = None,
+        min_veracity: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        newest_first: bool = True,
+    ) -> List[SignalMetadata]:
+        """Signals matching every given filter, ordered by ``tsr_timestamp_ns``.
+
+        ``since_ns`` is inclusive and ``until_ns`` exclusive; ``min_veracity`` is inclusive.
+        A signal must carry all of ``tags`` to match.
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        clauses: List[str] = []
+        parameters: List[object] = []
+        if since_ns is not None:
+            clauses.append("s.tsr_timestamp_ns >= ?")
+            parameters.append(since_ns)
+        if until_ns is not None:
+            clauses.append("s.tsr_timestamp_ns < ?")
+            parameters.append(until_ns)
+        if source_id is not None:
+            clauses.append("s.source_id = ?")
+            parameters.append(source_id)
+        if origin_kind is not None:
+            clauses.append("s.origin_kind = ?")
+            parameters.append(origin_kind)
+        if env is not None:
+            clauses.append("s.env = ?")
+            parameters.append(env)
+        if hazard_flag is not None:
+            # A literal, not a parameter, so SQLite can use the partial hazard index.
+            clauses.append("s.hazard_flag = 1" if hazard_flag else "s.hazard_flag = 0")
+        if min_veracity is not None:
+            clauses.append("s.veracity_score >= ?")
+            parameters.append(min_veracity)
+        for tag in tags or ():
+            clauses.append(
+                "EXISTS (SELECT 1 FROM signal_tags t WHERE t.tag = ? "
+                "AND t.tsr_timestamp_ns = s.tsr_timestamp_ns AND t.tsr_id = s.tsr_id)"
+            )
+            parameters.append(tag)
+
+        where: str = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order: str = "DESC" if newest_first else "ASC"
+        sql: str = (
+            "SELECT s.tsr_id, s.tsr_timestamp_ns, s.env, s.source_id, s.origin_kind, s.hazard_flag, "
+            f"s.veracity_score, s.cold_path FROM signals s{where} "
+            f"ORDER BY s.tsr_timestamp_ns {order}, s.tsr_id {order} LIMIT ?"
+        )
+        parameters.append(limit)
+        with self._lock:
+            self._flush_pending()
+            rows: List[_QueryRow] = self._connection.execute(sql, parameters).fetchall()
+        return [
+            SignalMetadata(
+                tsr_id=str(UUID(bytes=row[0])),
+                tsr_timestamp_ns=row[1],
+                env=row[2],
+                source_id=row[3],
+                origin_kind=row[4],
+                hazard_flag=bool(row[5]),
+                veracity_score=row[6],
+                cold_path=row[7],
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_pending()
+            self._connection.close()
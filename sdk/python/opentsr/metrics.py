@@ -0,0 +1,280 @@
+"""Ingest instrumentation: per-stage timings, result counters and size distributions.
+
+Pass an :class:`IngestMetrics` as ``metrics`` to an ingest entry point. Each signal then
+carries a :class:`SignalObservation` through parse, validation, signature check and the
+writer, and the registry aggregates it once the result is known. Without ``metrics`` the
+ingest path pays one ``None`` check per stage.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+
+if TYPE_CHECKING:
+    from .reference_ingest import IngestResult
+
+JsonObject = Dict[str, object]
+AttributeValue = Union[str, bool, int, float]
+
+STAGES: Tuple[str, ...] = ("parse", "pydantic", "schema", "signature", "cold_write", "hot_append")
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 5242880)
+# First matching message prefix wins; messages come from the ingest contract's 400 results.
+REJECTION_REASONS: Tuple[Tuple[str, str], ...] = (
+    ("invalid JSON:", "invalid_json"),
+    ("invalid signal: OpenTSR schema validation failed", "schema"),
+    ("invalid signal: missing safety.digital_signature", "signature_missing"),
+    ("invalid signal: signature_key is required", "signature_key"),
+    ("invalid signal: no signature key", "signature_key"),
+    ("invalid signal: signature verification failed", "signature_invalid"),
+    ("invalid signal: blob ", "blob"),
+    ("invalid signal:", "model"),
+    ("adapter mapping failed:", "adapter_mapping"),
+)
+OTEL_EVENT_NAME: str = "opentsr.ingest"
+
+
+def rejection_reason(message: str) -> str:
+    """Low-cardinality label for a 400 result message."""
+    for prefix, reason in REJECTION_REASONS:
+        if message.startswith(prefix):
+            return reason
+    return "other"
+
+
+def otel_attributes(instance: JsonObject) -> Dict[str, AttributeValue]:
+    """Attributes for a signal following ``spec/MAPPINGS_OTEL.md``.
+
+    ``tsr_timestamp_ns`` and ``trace.*`` map onto OTel's own timestamp and trace context,
+    so they are carried on :class:`IngestEvent` rather than as attributes.
+    """
+    attributes: Dict[str, AttributeValue] = {"opentsr.id": cast(str, instance["tsr_id"])}
+    for key, value in cast(JsonObject, instance["origin"]).items():
+        attributes[f"opentsr.origin.{key}"] = cast(str, value)
+    attributes["opentsr.safety.veracity_score"] = cast(float, cast(JsonObject, instance["safety"])["veracity_score"])
+    return attributes
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``bounds`` are inclusive upper bounds, plus an overflow bucket."""
+
+    __slots__ = ("bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds: Tuple[float, ...] = tuple(sorted(bounds))
+        self.bucket_counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile; ``inf`` in the overflow bucket."""
+        if not self.count:
+            return math.nan
+        rank: float = q * self.count
+        seen: int = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else math.inf
+        return math.inf
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(le, count)`` pairs in Prometheus order, ending with ``+Inf``."""
+        pairs: List[Tuple[float, int]] = []
+        seen: int = 0
+        for bound, bucket_count in zip(self.bounds + (math.inf,), self.bucket_counts):
+            seen += bucket_count
+            pairs.append((bound, seen))
+        return pairs
+
+
+@dataclass
+class SignalObservation:
+    """What one signal's trip through ingest measured; pickles across worker processes."""
+
+    stages: Dict[str, float] = field(default_factory=dict)
+    signal_bytes: Optional[int] = None
+    payload_over_soft_limit: bool = False
+    capture_attributes: bool = False
+    attributes: Optional[Dict[str, AttributeValue]] = None
+    timestamp_ns: Optional[int] = None
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
+
+    def capture(self, instance: JsonObject) -> None:
+        self.attributes = otel_attributes(instance)
+        self.timestamp_ns = cast(int, instance["tsr_timestamp_ns"])
+        trace: object = instance.get("trace")
+        if isinstance(trace, dict):
+            self.trace_id = cast(Optional[str], trace.get("trace_id"))
+            self.span_id = cast(Optional[str], trace.get("span_id"))
+
+
+@dataclass(frozen=True)
+class IngestEvent:
+    """One ingest result with its OTel attributes, as handed to sinks."""
+
+    status_code: int
+    reason: Optional[str]
+    stage_seconds: Dict[str, float]
+    signal_bytes: Optional[int]
+    attributes: Dict[str, AttributeValue]
+    timestamp_ns: Optional[int] = None
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
+
+
+IngestSink = Callable[[IngestEvent], None]
+
+
+def otel_span_event_sink(add_event: Callable[..., object], name: str = OTEL_EVENT_NAME) -> IngestSink:
+    """A sink that forwards each event to ``add_event(name, attributes=..., timestamp=...)``.
+
+    Pass ``span.add_event`` of an OpenTelemetry span (or a logger with the same signature);
+    this module does not import OpenTelemetry itself.
+    """
+
+    def sink(event: IngestEvent) -> None:
+        add_event(name, attributes=event.attributes, timestamp=event.timestamp_ns)
+
+    return sink
+
+
+def _prometheus_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class IngestMetrics:
+    """In-process metrics registry for the ingest path.
+
+    Holds a latency histogram per stage in :data:`STAGES`, counts of results by status code
+    and of 400s by :func:`rejection_reason`, the canonical size of validated signals and the
+    number whose payload exceeded the 1MB soft limit. ``sinks`` also receive an
+    :class:`IngestEvent` per result. Not thread-safe: results are recorded by the thread that
+    collects them, while observations may be filled in by worker threads or processes.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[IngestSink] = (),
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        self.sinks: List[IngestSink] = list(sinks)
+        self.stage_seconds: Dict[str, Histogram] = {stage: Histogram(latency_buckets) for stage in STAGES}
+        self.signal_bytes: Histogram = Histogram(size_buckets)
+        self.results: Dict[int, int] = {}
+        self.rejections: Dict[str, int] = {}
+        self.soft_limit_warnings: int = 0
+
+    def observation(self) -> SignalObservation:
+        return SignalObservation(capture_attributes=bool(self.sinks))
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage].observe(seconds)
+
+    def record(self, result: IngestResult, observation: Optional[SignalObservation] = None) -> None:
+        """Aggregate one ingest result and pass it to the sinks."""
+        status_code: int = result.status_code
+        self.results[status_code] = self.results.get(status_code, 0) + 1
+        reason: Optional[str] = None
+        if status_code == 400:
+            reason = rejection_reason(result.message)
+            self.rejections[reason] = self.rejections.get(reason, 0) + 1
+        if observation is not None:
+            for stage, seconds in observation.stages.items():
+                self.stage_seconds[stage].observe(seconds)
+            if observation.signal_bytes is not None:
+                self.signal_bytes.observe(observation.signal_bytes)
+            if observation.payload_over_soft_limit:
+                self.soft_limit_warnings += 1
+        else:
+            observation = SignalObservation()
+        if not self.sinks:
+            return
+        attributes: Dict[str, AttributeValue] = dict(observation.attributes or {})
+        attributes["opentsr.ingest.status_code"] = status_code
+        if reason is not None:
+            attributes["opentsr.ingest.reason"] = reason
+        for stage, seconds in observation.stages.items():
+            attributes[f"opentsr.ingest.{stage}_seconds"] = seconds
+        event = IngestEvent(
+            status_code=status_code,
+            reason=reason,
+            stage_seconds=observation.stages,
+            signal_bytes=observation.signal_bytes,
+            attributes=attributes,
+            timestamp_ns=observation.timestamp_ns,
+            trace_id=observation.trace_id,
+            span_id=observation.span_id,
+        )
+        for sink in self.sinks:
+            sink(event)
+
+    def snapshot(self) -> JsonObject:
+        """Counters and p50/p99 bucket bounds per stage, as plain data."""
+        return {
+            "results": {str(code): count for code, count in sorted(self.results.items())},
+            "rejections": dict(sorted(self.rejections.items())),
+            "soft_limit_warnings": self.soft_limit_warnings,
+            "stages": {
+                stage: {"count": histogram.count, "sum": histogram.sum, "p50": histogram.quantile(0.5), "p99": histogram.quantile(0.99)}
+                for stage, histogram in self.stage_seconds.items()
+                if histogram.count
+            },
+            "signal_bytes": {"count": self.signal_bytes.count, "sum": self.signal_bytes.sum},
+        }
+
+    def prometheus_text(self, prefix: str = "opentsr_ingest") -> str:
+        """The registry in the Prometheus text exposition format."""
+        lines: List[str] = [
+            f"# HELP {prefix}_stage_seconds Time spent in each ingest stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for stage, histogram in self.stage_seconds.items():
+            lines += _histogram_lines(f"{prefix}_stage_seconds", histogram, f'stage="{stage}",')
+        lines += [f"# HELP {prefix}_signal_bytes Canonical size of validated signals.", f"# TYPE {prefix}_signal_bytes histogram"]
+        lines += _histogram_lines(f"{prefix}_signal_bytes", self.signal_bytes, "")
+        lines += [f"# HELP {prefix}_results_total Ingest results by status code.", f"# TYPE {prefix}_results_total counter"]
+        lines += [f'{prefix}_results_total{{status_code="{code}"}} {count}' for code, count in sorted(self.results.items())]
+        lines += [f"# HELP {prefix}_rejections_total 400 results by reason.", f"# TYPE {prefix}_rejections_total counter"]
+        lines += [f'{prefix}_rejections_total{{reason="{reason}"}} {count}' for reason, count in sorted(self.rejections.items())]
+        lines += [
+            f"# HELP {prefix}_payload_soft_limit_total Signals whose payload exceeded the 1MB soft limit.",
+            f"# TYPE {prefix}_payload_soft_limit_total counter",
+            f"{prefix}_payload_soft_limit_total {self.soft_limit_warnings}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name: str, histogram: Histogram, labels: str) -> List[str]:
+    lines: List[str] = [f'{name}_bucket{{{labels}le="{_prometheus_value(bound)}"}} {count}' for bound, count in histogram.cumulative()]
+    suffix: str = f"{{{labels.rstrip(',')}}}" if labels else ""
+    lines += [f"{name}_sum{suffix} {_prometheus_value(histogram.sum)}", f"{name}_count{suffix} {histogram.count}"]
+    return lines
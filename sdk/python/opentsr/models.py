@@ -4,25 +4,37 @@ import base64
 import hashlib
 import hmac
 import json
-import math
 import secrets
+import struct
 import time
 import warnings
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union, cast
 from uuid import UUID
 
-from jsonschema import Draft202012Validator, FormatChecker
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
+
+from .vector_checks import vector_error
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
+    from .compiled_schema import CompiledSchemaValidator
 
 JsonObject = Dict[str, object]
+SchemaEngine = Literal["jsonschema", "compiled"]
+SchemaValidator = Union["Draft202012Validator", "CompiledSchemaValidator"]
 
 MAX_INT64: int = 9_223_372_036_854_775_807
 MAX_PAYLOAD_SOFT_BYTES: int = 1 * 1024 * 1024
 MAX_PAYLOAD_HARD_BYTES: int = 5 * 1024 * 1024
 UUID_V7_PATTERN: str = r"^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
 SUPPORTED_SIGNATURE_ALGS: Tuple[str, ...] = ("hmac-sha256",)
+VECTOR_BUFFER_FORMATS: Dict[str, str] = {"float32": "f", "float16": "e"}
+PRECOMPILED_SCHEMA: str = "<precompiled>"
+SCHEMA_ENGINES: Tuple[str, ...] = ("jsonschema", "compiled")
 
 
 def _generate_uuid7() -> str:
@@ -50,6 +62,10 @@ def _canonical_json_bytes(payload: object) -> bytes:
 
 @lru_cache(maxsize=8)
 def _load_schema(schema_path: str) -> JsonObject:
+    if schema_path == PRECOMPILED_SCHEMA:
+        from ._schema import SCHEMA
+
+        return cast(JsonObject, SCHEMA)
     with Path(schema_path).open("r", encoding="utf-8") as schema_file:
         raw_schema: object = json.load(schema_file)
     if not isinstance(raw_schema, dict):
@@ -57,7 +73,102 @@ def _load_schema(schema_path: str) -> JsonObject:
     return cast(JsonObject, raw_schema)
 
 
-class Origin(BaseModel):
+@lru_cache(maxsize=8)
+def _schema_validator(schema_path: str) -> Draft202012Validator:
+    # Imported on first validation so that building and emitting signals never loads jsonschema.
+    from jsonschema import Draft202012Validator, FormatChecker
+
+    return Draft202012Validator(schema=_load_schema(schema_path), format_checker=FormatChecker())
+
+
+@lru_cache(maxsize=1)
+def _default_schema_key() -> str:
+    """The bundled ``opentsr._schema`` artifact when present, else ``spec/schema.json`` on disk."""
+    try:
+        from . import _schema  # noqa: F401
+    except ImportError:
+        return str(_default_schema_path())
+    return PRECOMPILED_SCHEMA
+
+
+def _check_schema_engine(schema_engine: str) -> None:
+    if schema_engine not in SCHEMA_ENGINES:
+        supported: str = ", ".join(SCHEMA_ENGINES)
+        raise ValueError(f"unsupported schema_engine: {schema_engine}. Supported: {supported}")
+
+
+def _resolve_schema_validator(schema_path: Optional[Path] = None, schema_engine: SchemaEngine = "jsonschema") -> SchemaValidator:
+    _check_schema_engine(schema_engine)
+    if schema_engine == "compiled":
+        from .compiled_schema import compiled_validator
+
+        return compiled_validator(str(schema_path) if schema_path is not None else None)
+    return _schema_validator(str(schema_path) if schema_path is not None else _default_schema_key())
+
+
+def _validate_json_instance(instance: JsonObject, validator: SchemaValidator) -> None:
+    # The first error jsonschema yields is reported; the rest are never computed.
+    first_error = next(iter(validator.iter_errors(instance)), None)
+    if first_error is not None:
+        error_path: str = ".".join(str(part) for part in first_error.absolute_path) or "<root>"
+        raise ValueError(f"OpenTSR schema validation failed at {error_path}: {first_error.message}")
+
+
+def _signable_bytes(instance: JsonObject) -> bytes:
+    safety_value: object = instance.get("safety")
+    if not isinstance(safety_value, dict):
+        raise ValueError("safety must be an object")
+    safety_obj: JsonObject = cast(JsonObject, dict(safety_value))
+    safety_obj.pop("digital_signature", None)
+    signable: JsonObject = dict(instance)
+    signable["safety"] = safety_obj
+    return _canonical_json_bytes(signable)
+
+
+def _hmac_sha256_signature(key: bytes, signable_bytes: bytes) -> str:
+    return base64.b64encode(hmac.new(key, signable_bytes, hashlib.sha256).digest()).decode("ascii")
+
+
+def _verify_json_signature(instance: JsonObject, key: bytes) -> bool:
+    safety_value: object = instance.get("safety")
+    if not isinstance(safety_value, dict):
+        return False
+    digital_signature: object = safety_value.get("digital_signature")
+    signature_alg: object = safety_value.get("signature_alg")
+    if not isinstance(digital_signature, str) or not isinstance(signature_alg, str):
+        return False
+    if signature_alg not in SUPPORTED_SIGNATURE_ALGS:
+        return False
+
+    expected_signature: str = _hmac_sha256_signature(key, _signable_bytes(instance))
+    return hmac.compare_digest(expected_signature, digital_signature)
+
+
+class _RevisionedModel(BaseModel):
+    """Counts public field assignments so dependent caches can detect mutation."""
+
+    _revision: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name not in self.__private_attributes__:
+            self._revision += 1
+
+
+def _revision_of(model: _RevisionedModel) -> int:
+    # Read the private slot directly; ``model._revision`` goes through pydantic's slow ``__getattr__``.
+    return cast(int, model.__pydantic_private__["_revision"])  # type: ignore[index]
+
+
+@dataclass
+class _CanonicalCache:
+    state: Tuple[int, ...]
+    json_dict: JsonObject
+    canonical: Optional[bytes] = None
+    signable: Optional[bytes] = None
+
+
+class Origin(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     kind: Literal["llm_agent", "sensor", "service", "human_operator", "simulator"]
@@ -68,7 +179,7 @@ class Origin(BaseModel):
     region: Optional[str] = Field(default=None, min_length=1)
 
 
-class Safety(BaseModel):
+class Safety(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     veracity_score: float = Field(ge=0.0, le=1.0)
@@ -77,7 +188,7 @@ class Safety(BaseModel):
     signature_alg: Optional[str] = Field(default=None, min_length=1)
 
 
-class ActionIntent(BaseModel):
+class ActionIntent(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     action: str = Field(min_length=1)
@@ -86,7 +197,7 @@ class ActionIntent(BaseModel):
     requested_by: Optional[str] = Field(default=None, min_length=1)
 
 
-class Trace(BaseModel):
+class Trace(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     trace_id: Optional[str] = Field(default=None, min_length=1)
@@ -94,7 +205,7 @@ class Trace(BaseModel):
     parent_span_id: Optional[str] = Field(default=None, min_length=1)
 
 
-class ResourceRef(BaseModel):
+class ResourceRef(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     blob_url: str = Field(min_length=1)
@@ -110,7 +221,7 @@ class ResourceRef(BaseModel):
         return value
 
 
-class TSRSignal(BaseModel):
+class TSRSignal(_RevisionedModel):
     model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True)
 
     context: str = Field(default="https://opentsr.org/context/v1", alias="@context")
@@ -129,6 +240,8 @@ class TSRSignal(BaseModel):
     trace: Optional[Trace] = None
     resources: Optional[List[ResourceRef]] = None
 
+    _canonical_cache: Optional[_CanonicalCache] = PrivateAttr(default=None)
+
     @field_validator("tsr_id")
     @classmethod
     def validate_tsr_id(cls, value: str) -> str:
@@ -163,15 +276,9 @@ class TSRSignal(BaseModel):
     def validate_vector(cls, vector: Optional[List[float]]) -> Optional[List[float]]:
         if vector is None:
             return None
-        length: int = len(vector)
-        if length not in (1024, 1536):
-            raise ValueError("vector length must be exactly 1024 or 1536")
-
-        l2_norm: float = math.sqrt(sum(component * component for component in vector))
-        if not math.isfinite(l2_norm) or l2_norm == 0.0:
-            raise ValueError("vector norm must be finite and non-zero")
-        if abs(l2_norm - 1.0) > 1e-3:
-            raise ValueError("vector must be L2-normalized (norm ~= 1.0)")
+        error: Optional[str] = vector_error(vector)
+        if error is not None:
+            raise ValueError(error)
         return vector
 
     @field_validator("tags")
@@ -201,27 +308,79 @@ class TSRSignal(BaseModel):
             raise ValueError("safety.digital_signature is required when safety.signature_alg is present")
         return self
 
-    def _signable_dict(self) -> JsonObject:
-        instance: JsonObject = self.as_json_dict()
-        safety_value: object = instance.get("safety")
-        if not isinstance(safety_value, dict):
-            raise ValueError("safety must be an object")
-        safety_obj: JsonObject = cast(JsonObject, dict(safety_value))
-        safety_obj.pop("digital_signature", None)
-        instance["safety"] = safety_obj
-        return instance
+    def _state(self) -> Tuple[int, ...]:
+        # ``model_copy`` and ``copy`` carry the private cache over, so the state names its owner.
+        state: List[int] = [
+            id(self),
+            _revision_of(self),
+            id(self.origin),
+            _revision_of(self.origin),
+            id(self.safety),
+            _revision_of(self.safety),
+        ]
+        for nested in (self.action_intent, self.trace):
+            state.extend((0, -1) if nested is None else (id(nested), _revision_of(nested)))
+        if self.resources is not None:
+            state.append(len(self.resources))
+            for resource in self.resources:
+                state.extend((id(resource), _revision_of(resource)))
+        return tuple(state)
+
+    def _canonical(self) -> _CanonicalCache:
+        state: Tuple[int, ...] = self._state()
+        cache: Optional[_CanonicalCache] = self._canonical_cache
+        if cache is None or cache.state != state:
+            cache = _CanonicalCache(state=state, json_dict=self.as_json_dict())
+            self._canonical_cache = cache
+        return cache
+
+    def canonical_bytes(self) -> bytes:
+        """Canonical JSON (sorted keys, compact separators) of the signal.
+
+        Computed at most once per state: assigning any model field, including nested
+        ``safety``/``origin`` fields, invalidates it, and copies never reuse the original's bytes. In-place mutation of ``payload``,
+        ``vector``, ``tags`` or ``resources`` containers is not tracked; call
+        :meth:`invalidate_canonical_cache` after such edits.
+        """
+        cache: _CanonicalCache = self._canonical()
+        if cache.canonical is None:
+            cache.canonical = _canonical_json_bytes(cache.json_dict)
+        return cache.canonical
+
+    def invalidate_canonical_cache(self) -> None:
+        self._canonical_cache = None
+
+    def _signing_input(self) -> Tuple[JsonObject, bytes]:
+        """The JSON form and the bytes covered by the signature, from one cache lookup."""
+        cache: _CanonicalCache = self._canonical()
+        if cache.signable is None:
+            cache.signable = _signable_bytes(cache.json_dict)
+        return cache.json_dict, cache.signable
+
+    def _signable_bytes(self) -> bytes:
+        return self._signing_input()[1]
+
+    def _set_signature(self, signature: str) -> None:
+        """Store ``signature`` and carry the unsigned JSON form and signable bytes over to the new state."""
+        cache: _CanonicalCache = self._canonical()
+        self.safety.digital_signature = signature
+        safety_obj: JsonObject = dict(cast(JsonObject, cache.json_dict["safety"]))
+        safety_obj["digital_signature"] = signature
+        json_dict: JsonObject = dict(cache.json_dict)
+        json_dict["safety"] = safety_obj
+        self._canonical_cache = _CanonicalCache(state=self._state(), json_dict=json_dict, signable=cache.signable)
 
     def sign(self, key: bytes, signature_alg: str = "hmac-sha256") -> str:
         if signature_alg not in SUPPORTED_SIGNATURE_ALGS:
             supported: str = ", ".join(SUPPORTED_SIGNATURE_ALGS)
             raise ValueError(f"unsupported signature algorithm: {signature_alg}. Supported: {supported}")
 
-        self.safety.signature_alg = signature_alg
-        signable_bytes: bytes = _canonical_json_bytes(self._signable_dict())
+        if self.safety.signature_alg != signature_alg:
+            self.safety.signature_alg = signature_alg
+        signable_bytes: bytes = self._signable_bytes()
         if signature_alg == "hmac-sha256":
-            signature_bytes: bytes = hmac.new(key, signable_bytes, hashlib.sha256).digest()
-            signature: str = base64.b64encode(signature_bytes).decode("ascii")
-            self.safety.digital_signature = signature
+            signature: str = _hmac_sha256_signature(key, signable_bytes)
+            self._set_signature(signature)
             return signature
 
         raise ValueError(f"unsupported signature algorithm: {signature_alg}")
@@ -231,24 +390,30 @@ class TSRSignal(BaseModel):
             return False
         if self.safety.signature_alg not in SUPPORTED_SIGNATURE_ALGS:
             return False
-
-        signable_bytes: bytes = _canonical_json_bytes(self._signable_dict())
-        expected_signature: str = base64.b64encode(
-            hmac.new(key, signable_bytes, hashlib.sha256).digest()
-        ).decode("ascii")
+        expected_signature: str = _hmac_sha256_signature(key, self._signable_bytes())
         return hmac.compare_digest(expected_signature, self.safety.digital_signature)
 
+    @classmethod
+    def from_vector_buffer(cls, vector_buffer: object, vector_dtype: str = "float32", **fields: object) -> "TSRSignal":
+        """Build a signal whose ``vector`` is decoded from a little-endian float buffer.
+
+        Accepts any buffer-protocol object, such as a row of a memory-mapped vector segment.
+        """
+        if vector_dtype not in VECTOR_BUFFER_FORMATS:
+            supported: str = ", ".join(VECTOR_BUFFER_FORMATS)
+            raise ValueError(f"unsupported vector_dtype: {vector_dtype}. Supported: {supported}")
+        item_format: str = VECTOR_BUFFER_FORMATS[vector_dtype]
+        raw: memoryview = memoryview(cast(bytes, vector_buffer)).cast("B")
+        item_size: int = struct.calcsize(f"<{item_format}")
+        if len(raw) % item_size != 0:
+            raise ValueError(f"vector buffer length must be a multiple of {item_size} bytes")
+        vector: List[float] = list(struct.unpack(f"<{len(raw) // item_size}{item_format}", raw))
+        return cls(vector=vector, **fields)
+
     def as_json_dict(self) -> JsonObject:
         return cast(JsonObject, self.model_dump(mode="json", by_alias=True, exclude_none=True))
 
-    def validate(self, schema_path: Optional[Path] = None) -> bool:
-        resolved_schema_path: Path = schema_path if schema_path is not None else _default_schema_path()
-        schema: JsonObject = _load_schema(str(resolved_schema_path))
-        validator = Draft202012Validator(schema=schema, format_checker=FormatChecker())
-        instance: JsonObject = self.as_json_dict()
-        errors = sorted(validator.iter_errors(instance), key=lambda error: list(error.absolute_path))
-        if errors:
-            first_error = errors[0]
-            error_path: str = ".".join(str(part) for part in first_error.absolute_path) or "<root>"
-            raise ValueError(f"OpenTSR schema validation failed at {error_path}: {first_error.message}")
+    def validate(self, schema_path: Optional[Path] = None, schema_engine: SchemaEngine = "jsonschema") -> bool:
+        """Check the JSON form against the schema; ``schema_engine="compiled"`` uses the generated validator."""
+        _validate_json_instance(self._canonical().json_dict, _resolve_schema_validator(schema_path, schema_engine))
         return True
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+
+from .cold_store import ColdStore, DirectoryColdStore
+from .metrics import SignalObservation
+from .models import SchemaEngine, _check_schema_engine
+from .reference_ingest import (
+    IngestResult,
+    ValidationMode,
+    _AcceptedSignal,
+    _check_payload,
+    _check_validation_mode,
+    _default_hot_index_path,
+    _IngestWriter,
+    _invalid_json,
+    _schema_validator_for,
+)
+from .signing import SigningKey
+
+if TYPE_CHECKING:
+    from .dedupe import DedupeIndex
+    from .metadata_index import MetadataIndex
+    from .metrics import IngestMetrics
+    from .vector_index import VectorIndex
+
+JsonObject = Dict[str, object]
+IngestItem = Union[str, bytes, JsonObject]
+ExecutorKind = Literal["auto", "process", "thread"]
+CheckedItem = Union[IngestResult, _AcceptedSignal]
+CheckedChunk = Tuple[List[CheckedItem], Optional[List[SignalObservation]]]
+
+DEFAULT_CHUNK_SIZE: int = 64
+
+
+@dataclass(frozen=True)
+class _CheckConfig:
+    validation_mode: ValidationMode
+    schema_path: Optional[Path]
+    schema_engine: SchemaEngine
+    verify_signatures: bool
+    signature_key: Optional[SigningKey]
+    observe: bool = False
+    capture_attributes: bool = False
+
+
+def _free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _warm_worker(config: _CheckConfig) -> None:
+    # Compile and cache the schema validator once per worker instead of on the first chunk.
+    _schema_validator_for(config.validation_mode, config.schema_path, config.schema_engine)
+
+
+def _check_chunk(items: List[IngestItem], config: _CheckConfig) -> CheckedChunk:
+    """Parse and validate one chunk in a worker; vectors are packed as float32 arrays for the return trip.
+
+    With ``config.observe``, one :class:`SignalObservation` per item is returned alongside.
+    """
+    validator = _schema_validator_for(config.validation_mode, config.schema_path, config.schema_engine)
+    checked: List[CheckedItem] = []
+    observations: Optional[List[SignalObservation]] = [] if config.observe else None
+    for item in items:
+        observation: Optional[SignalObservation] = None
+        if observations is not None:
+            observation = SignalObservation(capture_attributes=config.capture_attributes)
+            observations.append(observation)
+        payload: object = item
+        if isinstance(item, (str, bytes)):
+            started: float = time.perf_counter() if observation is not None else 0.0
+            try:
+                payload = json.loads(item)
+            except json.JSONDecodeError as exc:
+                checked.append(_invalid_json(str(exc)))
+                continue
+            if observation is not None:
+                observation.stages["parse"] = time.perf_counter() - started
+            if not isinstance(payload, dict):
+                checked.append(_invalid_json("root must be an object"))
+                continue
+        result = _check_payload(
+            payload,  # type: ignore[arg-type]
+            config.validation_mode,
+            validator,
+            config.verify_signatures,
+            config.signature_key,
+            observation,
+        )
+        if isinstance(result, _AcceptedSignal) and result.vector is not None:
+            result = replace(result, vector=array("f", result.vector))
+        checked.append(result)
+    return checked, observations
+
+
+class ParallelIngestPipeline:
+    """Parse → validate/verify across a worker pool → one ordered writer.
+
+    JSON text, bytes or decoded payloads are chunked and checked in worker processes
+    (threads on free-threaded builds, where the GIL no longer serializes validation).
+    Each worker compiles the schema validator at start-up. Results are written to the
+    cold and hot stores by the calling thread and yielded in input order; at most
+    ``max_in_flight`` chunks are outstanding, which bounds memory for long inputs.
+    Workers measure parse and validation stages for ``metrics``; the calling thread records them.
+    """
+
+    def __init__(
+        self,
+        cold_store_dir: Path,
+        hot_index_path: Optional[Path] = None,
+        schema_path: Optional[Path] = None,
+        verify_signatures: bool = False,
+        signature_key: Optional[SigningKey] = None,
+        validation_mode: ValidationMode = "both",
+        cold_store: Optional[ColdStore] = None,
+        vector_index: Optional[VectorIndex] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        schema_engine: SchemaEngine = "jsonschema",
+        metrics: Optional[IngestMetrics] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor_kind: ExecutorKind = "auto",
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        _check_validation_mode(validation_mode)
+        _check_schema_engine(schema_engine)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if executor_kind not in ("auto", "process", "thread"):
+            raise ValueError(f"unsupported executor_kind: {executor_kind}. Supported: auto, process, thread")
+
+        self.workers: int = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.chunk_size: int = chunk_size
+        self.max_in_flight: int = max_in_flight if max_in_flight is not None else self.workers * 2
+        self._config = _CheckConfig(
+            validation_mode=validation_mode,
+            schema_path=schema_path,
+            schema_engine=schema_engine,
+            verify_signatures=verify_signatures,
+            signature_key=signature_key,
+            observe=metrics is not None,
+            capture_attributes=metrics is not None and bool(metrics.sinks),
+        )
+        self.metrics: Optional[IngestMetrics] = metrics
+        self._writer = _IngestWriter(
+            cold_store=cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir),
+            hot_index_path=_default_hot_index_path(cold_store_dir, hot_index_path),
+            vector_index=vector_index,
+            dedupe_index=dedupe_index,
+            metadata_index=metadata_index,
+        )
+        use_threads: bool = executor_kind == "thread" or (executor_kind == "auto" and _free_threaded())
+        self._executor: Executor
+        if use_threads:
+            _warm_worker(self._config)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_warm_worker,
+                initargs=(self._config,),
+            )
+
+    def __enter__(self) -> "ParallelIngestPipeline":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _chunks(self, items: Iterable[IngestItem]) -> Iterator[List[IngestItem]]:
+        chunk: List[IngestItem] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def ingest(self, items: Iterable[IngestItem]) -> Iterator[IngestResult]:
+        """Yield one :class:`IngestResult` per item, in input order."""
+        in_flight: Deque[Future[CheckedChunk]] = deque()
+        for chunk in self._chunks(items):
+            if len(in_flight) >= self.max_in_flight:
+                yield from self._drain(in_flight.popleft())
+            in_flight.append(self._executor.submit(_check_chunk, chunk, self._config))
+        while in_flight:
+            yield from self._drain(in_flight.popleft())
+
+    def _drain(self, future: Future[CheckedChunk]) -> Iterator[IngestResult]:
+        checked_items, observations = future.result()
+        if self.metrics is None or observations is None:
+            for checked in checked_items:
+                yield checked if isinstance(checked, IngestResult) else self._writer.write(checked)
+            return
+        for checked, observation in zip(checked_items, observations):
+            result: IngestResult = checked if isinstance(checked, IngestResult) else self._writer.write(checked, observation)
+            self.metrics.record(result, observation)
+            yield result
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._writer.close()
+
+
+def ingest_parallel(
+    items: Iterable[IngestItem],
+    cold_store_dir: Path,
+    workers: Optional[int] = None,
+    **options: object,
+) -> List[IngestResult]:
+    """One-shot helper around :class:`ParallelIngestPipeline`; returns results in input order."""
+    with ParallelIngestPipeline(cold_store_dir, workers=workers, **options) as pipeline:  # type: ignore[arg-type]
+        return list(pipeline.ingest(items))
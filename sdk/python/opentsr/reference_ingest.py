@@ -1,13 +1,47 @@
 from __future__ import annotations
 
 import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import IO, TYPE_CHECKING, AnyStr, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union, cast
 
-from .models import TSRSignal
+from .blob_verify import BlobFinding, BlobRef, blob_refs
+from .cold_store import ColdStore, DirectoryColdStore
+from .metadata_index import metadata_entry
+from .models import (
+    MAX_PAYLOAD_HARD_BYTES,
+    MAX_PAYLOAD_SOFT_BYTES,
+    SUPPORTED_SIGNATURE_ALGS,
+    SchemaEngine,
+    SchemaValidator,
+    TSRSignal,
+    _canonical_json_bytes,
+    _check_schema_engine,
+    _resolve_schema_validator,
+    _signable_bytes,
+    _validate_json_instance,
+    _verify_json_signature,
+)
+from .signing import Keyring, SigningKey, _PreKeyedHmac, _signature_matches
+
+if TYPE_CHECKING:
+    from .blob_verify import BlobVerifier
+    from .dedupe import DedupeIndex
+    from .metadata_index import MetadataIndex
+    from .metrics import IngestMetrics, SignalObservation
+    from .vector_index import VectorIndex
 
 JsonObject = Dict[str, object]
+ValidationMode = Literal["pydantic", "schema", "both"]
+
+VALIDATION_MODES: Tuple[str, ...] = ("pydantic", "schema", "both")
+DEFAULT_STREAM_BATCH_SIZE: int = 256
+DEFAULT_MAX_LINE_BYTES: int = MAX_PAYLOAD_HARD_BYTES + 1024 * 1024
+DEFAULT_MAX_PENDING_RECORDS: int = 4096
 
 
 @dataclass(frozen=True)
@@ -18,13 +52,397 @@ class IngestResult:
     hot_indexed: bool
 
 
+def _rejected(message: str) -> IngestResult:
+    return IngestResult(status_code=400, message=message, cold_path=None, hot_indexed=False)
+
+
+def _invalid_json(detail: str) -> IngestResult:
+    return _rejected(f"invalid JSON: {detail}")
+
+
+def _duplicate() -> IngestResult:
+    return IngestResult(status_code=200, message="duplicate", cold_path=None, hot_indexed=False)
+
+
+def _validated_instance(
+    payload: JsonObject,
+    validation_mode: ValidationMode,
+    validator: Optional[SchemaValidator],
+    observation: Optional[SignalObservation] = None,
+) -> Tuple[JsonObject, Optional[TSRSignal]]:
+    """Run the configured validation pass and return the JSON form of the signal.
+
+    ``pydantic`` and ``both`` also return the model, whose cached canonical bytes are
+    reused for signature checks and persistence; ``schema`` skips the runtime model
+    validators (vector normalization, payload size limits) and persists the payload as received.
+    The returned dict is shared with the model cache and must not be mutated.
+    """
+
+    started: float = time.perf_counter() if observation is not None else 0.0
+    if validation_mode == "schema":
+        if not isinstance(payload, dict):
+            raise ValueError("signal must be a JSON object")
+        _validate_json_instance(payload, cast("SchemaValidator", validator))
+        if observation is not None:
+            observation.stages["schema"] = time.perf_counter() - started
+        return payload, None
+
+    signal: TSRSignal = TSRSignal.model_validate(payload)
+    instance: JsonObject = signal._canonical().json_dict
+    if observation is not None:
+        validated: float = time.perf_counter()
+        observation.stages["pydantic"] = validated - started
+        started = validated
+    if validation_mode == "both":
+        _validate_json_instance(instance, cast("SchemaValidator", validator))
+        if observation is not None:
+            observation.stages["schema"] = time.perf_counter() - started
+    return instance, signal
+
+
+def _signature_rejection(
+    instance: JsonObject,
+    signal: Optional[TSRSignal],
+    signature_key: Optional[SigningKey],
+) -> Optional[IngestResult]:
+    safety_value: object = instance.get("safety")
+    if not isinstance(safety_value, dict) or safety_value.get("digital_signature") is None:
+        return _rejected("invalid signal: missing safety.digital_signature for verification")
+    if signature_key is None:
+        return _rejected("invalid signal: signature_key is required when verify_signatures=True")
+    verified: bool
+    if isinstance(signature_key, Keyring):
+        mac: Optional[_PreKeyedHmac] = signature_key._mac_for(instance)
+        if mac is None:
+            return _rejected(f"invalid signal: no signature key for key id: {signature_key.key_id(instance)}")
+        signable: bytes = signal._signable_bytes() if signal is not None else _signable_bytes(instance)
+        verified = safety_value.get("signature_alg") in SUPPORTED_SIGNATURE_ALGS and _signature_matches(
+            mac, signable, cast(str, safety_value["digital_signature"])
+        )
+    else:
+        verified = (
+            signal.verify_signature(signature_key)
+            if signal is not None
+            else _verify_json_signature(instance, signature_key)
+        )
+    if not verified:
+        return _rejected("invalid signal: signature verification failed")
+    return None
+
+
+def _hot_index_entry(instance: JsonObject) -> Optional[JsonObject]:
+    vector: object = instance.get("vector")
+    if not isinstance(vector, list):
+        return None
+    origin: JsonObject = cast(JsonObject, instance["origin"])
+    safety: JsonObject = cast(JsonObject, instance["safety"])
+    return {
+        "tsr_id": instance["tsr_id"],
+        "tsr_timestamp_ns": instance["tsr_timestamp_ns"],
+        "env": instance["env"],
+        "vector_dim": len(vector),
+        "origin_kind": origin["kind"],
+        "hazard_flag": safety.get("hazard_flag", False),
+    }
+
+
+@dataclass(frozen=True)
+class _AcceptedSignal:
+    """A signal that passed validation (and signature checks) and is ready to persist."""
+
+    tsr_id: str
+    record: bytes
+    hot_entry: Optional[JsonObject]
+    vector: Optional[Sequence[float]]
+    metadata: JsonObject
+    blobs: Tuple[BlobRef, ...] = ()
+
+
+_PendingSignal = Tuple[Union[IngestResult, _AcceptedSignal], Optional["Future[List[BlobFinding]]"], Optional["SignalObservation"]]
+
+
+def _check_validation_mode(validation_mode: str) -> None:
+    if validation_mode not in VALIDATION_MODES:
+        supported: str = ", ".join(VALIDATION_MODES)
+        raise ValueError(f"unsupported validation_mode: {validation_mode}. Supported: {supported}")
+
+
+def _schema_validator_for(
+    validation_mode: ValidationMode, schema_path: Optional[Path], schema_engine: SchemaEngine = "jsonschema"
+) -> Optional[SchemaValidator]:
+    _check_schema_engine(schema_engine)
+    if validation_mode in ("schema", "both"):
+        return _resolve_schema_validator(schema_path, schema_engine)
+    return None
+
+
+def _check_payload(
+    payload: JsonObject,
+    validation_mode: ValidationMode,
+    validator: Optional[SchemaValidator],
+    verify_signatures: bool,
+    signature_key: Optional[SigningKey],
+    observation: Optional[SignalObservation] = None,
+) -> Union[IngestResult, _AcceptedSignal]:
+    """Validation stage of the ingest contract: a 400 result or a signal ready for the writer."""
+    try:
+        instance, signal = _validated_instance(payload, validation_mode, validator, observation)
+    except Exception as exc:
+        return _rejected(f"invalid signal: {exc}")
+
+    record: Optional[bytes] = None
+    if observation is not None:
+        record = signal.canonical_bytes() if signal is not None else _canonical_json_bytes(instance)
+        _observe_validated(observation, instance, record)
+
+    if verify_signatures:
+        started: float = time.perf_counter() if observation is not None else 0.0
+        rejection: Optional[IngestResult] = _signature_rejection(instance, signal, signature_key)
+        if observation is not None:
+            observation.stages["signature"] = time.perf_counter() - started
+        if rejection is not None:
+            return rejection
+
+    if record is None:
+        record = signal.canonical_bytes() if signal is not None else _canonical_json_bytes(instance)
+    hot_entry: Optional[JsonObject] = _hot_index_entry(instance)
+    vector: Optional[Sequence[float]] = cast(Sequence[float], instance["vector"]) if hot_entry is not None else None
+    return _AcceptedSignal(
+        tsr_id=cast(str, instance["tsr_id"]),
+        record=record,
+        hot_entry=hot_entry,
+        vector=vector,
+        metadata=metadata_entry(instance),
+        blobs=blob_refs(instance),
+    )
+
+
+def _accepted_from_record(record: bytes) -> _AcceptedSignal:
+    """Rebuild the writer input from a canonical record that already passed validation."""
+    instance: JsonObject = cast(JsonObject, json.loads(record))
+    hot_entry: Optional[JsonObject] = _hot_index_entry(instance)
+    return _AcceptedSignal(
+        tsr_id=cast(str, instance["tsr_id"]),
+        record=record,
+        hot_entry=hot_entry,
+        vector=cast(Sequence[float], instance["vector"]) if hot_entry is not None else None,
+        metadata=metadata_entry(instance),
+        blobs=blob_refs(instance),
+    )
+
+
+def _observe_validated(observation: SignalObservation, instance: JsonObject, record: bytes) -> None:
+    observation.signal_bytes = len(record)
+    # The payload is part of the record, so it can only exceed the soft limit when the record does.
+    if len(record) > MAX_PAYLOAD_SOFT_BYTES:
+        observation.payload_over_soft_limit = len(_canonical_json_bytes(instance["payload"])) > MAX_PAYLOAD_SOFT_BYTES
+    if observation.capture_attributes:
+        observation.capture(instance)
+
+
+class _IngestWriter:
+    """Persistence stage: cold store write, then hot index append, for accepted signals in order."""
+
+    def __init__(
+        self,
+        cold_store: ColdStore,
+        hot_index_path: Path,
+        vector_index: Optional[VectorIndex] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+    ) -> None:
+        self.cold_store: ColdStore = cold_store
+        self.hot_index_path: Path = hot_index_path
+        self.vector_index: Optional[VectorIndex] = vector_index
+        self.dedupe_index: Optional[DedupeIndex] = dedupe_index
+        self.metadata_index: Optional[MetadataIndex] = metadata_index
+        self._hot_file: Optional[IO[str]] = None
+
+    def write(self, accepted: _AcceptedSignal, observation: Optional[SignalObservation] = None) -> IngestResult:
+        if self.dedupe_index is not None and accepted.tsr_id in self.dedupe_index:
+            return _duplicate()
+        started: float = time.perf_counter() if observation is not None else 0.0
+        cold_path: str = self.cold_store.put(accepted.tsr_id, accepted.record)
+        if observation is not None:
+            written: float = time.perf_counter()
+            observation.stages["cold_write"] = written - started
+            started = written
+
+        hot_indexed: bool = self.append_hot(accepted)
+        if hot_indexed and observation is not None:
+            observation.stages["hot_append"] = time.perf_counter() - started
+
+        if self.metadata_index is not None:
+            self.metadata_index.add(accepted.metadata, cold_path)
+        if self.dedupe_index is not None:
+            self.dedupe_index.add(accepted.tsr_id)
+        return IngestResult(status_code=202, message="accepted", cold_path=cold_path, hot_indexed=hot_indexed)
+
+    def append_hot(self, accepted: _AcceptedSignal) -> bool:
+        """Append the hot index entry (and vector) of a signal that has one."""
+        if accepted.hot_entry is None:
+            return False
+        self.append_hot_line(accepted)
+        self.add_vector(accepted)
+        return True
+
+    def append_hot_line(self, accepted: _AcceptedSignal) -> None:
+        """Append the ``hot_vectors.ndjson`` line of a signal with a hot index entry."""
+        if self._hot_file is None:
+            self.hot_index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._hot_file = self.hot_index_path.open("a", encoding="utf-8")
+        self._hot_file.write(json.dumps(accepted.hot_entry, separators=(",", ":"), sort_keys=True))
+        self._hot_file.write("\n")
+
+    def add_vector(self, accepted: _AcceptedSignal) -> None:
+        """Add the vector of a signal with a hot index entry to ``vector_index``, if any."""
+        if self.vector_index is None:
+            return
+        hot_entry: JsonObject = cast(JsonObject, accepted.hot_entry)
+        self.vector_index.add(
+            tsr_id=accepted.tsr_id,
+            vector=cast(Sequence[float], accepted.vector),
+            tsr_timestamp_ns=cast(int, hot_entry["tsr_timestamp_ns"]),
+            env=cast(str, hot_entry["env"]),
+            origin_kind=cast(str, hot_entry["origin_kind"]),
+            hazard_flag=bool(hot_entry["hazard_flag"]),
+        )
+
+    def flush(self) -> None:
+        """Hand buffered hot index lines and metadata rows on to the OS and database, without fsync."""
+        if self._hot_file is not None:
+            self._hot_file.flush()
+        if self.metadata_index is not None:
+            self.metadata_index.flush()
+
+    def sync(self) -> None:
+        """Make everything written so far durable: cold store, hot index file, vectors, metadata and dedupe set."""
+        self.cold_store.flush()
+        if self._hot_file is not None:
+            self._hot_file.flush()
+            os.fsync(self._hot_file.fileno())
+        if self.vector_index is not None and self.vector_index.directory is not None:
+            self.vector_index.flush()
+        if self.metadata_index is not None:
+            self.metadata_index.flush()
+        if self.dedupe_index is not None:
+            self.dedupe_index.flush()
+
+    def close(self) -> None:
+        if self._hot_file is not None:
+            self._hot_file.close()
+            self._hot_file = None
+        if self.metadata_index is not None:
+            self.metadata_index.flush()
+
+
+def _default_hot_index_path(cold_store_dir: Path, hot_index_path: Optional[Path]) -> Path:
+    return hot_index_path if hot_index_path is not None else cold_store_dir / "hot_vectors.ndjson"
+
+
+def ingest_batch(
+    payloads: Iterable[JsonObject],
+    cold_store_dir: Path,
+    hot_index_path: Optional[Path] = None,
+    schema_path: Optional[Path] = None,
+    verify_signatures: bool = False,
+    signature_key: Optional[SigningKey] = None,
+    validation_mode: ValidationMode = "both",
+    cold_store: Optional[ColdStore] = None,
+    vector_index: Optional[VectorIndex] = None,
+    dedupe_index: Optional[DedupeIndex] = None,
+    metadata_index: Optional[MetadataIndex] = None,
+    schema_engine: SchemaEngine = "jsonschema",
+    metrics: Optional[IngestMetrics] = None,
+    blob_verifier: Optional[BlobVerifier] = None,
+) -> List[IngestResult]:
+    """Batch variant of :func:`ingest_signal`.
+
+    Resolves the compiled schema validator and opens the hot index once per batch.
+    Returns one result per payload, in input order, with the same 400/202 semantics.
+    ``cold_store`` defaults to one JSON document per signal under ``cold_store_dir``.
+    When ``vector_index`` is given, accepted vectors are also added to it for similarity search.
+    A ``metadata_index`` receives the queryable fields of every accepted signal.
+    With a ``dedupe_index``, a ``tsr_id`` that was already accepted returns 200 ``duplicate``
+    before validation and is not written again. ``schema_engine="compiled"`` validates with the
+    generated :mod:`opentsr._compiled_schema` checks instead of jsonschema; both report the same error.
+    ``metrics`` records per-stage timings, result counts and signal sizes for every payload.
+    A ``blob_verifier`` hashes the files behind ``payload.blob_url`` and ``resources``: in
+    ``reject`` mode a missing or mismatched blob is a 400 (signals are hashed ahead of the
+    writer, up to ``2 * workers`` at a time), in ``audit`` mode accepted signals are checked
+    in the background.
+    """
+
+    _check_validation_mode(validation_mode)
+    validator: Optional[SchemaValidator] = _schema_validator_for(validation_mode, schema_path, schema_engine)
+    writer = _IngestWriter(
+        cold_store=cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir),
+        hot_index_path=_default_hot_index_path(cold_store_dir, hot_index_path),
+        vector_index=vector_index,
+        dedupe_index=dedupe_index,
+        metadata_index=metadata_index,
+    )
+    rejecting_blobs: bool = blob_verifier is not None and blob_verifier.mode == "reject"
+    window: int = 2 * cast("BlobVerifier", blob_verifier).workers if rejecting_blobs else 0
+    pending: Deque[_PendingSignal] = deque()
+    results: List[IngestResult] = []
+
+    def finish(
+        checked: Union[IngestResult, _AcceptedSignal],
+        verification: Optional[Future[List[BlobFinding]]],
+        observation: Optional[SignalObservation],
+    ) -> None:
+        result: IngestResult
+        if isinstance(checked, IngestResult):
+            result = checked
+        else:
+            findings: List[BlobFinding] = verification.result() if verification is not None else []
+            if findings:
+                result = _rejected(f"invalid signal: {findings[0].message}")
+            else:
+                result = writer.write(checked, observation)
+                if blob_verifier is not None and not rejecting_blobs and result.status_code == 202 and checked.blobs:
+                    blob_verifier.submit_audit(checked.tsr_id, checked.blobs)
+        if metrics is not None:
+            metrics.record(result, observation)
+        results.append(result)
+
+    try:
+        for payload in payloads:
+            observation: Optional[SignalObservation] = metrics.observation() if metrics is not None else None
+            checked: Union[IngestResult, _AcceptedSignal]
+            verification: Optional[Future[List[BlobFinding]]] = None
+            if dedupe_index is not None and isinstance(payload, dict) and payload.get("tsr_id") in dedupe_index:
+                checked = _duplicate()
+            else:
+                checked = _check_payload(payload, validation_mode, validator, verify_signatures, signature_key, observation)
+                if rejecting_blobs and isinstance(checked, _AcceptedSignal) and checked.blobs:
+                    verification = cast("BlobVerifier", blob_verifier).submit(checked.tsr_id, checked.blobs)
+            pending.append((checked, verification, observation))
+            while len(pending) > window:
+                finish(*pending.popleft())
+        while pending:
+            finish(*pending.popleft())
+    finally:
+        writer.close()
+    return results
+
+
 def ingest_signal(
     payload: JsonObject,
     cold_store_dir: Path,
     hot_index_path: Optional[Path] = None,
     schema_path: Optional[Path] = None,
     verify_signatures: bool = False,
-    signature_key: Optional[bytes] = None,
+    signature_key: Optional[SigningKey] = None,
+    validation_mode: ValidationMode = "both",
+    cold_store: Optional[ColdStore] = None,
+    vector_index: Optional[VectorIndex] = None,
+    dedupe_index: Optional[DedupeIndex] = None,
+    metadata_index: Optional[MetadataIndex] = None,
+    schema_engine: SchemaEngine = "jsonschema",
+    metrics: Optional[IngestMetrics] = None,
+    blob_verifier: Optional[BlobVerifier] = None,
 ) -> IngestResult:
     """Reference ingest contract for OpenTSR.
 
@@ -32,65 +450,29 @@ def ingest_signal(
     Persists raw payload (cold path) and optionally appends vector metadata (hot path).
     """
 
-    try:
-        signal = TSRSignal.model_validate(payload)
-        signal.validate(schema_path=schema_path)
-    except Exception as exc:
-        return IngestResult(status_code=400, message=f"invalid signal: {exc}", cold_path=None, hot_indexed=False)
-
-    if verify_signatures:
-        if signal.safety.digital_signature is None:
-            return IngestResult(
-                status_code=400,
-                message="invalid signal: missing safety.digital_signature for verification",
-                cold_path=None,
-                hot_indexed=False,
-            )
-        if signature_key is None:
-            return IngestResult(
-                status_code=400,
-                message="invalid signal: signature_key is required when verify_signatures=True",
-                cold_path=None,
-                hot_indexed=False,
-            )
-        if not signal.verify_signature(signature_key):
-            return IngestResult(
-                status_code=400,
-                message="invalid signal: signature verification failed",
-                cold_path=None,
-                hot_indexed=False,
-            )
+    return ingest_batch(
+        payloads=[payload],
+        cold_store_dir=cold_store_dir,
+        hot_index_path=hot_index_path,
+        schema_path=schema_path,
+        verify_signatures=verify_signatures,
+        signature_key=signature_key,
+        validation_mode=validation_mode,
+        cold_store=cold_store,
+        vector_index=vector_index,
+        dedupe_index=dedupe_index,
+        metadata_index=metadata_index,
+        schema_engine=schema_engine,
+        metrics=metrics,
+        blob_verifier=blob_verifier,
+    )[0]
 
-    cold_store_dir.mkdir(parents=True, exist_ok=True)
-    cold_path = cold_store_dir / f"{signal.tsr_id}.json"
-    cold_path.write_text(
-        json.dumps(signal.as_json_dict(), separators=(",", ":"), sort_keys=True),
-        encoding="utf-8",
-    )
 
-    hot_indexed = False
-    if signal.vector is not None:
-        target_hot_index_path = hot_index_path if hot_index_path is not None else cold_store_dir / "hot_vectors.ndjson"
-        target_hot_index_path.parent.mkdir(parents=True, exist_ok=True)
-        vector_entry: JsonObject = {
-            "tsr_id": signal.tsr_id,
-            "tsr_timestamp_ns": signal.tsr_timestamp_ns,
-            "env": signal.env,
-            "vector_dim": len(signal.vector),
-            "origin_kind": signal.origin.kind,
-            "hazard_flag": signal.safety.hazard_flag,
-        }
-        with target_hot_index_path.open("a", encoding="utf-8") as hot_file:
-            hot_file.write(json.dumps(vector_entry, separators=(",", ":"), sort_keys=True))
-            hot_file.write("\n")
-        hot_indexed = True
-
-    return IngestResult(
-        status_code=202,
-        message="accepted",
-        cold_path=str(cold_path),
-        hot_indexed=hot_indexed,
-    )
+def _unparsed(result: IngestResult, metrics: Optional[IngestMetrics]) -> IngestResult:
+    """Record a result for input that never reached :func:`ingest_batch`."""
+    if metrics is not None:
+        metrics.record(result)
+    return result
 
 
 def ingest_signal_json(
@@ -99,15 +481,26 @@ def ingest_signal_json(
     hot_index_path: Optional[Path] = None,
     schema_path: Optional[Path] = None,
     verify_signatures: bool = False,
-    signature_key: Optional[bytes] = None,
+    signature_key: Optional[SigningKey] = None,
+    validation_mode: ValidationMode = "both",
+    cold_store: Optional[ColdStore] = None,
+    vector_index: Optional[VectorIndex] = None,
+    dedupe_index: Optional[DedupeIndex] = None,
+    metadata_index: Optional[MetadataIndex] = None,
+    schema_engine: SchemaEngine = "jsonschema",
+    metrics: Optional[IngestMetrics] = None,
+    blob_verifier: Optional[BlobVerifier] = None,
 ) -> IngestResult:
+    started: float = time.perf_counter() if metrics is not None else 0.0
     try:
         payload: object = json.loads(payload_json)
     except json.JSONDecodeError as exc:
-        return IngestResult(status_code=400, message=f"invalid JSON: {exc}", cold_path=None, hot_indexed=False)
+        return _unparsed(_invalid_json(str(exc)), metrics)
+    if metrics is not None:
+        metrics.observe_stage("parse", time.perf_counter() - started)
 
     if not isinstance(payload, dict):
-        return IngestResult(status_code=400, message="invalid JSON: root must be an object", cold_path=None, hot_indexed=False)
+        return _unparsed(_invalid_json("root must be an object"), metrics)
 
     return ingest_signal(
         payload=payload,
@@ -116,4 +509,112 @@ def ingest_signal_json(
         schema_path=schema_path,
         verify_signatures=verify_signatures,
         signature_key=signature_key,
+        validation_mode=validation_mode,
+        cold_store=cold_store,
+        vector_index=vector_index,
+        dedupe_index=dedupe_index,
+        metadata_index=metadata_index,
+        schema_engine=schema_engine,
+        metrics=metrics,
+        blob_verifier=blob_verifier,
     )
+
+
+def _read_line(readable: IO[AnyStr], max_line_bytes: int) -> Tuple[Optional[AnyStr], bool]:
+    """Read one line of at most ``max_line_bytes``; an over-long line is drained and reported."""
+    line: AnyStr = readable.readline(max_line_bytes + 1)
+    if not line:
+        return None, False
+    if len(line) <= max_line_bytes or line[-1:] in ("\n", b"\n"):
+        return line, False
+    while True:
+        remainder: AnyStr = readable.readline(max_line_bytes)
+        if not remainder or remainder[-1:] in ("\n", b"\n"):
+            return None, True
+
+
+def ingest_stream(
+    readable: Union[IO[str], IO[bytes]],
+    cold_store_dir: Path,
+    hot_index_path: Optional[Path] = None,
+    schema_path: Optional[Path] = None,
+    verify_signatures: bool = False,
+    signature_key: Optional[SigningKey] = None,
+    validation_mode: ValidationMode = "both",
+    cold_store: Optional[ColdStore] = None,
+    vector_index: Optional[VectorIndex] = None,
+    dedupe_index: Optional[DedupeIndex] = None,
+    metadata_index: Optional[MetadataIndex] = None,
+    schema_engine: SchemaEngine = "jsonschema",
+    metrics: Optional[IngestMetrics] = None,
+    blob_verifier: Optional[BlobVerifier] = None,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+    max_pending_records: int = DEFAULT_MAX_PENDING_RECORDS,
+) -> Iterator[Tuple[int, IngestResult]]:
+    """Ingest line-delimited JSON signals from a text or binary stream.
+
+    Lines are read incrementally and validated in micro-batches of ``batch_size`` through
+    :func:`ingest_batch`; ``(line_number, result)`` pairs are yielded in input order and
+    blank lines are skipped. At most ``batch_size`` lines of ``max_line_bytes`` each are
+    buffered, and longer lines are rejected without being held in memory. When the cold
+    store reports ``max_pending_records`` or more non-durable records, it is flushed before
+    more input is read, which holds back the producer.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    target_cold_store: ColdStore = cold_store if cold_store is not None else DirectoryColdStore(cold_store_dir)
+    line_number: int = 0
+    exhausted: bool = False
+    while not exhausted:
+        batch_results: List[Tuple[int, Optional[IngestResult]]] = []
+        payloads: List[JsonObject] = []
+        while len(batch_results) < batch_size:
+            line, too_long = _read_line(readable, max_line_bytes)
+            if line is None and not too_long:
+                exhausted = True
+                break
+            line_number += 1
+            if too_long:
+                batch_results.append((line_number, _unparsed(_invalid_json(f"line exceeds {max_line_bytes} bytes"), metrics)))
+                continue
+            if not line.strip():
+                continue
+            started: float = time.perf_counter() if metrics is not None else 0.0
+            try:
+                payload: object = json.loads(line)
+            except json.JSONDecodeError as exc:
+                batch_results.append((line_number, _unparsed(_invalid_json(str(exc)), metrics)))
+                continue
+            if metrics is not None:
+                metrics.observe_stage("parse", time.perf_counter() - started)
+            if not isinstance(payload, dict):
+                batch_results.append((line_number, _unparsed(_invalid_json("root must be an object"), metrics)))
+                continue
+            batch_results.append((line_number, None))
+            payloads.append(payload)
+
+        accepted: Iterator[IngestResult] = iter(
+            ingest_batch(
+                payloads=payloads,
+                cold_store_dir=cold_store_dir,
+                hot_index_path=hot_index_path,
+                schema_path=schema_path,
+                verify_signatures=verify_signatures,
+                signature_key=signature_key,
+                validation_mode=validation_mode,
+                cold_store=target_cold_store,
+                vector_index=vector_index,
+                dedupe_index=dedupe_index,
+                metadata_index=metadata_index,
+                schema_engine=schema_engine,
+                metrics=metrics,
+                blob_verifier=blob_verifier,
+            )
+        )
+        if target_cold_store.pending >= max_pending_records:
+            target_cold_store.flush()
+        for result_line, result in batch_results:
+            yield result_line, (result if result is not None else next(accepted))
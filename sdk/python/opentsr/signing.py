@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, cast
+
+from .models import SUPPORTED_SIGNATURE_ALGS, Safety, TSRSignal
+
+JsonObject = Dict[str, object]
+KeyIdResolver = Callable[[JsonObject], Optional[str]]
+
+DEFAULT_VERIFY_CHUNK_SIZE: int = 256
+
+
+def source_id_key_id(instance: JsonObject) -> Optional[str]:
+    """Default key ID: the signal's ``origin.source_id``."""
+    origin: object = instance.get("origin")
+    source_id: object = origin.get("source_id") if isinstance(origin, dict) else None
+    return source_id if isinstance(source_id, str) else None
+
+
+class _PreKeyedHmac:
+    """HMAC-SHA256 state keyed once; each signature starts from a copy of it."""
+
+    def __init__(self, key: bytes) -> None:
+        self.key: bytes = key
+        self._keyed = hmac.new(key, digestmod=hashlib.sha256)
+
+    def signature(self, signable_bytes: bytes) -> str:
+        mac = self._keyed.copy()
+        mac.update(signable_bytes)
+        return base64.b64encode(mac.digest()).decode("ascii")
+
+
+class Keyring:
+    """HMAC keys by key ID for signing and verification across key rotations.
+
+    ``key_id`` maps a signal's JSON form to the ID of the key that signs it (by default
+    ``origin.source_id``), so each signal costs one dictionary lookup. Keys are held as
+    pre-keyed HMAC states. Keyrings pickle by their raw keys, so they can be passed to
+    process pools as long as ``key_id`` is a module-level function.
+    """
+
+    def __init__(self, keys: Optional[Mapping[str, bytes]] = None, key_id: KeyIdResolver = source_id_key_id) -> None:
+        self.key_id: KeyIdResolver = key_id
+        self._macs: Dict[str, _PreKeyedHmac] = {}
+        for identifier, key in (keys or {}).items():
+            self.add(identifier, key)
+
+    def __getstate__(self) -> Tuple[Dict[str, bytes], KeyIdResolver]:
+        return {identifier: mac.key for identifier, mac in self._macs.items()}, self.key_id
+
+    def __setstate__(self, state: Tuple[Dict[str, bytes], KeyIdResolver]) -> None:
+        keys, key_id = state
+        self.__init__(keys, key_id)  # type: ignore[misc]
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._macs
+
+    def __len__(self) -> int:
+        return len(self._macs)
+
+    def add(self, key_id: str, key: bytes) -> None:
+        if not key:
+            raise ValueError("signing key must not be empty")
+        self._macs[key_id] = _PreKeyedHmac(key)
+
+    def remove(self, key_id: str) -> None:
+        self._macs.pop(key_id, None)
+
+    def _mac_for(self, instance: JsonObject) -> Optional[_PreKeyedHmac]:
+        identifier: Optional[str] = self.key_id(instance)
+        return self._macs.get(identifier) if identifier is not None else None
+
+
+SigningKey = Union[bytes, Keyring]
+
+
+def _mac_resolver(key: SigningKey) -> Callable[[JsonObject], Optional[_PreKeyedHmac]]:
+    if isinstance(key, Keyring):
+        return key._mac_for
+    single: _PreKeyedHmac = _PreKeyedHmac(key)
+    return lambda instance: single
+
+
+def _signature_matches(mac: Optional[_PreKeyedHmac], signable_bytes: bytes, signature: Optional[str]) -> bool:
+    if mac is None or signature is None:
+        return False
+    return hmac.compare_digest(mac.signature(signable_bytes), signature)
+
+
+def sign_many(signals: Iterable[TSRSignal], key: SigningKey, signature_alg: str = "hmac-sha256") -> List[str]:
+    """Sign each signal in place with one pre-keyed HMAC state per key; returns the signatures.
+
+    With a :class:`Keyring`, every signal must resolve to a known key ID; the first that does
+    not raises ``ValueError`` and is left as it was, while the signals before it stay signed.
+    """
+    if signature_alg not in SUPPORTED_SIGNATURE_ALGS:
+        supported: str = ", ".join(SUPPORTED_SIGNATURE_ALGS)
+        raise ValueError(f"unsupported signature algorithm: {signature_alg}. Supported: {supported}")
+
+    mac_for: Callable[[JsonObject], Optional[_PreKeyedHmac]] = _mac_resolver(key)
+    signatures: List[str] = []
+    for signal in signals:
+        previous_alg: Optional[str] = signal.safety.signature_alg
+        if previous_alg != signature_alg:
+            signal.safety.signature_alg = signature_alg
+        instance, signable_bytes = signal._signing_input()
+        mac: Optional[_PreKeyedHmac] = mac_for(instance)
+        if mac is None:
+            signal.safety.signature_alg = previous_alg
+            raise ValueError(f"no signing key for key id: {cast(Keyring, key).key_id(instance)}")
+        signature: str = mac.signature(signable_bytes)
+        signal._set_signature(signature)
+        signatures.append(signature)
+    return signatures
+
+
+def verify_many(
+    signals: Sequence[TSRSignal],
+    key: SigningKey,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE,
+) -> List[bool]:
+    """Verify each signal's signature; returns one flag per signal, in order.
+
+    Signable bytes are built in the calling thread. With ``workers`` > 1 the HMAC
+    comparisons run on a thread pool, which pays off for large signals because hashing
+    releases the GIL. Unsigned signals, unsupported algorithms and unknown key IDs give False.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    mac_for: Callable[[JsonObject], Optional[_PreKeyedHmac]] = _mac_resolver(key)
+    checks: List[Tuple[Optional[_PreKeyedHmac], bytes, Optional[str]]] = []
+    for signal in signals:
+        safety: Safety = signal.safety
+        if safety.digital_signature is None or safety.signature_alg not in SUPPORTED_SIGNATURE_ALGS:
+            checks.append((None, b"", None))
+            continue
+        instance, signable_bytes = signal._signing_input()
+        checks.append((mac_for(instance), signable_bytes, safety.digital_signature))
+
+    if workers is None or workers <= 1 or len(checks) <= chunk_size:
+        return [_signature_matches(*check) for check in checks]
+
+    chunks: List[List[Tuple[Optional[_PreKeyedHmac], bytes, Optional[str]]]] = [
+        checks[start : start + chunk_size] for start in range(0, len(checks), chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        verified: List[bool] = []
+        for flags in executor.map(lambda chunk: [_signature_matches(*check) for check in chunk], chunks):
+            verified.extend(flags)
+    return verified
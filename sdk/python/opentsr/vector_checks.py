@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union, cast
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+SUPPORTED_VECTOR_DIMS: Tuple[int, ...] = (1024, 1536)
+VECTOR_NORM_TOLERANCE: float = 1e-3
+
+VECTOR_LENGTH_ERROR: str = "vector length must be exactly 1024 or 1536"
+VECTOR_NORM_ERROR: str = "vector norm must be finite and non-zero"
+VECTOR_NORMALIZATION_ERROR: str = "vector must be L2-normalized (norm ~= 1.0)"
+
+VectorLike = Union[Sequence[float], "NDArray[np.floating]"]
+
+
+def _numpy() -> Optional[ModuleType]:
+    # NumPy is never imported here, which keeps it off the import path of the models: if the
+    # caller has not imported it, no argument can be an ndarray.
+    return sys.modules.get("numpy")
+
+
+def _norm_error(l2_norm: float) -> Optional[str]:
+    if not math.isfinite(l2_norm) or l2_norm == 0.0:
+        return VECTOR_NORM_ERROR
+    if abs(l2_norm - 1.0) > VECTOR_NORM_TOLERANCE:
+        return VECTOR_NORMALIZATION_ERROR
+    return None
+
+
+def vector_error(vector: VectorLike) -> Optional[str]:
+    """Return the first length/finiteness/norm violation of one vector, or None when valid.
+
+    NumPy arrays are reduced with a vectorized dot product. Python sequences use
+    ``math.hypot``, which runs in C and is faster than converting a list to an array.
+    """
+    if len(vector) not in SUPPORTED_VECTOR_DIMS:
+        return VECTOR_LENGTH_ERROR
+    np = _numpy()
+    if np is not None and isinstance(vector, np.ndarray):
+        values = vector.astype(np.float64, copy=False)
+        with np.errstate(over="ignore", invalid="ignore"):
+            return _norm_error(float(np.sqrt(np.dot(values, values))))
+    return _norm_error(math.hypot(*vector))
+
+
+def vector_errors(vectors: Union[Sequence[VectorLike], "NDArray[np.floating]"]) -> List[Optional[str]]:
+    """Check a batch of vectors; returns one error message (or None) per vector, in order.
+
+    A 2-D NumPy array, or equal-length NumPy rows, are checked in a single vectorized
+    pass. Without NumPy every vector goes through :func:`vector_error`.
+    """
+    np = _numpy()
+    if np is None:
+        return [vector_error(vector) for vector in vectors]
+    if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+        return _matrix_errors(vectors)
+
+    results: List[Optional[str]] = [None] * len(vectors)
+    array_rows: Dict[int, List[int]] = {}
+    for position, vector in enumerate(vectors):
+        if isinstance(vector, np.ndarray) and vector.ndim == 1:
+            array_rows.setdefault(vector.shape[0], []).append(position)
+        else:
+            results[position] = vector_error(vector)
+    for positions in array_rows.values():
+        matrix = np.stack([vectors[position] for position in positions])
+        for position, error in zip(positions, _matrix_errors(matrix)):
+            results[position] = error
+    return results
+
+
+def _matrix_errors(matrix: NDArray[np.floating]) -> List[Optional[str]]:
+    np = cast(ModuleType, _numpy())
+    if matrix.shape[1] not in SUPPORTED_VECTOR_DIMS:
+        return [VECTOR_LENGTH_ERROR] * matrix.shape[0]
+    values = matrix.astype(np.float64, copy=False)
+    with np.errstate(over="ignore", invalid="ignore"):
+        norms = np.sqrt(np.einsum("ij,ij->i", values, values))
+    valid = np.isfinite(norms) & (norms != 0.0) & (np.abs(norms - 1.0) <= VECTOR_NORM_TOLERANCE)
+    if bool(valid.all()):
+        return [None] * matrix.shape[0]
+    return [None if is_valid else _norm_error(float(norm)) for is_valid, norm in zip(valid.tolist(), norms.tolist())]
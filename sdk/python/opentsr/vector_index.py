@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple, Union, cast
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    np = None  # type: ignore[assignment]
+
+from .vector_checks import SUPPORTED_VECTOR_DIMS, VECTOR_LENGTH_ERROR
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+JsonObject = Dict[str, object]
+StorageDtype = Literal["float32", "float16"]
+AnnMethod = Literal["ivf"]
+
+ENV_VALUES: Tuple[str, ...] = ("dev", "staging", "prod")
+ORIGIN_KIND_VALUES: Tuple[str, ...] = ("llm_agent", "sensor", "service", "human_operator", "simulator")
+
+SEGMENT_MAGIC: bytes = b"OTSRVSEG"
+SEGMENT_VERSION: int = 1
+SEGMENT_HEADER_BYTES: int = 64
+TSR_ID_BYTES: int = 36
+# magic, version, dtype code (0=float32, 1=float16), dim, row count; zero-padded to SEGMENT_HEADER_BYTES.
+_SEGMENT_HEADER = struct.Struct("<8sHBxIQ")
+_STORAGE_DTYPES: Tuple[str, ...] = ("<f4", "<f2")
+_SCORE_CHUNK_ROWS: int = 65_536
+ANN_METHODS: Tuple[str, ...] = ("ivf",)
+# k-means trains on at most this many rows per list, sampled from the rows indexed so far.
+_IVF_TRAIN_ROWS_PER_LIST: int = 256
+_IVF_TRAIN_ITERATIONS: int = 10
+# Filtered IVF search gathers scattered rows and loses recall, so it only runs when probing
+# would score at least this many times fewer rows than the filters alone leave.
+_IVF_MIN_FILTER_REDUCTION: int = 4
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("opentsr.vector_index requires numpy. Install with: pip install 'opentsr[vector]'")
+
+
+@dataclass(frozen=True)
+class VectorHit:
+    tsr_id: str
+    score: float
+    tsr_timestamp_ns: int
+    env: str
+    origin_kind: str
+    hazard_flag: bool
+
+
+def _grow(array: NDArray, size: int, capacity: int) -> NDArray:
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:size] = array[:size]
+    return grown
+
+
+class _DimensionStore:
+    """Contiguous float32 rows plus columnar metadata for one vector dimensionality."""
+
+    def __init__(self, dim: int, initial_capacity: int) -> None:
+        self.dim: int = dim
+        self.size: int = 0
+        self.vectors: NDArray[np.float32] = np.empty((initial_capacity, dim), dtype=np.float32)
+        self.timestamps: NDArray[np.int64] = np.empty(initial_capacity, dtype=np.int64)
+        self.envs: NDArray[np.uint8] = np.empty(initial_capacity, dtype=np.uint8)
+        self.origin_kinds: NDArray[np.uint8] = np.empty(initial_capacity, dtype=np.uint8)
+        self.hazard_flags: NDArray[np.bool_] = np.empty(initial_capacity, dtype=np.bool_)
+        self.lists: NDArray[np.int32] = np.empty(initial_capacity, dtype=np.int32)
+        self.tsr_ids: List[str] = []
+
+    def reserve(self, extra: int) -> None:
+        required: int = self.size + extra
+        capacity: int = self.vectors.shape[0]
+        if required <= capacity:
+            return
+        new_capacity: int = max(required, capacity * 2, 1)
+        self.vectors = _grow(self.vectors, self.size, new_capacity)
+        self.timestamps = _grow(self.timestamps, self.size, new_capacity)
+        self.envs = _grow(self.envs, self.size, new_capacity)
+        self.origin_kinds = _grow(self.origin_kinds, self.size, new_capacity)
+        self.hazard_flags = _grow(self.hazard_flags, self.size, new_capacity)
+        self.lists = _grow(self.lists, self.size, new_capacity)
+
+    def tsr_id(self, row: int) -> str:
+        return self.tsr_ids[row]
+
+    def clear(self) -> None:
+        self.size = 0
+        self.tsr_ids = []
+
+
+class _VectorSegment:
+    """Read-only, memory-mapped view over one sealed vector segment file.
+
+    Layout after the 64-byte header: ``count * dim`` little-endian vectors in the
+    storage dtype, then ``int64`` timestamps, ``uint8`` env, origin kind and hazard
+    columns, and fixed-width ASCII ``tsr_id`` values.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as segment_file:
+            header: bytes = segment_file.read(SEGMENT_HEADER_BYTES)
+        if len(header) < SEGMENT_HEADER_BYTES:
+            raise ValueError(f"vector segment header is truncated: {path}")
+        magic, version, dtype_code, dim, count = _SEGMENT_HEADER.unpack_from(header)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f"not an OpenTSR vector segment: {path}")
+        if dtype_code >= len(_STORAGE_DTYPES):
+            raise ValueError(f"unsupported vector segment dtype code {dtype_code}: {path}")
+
+        self.path: Path = path
+        self.dim: int = dim
+        self.size: int = count
+        vector_dtype = np.dtype(_STORAGE_DTYPES[dtype_code])
+        offset: int = SEGMENT_HEADER_BYTES
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+        vector_bytes: int = count * dim * vector_dtype.itemsize
+        self.vectors: NDArray[np.floating] = raw[offset : offset + vector_bytes].view(vector_dtype).reshape(count, dim)
+        offset += vector_bytes
+        self.timestamps: NDArray[np.int64] = raw[offset : offset + count * 8].view("<i8")
+        offset += count * 8
+        self.envs: NDArray[np.uint8] = raw[offset : offset + count]
+        offset += count
+        self.origin_kinds: NDArray[np.uint8] = raw[offset : offset + count]
+        offset += count
+        self.hazard_flags: NDArray[np.bool_] = raw[offset : offset + count].view(np.bool_)
+        offset += count
+        self.tsr_ids: NDArray[np.bytes_] = raw[offset : offset + count * TSR_ID_BYTES].view(f"S{TSR_ID_BYTES}")
+        self.lists: Optional[NDArray[np.int32]] = None
+        lists_path: Path = _lists_path(path)
+        if lists_path.exists():
+            self.lists = np.load(lists_path, mmap_mode="r")
+
+    def tsr_id(self, row: int) -> str:
+        return bytes(self.tsr_ids[row]).decode("ascii")
+
+
+_VectorSource = Union[_DimensionStore, _VectorSegment]
+
+
+def _lists_path(segment_path: Path) -> Path:
+    return segment_path.with_suffix(".ivf.npy")
+
+
+def _centroids_path(directory: Path, dim: int) -> Path:
+    return directory / f"ivf-{dim}.npy"
+
+
+def _save_array(path: Path, array: NDArray) -> None:
+    temp_path: Path = path.with_name(path.name + ".tmp")
+    with temp_path.open("wb") as array_file:
+        np.save(array_file, array)
+        array_file.flush()
+        os.fsync(array_file.fileno())
+    os.replace(temp_path, path)
+
+
+def _assign(vectors: NDArray[np.floating], centroids: NDArray[np.float32]) -> NDArray[np.int32]:
+    """Nearest centroid by inner product for each row, chunked like :func:`_scores`."""
+    count: int = vectors.shape[0]
+    lists = np.empty(count, dtype=np.int32)
+    for start in range(0, count, _SCORE_CHUNK_ROWS):
+        stop: int = min(start + _SCORE_CHUNK_ROWS, count)
+        lists[start:stop] = np.argmax(np.asarray(vectors[start:stop], dtype=np.float32) @ centroids.T, axis=1)
+    return lists
+
+
+def _train_centroids(sample: NDArray[np.float32], list_count: int, rng: np.random.Generator) -> NDArray[np.float32]:
+    """Spherical k-means: unit-norm centroids maximizing inner product with ``sample`` rows."""
+    centroids: NDArray[np.float32] = sample[rng.choice(sample.shape[0], list_count, replace=False)].copy()
+    for _ in range(_IVF_TRAIN_ITERATIONS):
+        assigned: NDArray[np.int32] = _assign(sample, centroids)
+        counts: NDArray[np.intp] = np.bincount(assigned, minlength=list_count)
+        used: NDArray[np.bool_] = counts > 0
+        starts: NDArray[np.intp] = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sums = np.zeros_like(centroids)
+        sums[used] = np.add.reduceat(sample[np.argsort(assigned, kind="stable")], starts[used], axis=0)
+        empty: NDArray[np.bool_] = ~used
+        if empty.any():
+            # Re-seed empty lists from random rows so every list stays in use.
+            sums[empty] = sample[rng.choice(sample.shape[0], int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.where(norms > 0.0, norms, 1.0)
+    return centroids.astype(np.float32)
+
+
+def _write_segment(path: Path, store: _DimensionStore, storage_dtype: StorageDtype) -> None:
+    dtype_code: int = 1 if storage_dtype == "float16" else 0
+    size: int = store.size
+    encoded_ids: List[bytes] = [tsr_id.encode("ascii") for tsr_id in store.tsr_ids[:size]]
+    if any(len(tsr_id) > TSR_ID_BYTES for tsr_id in encoded_ids):
+        raise ValueError(f"tsr_id values must be at most {TSR_ID_BYTES} ASCII characters to be persisted")
+
+    temp_path: Path = path.with_suffix(path.suffix + ".tmp")
+    with temp_path.open("wb") as segment_file:
+        segment_file.write(
+            _SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, dtype_code, store.dim, size).ljust(SEGMENT_HEADER_BYTES, b"\0")
+        )
+        segment_file.write(store.vectors[:size].astype(_STORAGE_DTYPES[dtype_code]).tobytes())
+        segment_file.write(store.timestamps[:size].astype("<i8").tobytes())
+        segment_file.write(store.envs[:size].tobytes())
+        segment_file.write(store.origin_kinds[:size].tobytes())
+        segment_file.write(store.hazard_flags[:size].astype(np.uint8).tobytes())
+        segment_file.write(np.array(encoded_ids, dtype=f"S{TSR_ID_BYTES}").tobytes())
+        segment_file.flush()
+        os.fsync(segment_file.fileno())
+    os.replace(temp_path, path)
+
+
+def _scores(vectors: NDArray[np.floating], rows: Optional[NDArray[np.intp]], query: NDArray[np.float32]) -> NDArray[np.float32]:
+    if vectors.dtype == np.float32:
+        return (vectors if rows is None else vectors[rows]) @ query
+    # Upcast reduced-precision segments chunk by chunk so memory stays bounded.
+    count: int = vectors.shape[0] if rows is None else rows.shape[0]
+    scores = np.empty(count, dtype=np.float32)
+    for start in range(0, count, _SCORE_CHUNK_ROWS):
+        stop: int = min(start + _SCORE_CHUNK_ROWS, count)
+        chunk = vectors[start:stop] if rows is None else vectors[rows[start:stop]]
+        scores[start:stop] = chunk.astype(np.float32) @ query
+    return scores
+
+
+class VectorIndex:
+    """Hot index of L2-normalized signal vectors with exact top-k cosine search.
+
+    New vectors are kept in one contiguous float32 array per supported dimensionality
+    (1024 and 1536). When ``directory`` is set, ``flush()`` seals those rows into
+    fixed-stride binary segments (float32 or float16) that are memory-mapped on open,
+    so a restarted process can search without loading vectors into Python objects.
+    Metadata filters are evaluated as boolean masks before scoring.
+
+    With ``ann="ivf"`` the index also keeps an inverted-file partition per dimensionality:
+    once ``ann_train_rows`` rows exist, ``ann_lists`` centroids are trained by k-means and
+    every row, existing or new, is assigned to its nearest centroid. ``search`` then scores
+    only rows in the ``ann_probes`` lists closest to the query. Centroids and per-segment
+    list assignments are persisted next to the segments.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 1024,
+        directory: Optional[Path] = None,
+        storage_dtype: StorageDtype = "float32",
+        segment_rows: int = 65_536,
+        ann: Optional[AnnMethod] = None,
+        ann_lists: int = 256,
+        ann_probes: int = 8,
+        ann_train_rows: Optional[int] = None,
+    ) -> None:
+        _require_numpy()
+        if storage_dtype not in ("float32", "float16"):
+            raise ValueError(f"unsupported storage_dtype: {storage_dtype}. Supported: float32, float16")
+        if ann is not None and ann not in ANN_METHODS:
+            raise ValueError(f"unsupported ann: {ann}. Supported: {', '.join(ANN_METHODS)}")
+        if ann_lists < 1 or ann_probes < 1:
+            raise ValueError("ann_lists and ann_probes must be positive")
+        self._initial_capacity: int = initial_capacity
+        self._stores: Dict[int, _DimensionStore] = {}
+        self._segments: Dict[int, List[_VectorSegment]] = {}
+        self.directory: Optional[Path] = directory
+        self.storage_dtype: StorageDtype = storage_dtype
+        self.segment_rows: int = segment_rows
+        self._next_segment: int = 0
+        self.ann: Optional[AnnMethod] = ann
+        self.ann_lists: int = ann_lists
+        self.ann_probes: int = ann_probes
+        self.ann_train_rows: int = ann_train_rows if ann_train_rows is not None else 39 * ann_lists
+        self._centroids: Dict[int, NDArray[np.float32]] = {}
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            for segment_path in sorted(directory.glob("vectors-*.seg")):
+                segment = _VectorSegment(segment_path)
+                self._segments.setdefault(segment.dim, []).append(segment)
+                self._next_segment = max(self._next_segment, int(segment_path.stem.rsplit("-", 1)[-1]) + 1)
+            if ann is not None:
+                for dim in SUPPORTED_VECTOR_DIMS:
+                    centroids_path: Path = _centroids_path(directory, dim)
+                    if centroids_path.exists():
+                        self._centroids[dim] = np.load(centroids_path)
+                        self._assign_segments(dim)
+                    elif sum(segment.size for segment in self._segments.get(dim, [])) >= self.ann_train_rows:
+                        self._train(dim)
+
+    @classmethod
+    def open(
+        cls, directory: Path, storage_dtype: StorageDtype = "float32", ann: Optional[AnnMethod] = None, ann_probes: int = 8
+    ) -> "VectorIndex":
+        """Memory-map every sealed segment under ``directory``, with its IVF lists when ``ann`` is set."""
+        return cls(directory=directory, storage_dtype=storage_dtype, ann=ann, ann_probes=ann_probes)
+
+    def __len__(self) -> int:
+        sealed: int = sum(segment.size for segments in self._segments.values() for segment in segments)
+        return sealed + sum(store.size for store in self._stores.values())
+
+    def indexed(self, tsr_ids: Iterable[str]) -> Set[str]:
+        """The subset of ``tsr_ids`` that already have a row, sealed or buffered."""
+        wanted: Set[str] = set(tsr_ids)
+        if not wanted:
+            return set()
+        found: Set[str] = {tsr_id for store in self._stores.values() for tsr_id in store.tsr_ids[: store.size] if tsr_id in wanted}
+        probe: NDArray[np.bytes_] = np.array([tsr_id.encode("ascii") for tsr_id in wanted], dtype=f"S{TSR_ID_BYTES}")
+        for segments in self._segments.values():
+            for segment in segments:
+                found.update(bytes(match).decode("ascii") for match in segment.tsr_ids[np.isin(segment.tsr_ids, probe)])
+        return found
+
+    def _store(self, dim: int) -> _DimensionStore:
+        if dim not in SUPPORTED_VECTOR_DIMS:
+            raise ValueError(VECTOR_LENGTH_ERROR)
+        store: Optional[_DimensionStore] = self._stores.get(dim)
+        if store is None:
+            store = _DimensionStore(dim, self._initial_capacity)
+            self._stores[dim] = store
+        return store
+
+    def _sources(self, dim: int) -> List[_VectorSource]:
+        sources: List[_VectorSource] = list(self._segments.get(dim, []))
+        store: Optional[_DimensionStore] = self._stores.get(dim)
+        if store is not None and store.size > 0:
+            sources.append(store)
+        return sources
+
+    def add(
+        self,
+        tsr_id: str,
+        vector: Sequence[float],
+        tsr_timestamp_ns: int,
+        env: str,
+        origin_kind: str,
+        hazard_flag: bool,
+    ) -> None:
+        row: NDArray[np.float32] = np.asarray(vector, dtype=np.float32)
+        self.add_batch(
+            tsr_ids=[tsr_id],
+            vectors=row.reshape(1, -1),
+            tsr_timestamps_ns=[tsr_timestamp_ns],
+            envs=[env],
+            origin_kinds=[origin_kind],
+            hazard_flags=[hazard_flag],
+        )
+
+    def add_batch(
+        self,
+        tsr_ids: Sequence[str],
+        vectors: NDArray[np.floating],
+        tsr_timestamps_ns: Sequence[int],
+        envs: Sequence[str],
+        origin_kinds: Sequence[str],
+        hazard_flags: Sequence[bool],
+    ) -> None:
+        """Append rows that share one dimensionality; ``vectors`` has shape ``(n, dim)``."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("vectors must be a 2-D array of shape (n, dim)")
+        count: int = matrix.shape[0]
+        if not (len(tsr_ids) == len(tsr_timestamps_ns) == len(envs) == len(origin_kinds) == len(hazard_flags) == count):
+            raise ValueError("tsr_ids, vectors and metadata must have the same length")
+
+        store: _DimensionStore = self._store(matrix.shape[1])
+        store.reserve(count)
+        start: int = store.size
+        stop: int = start + count
+        store.vectors[start:stop] = matrix
+        store.timestamps[start:stop] = tsr_timestamps_ns
+        store.envs[start:stop] = [ENV_VALUES.index(env) for env in envs]
+        store.origin_kinds[start:stop] = [ORIGIN_KIND_VALUES.index(kind) for kind in origin_kinds]
+        store.hazard_flags[start:stop] = hazard_flags
+        store.tsr_ids.extend(tsr_ids)
+        store.size = stop
+        if self.ann is not None:
+            centroids: Optional[NDArray[np.float32]] = self._centroids.get(store.dim)
+            if centroids is not None:
+                store.lists[start:stop] = _assign(matrix, centroids)
+            elif sum(source.size for source in self._sources(store.dim)) >= self.ann_train_rows:
+                self._train(store.dim)
+        if self.directory is not None and store.size >= self.segment_rows:
+            self._seal(store)
+
+    def add_instance(self, instance: JsonObject) -> bool:
+        """Index the ``vector`` of a canonical signal dict; returns False when it has none."""
+        vector: object = instance.get("vector")
+        if not isinstance(vector, list):
+            return False
+        origin: JsonObject = cast(JsonObject, instance["origin"])
+        safety: JsonObject = cast(JsonObject, instance["safety"])
+        self.add(
+            tsr_id=cast(str, instance["tsr_id"]),
+            vector=cast(List[float], vector),
+            tsr_timestamp_ns=cast(int, instance["tsr_timestamp_ns"]),
+            env=cast(str, instance["env"]),
+            origin_kind=cast(str, origin["kind"]),
+            hazard_flag=bool(safety.get("hazard_flag", False)),
+        )
+        return True
+
+    def _train(self, dim: int) -> None:
+        """Train IVF centroids for ``dim`` on a sample of its rows and assign every row."""
+        sources: List[_VectorSource] = self._sources(dim)
+        total: int = sum(source.size for source in sources)
+        list_count: int = min(self.ann_lists, total)
+        rng = np.random.default_rng(dim)
+        picks: NDArray[np.intp] = np.sort(rng.choice(total, min(total, list_count * _IVF_TRAIN_ROWS_PER_LIST), replace=False))
+        parts: List[NDArray[np.float32]] = []
+        offset: int = 0
+        for source in sources:
+            rows = picks[(picks >= offset) & (picks < offset + source.size)] - offset
+            parts.append(np.asarray(source.vectors[rows], dtype=np.float32))
+            offset += source.size
+        centroids: NDArray[np.float32] = _train_centroids(np.concatenate(parts), list_count, rng)
+        self._centroids[dim] = centroids
+        store: Optional[_DimensionStore] = self._stores.get(dim)
+        if store is not None and store.size > 0:
+            store.lists[: store.size] = _assign(store.vectors[: store.size], centroids)
+        if self.directory is not None:
+            _save_array(_centroids_path(self.directory, dim), centroids)
+        self._assign_segments(dim)
+
+    def _assign_segments(self, dim: int) -> None:
+        """Give sealed segments without list assignments (older or interrupted writes) their lists."""
+        centroids: NDArray[np.float32] = self._centroids[dim]
+        for segment in self._segments.get(dim, []):
+            if segment.lists is None or segment.lists.shape[0] != segment.size:
+                segment.lists = _assign(segment.vectors, centroids)
+                _save_array(_lists_path(segment.path), segment.lists)
+
+    def _seal(self, store: _DimensionStore) -> None:
+        directory: Path = cast(Path, self.directory)
+        segment_path: Path = directory / f"vectors-{store.dim}-{self._next_segment:06d}.seg"
+        _write_segment(segment_path, store, self.storage_dtype)
+        if store.dim in self._centroids:
+            _save_array(_lists_path(segment_path), store.lists[: store.size].copy())
+        self._next_segment += 1
+        self._segments.setdefault(store.dim, []).append(_VectorSegment(segment_path))
+        store.clear()
+
+    def flush(self) -> None:
+        """Seal buffered rows into new memory-mapped segments under ``directory``."""
+        if self.directory is None:
+            raise ValueError("flush() requires a VectorIndex opened with a directory")
+        for store in self._stores.values():
+            if store.size > 0:
+                self._seal(store)
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        env: Optional[str] = None,
+        origin_kind: Optional[str] = None,
+        hazard_flag: Optional[bool] = None,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[VectorHit]:
+        """Top-k cosine search; time bounds are ``since_ns <= tsr_timestamp_ns < until_ns``.
+
+        Exact unless the IVF partition for the query's dimensionality is trained and ``exact``
+        is false. Then only rows in the ``probes`` (default ``ann_probes``) nearest lists are
+        scored, and the probe count doubles while fewer than ``k`` rows pass the filters.
+        Filters selective enough that probing would not cut the scored rows several times over
+        are searched exactly.
+        """
+        query_vector = np.asarray(query, dtype=np.float32)
+        if query_vector.ndim != 1:
+            raise ValueError("query must be a 1-D vector")
+        sources: List[_VectorSource] = self._sources(query_vector.shape[0])
+        if not sources or k <= 0:
+            return []
+        norm: float = float(np.linalg.norm(query_vector))
+        if not np.isfinite(norm) or norm == 0.0:
+            raise ValueError("query norm must be finite and non-zero")
+        query_vector = query_vector / norm
+
+        masks: List[Optional[NDArray[np.bool_]]] = [
+            self._filter_mask(source, env, origin_kind, hazard_flag, since_ns, until_ns) for source in sources
+        ]
+        centroids: Optional[NDArray[np.float32]] = None if exact else self._centroids.get(query_vector.shape[0])
+        if centroids is not None:
+            probes = probes or self.ann_probes
+            total: int = sum(source.size for source in sources)
+            passing: int = sum(source.size if mask is None else int(np.count_nonzero(mask)) for source, mask in zip(sources, masks))
+            if passing * centroids.shape[0] > _IVF_MIN_FILTER_REDUCTION * probes * total:
+                masks = self._probe_masks(sources, masks, centroids @ query_vector, probes, k)
+
+        candidates: List[Tuple[float, int, int]] = []
+        for source_number, (source, mask) in enumerate(zip(sources, masks)):
+            size: int = source.size
+            if mask is None:
+                rows = np.arange(size)
+                scores = _scores(source.vectors[:size], None, query_vector)
+            else:
+                rows = np.flatnonzero(mask)
+                if rows.size == 0:
+                    continue
+                scores = _scores(source.vectors, rows, query_vector)
+
+            top: int = min(k, scores.shape[0])
+            best = np.argpartition(-scores, top - 1)[:top]
+            candidates.extend((float(scores[position]), source_number, int(rows[position])) for position in best)
+
+        candidates.sort(key=lambda candidate: -candidate[0])
+        return [self._hit(sources[source_number], row, score) for score, source_number, row in candidates[:k]]
+
+    @staticmethod
+    def _filter_mask(
+        source: _VectorSource,
+        env: Optional[str],
+        origin_kind: Optional[str],
+        hazard_flag: Optional[bool],
+        since_ns: Optional[int],
+        until_ns: Optional[int],
+    ) -> Optional[NDArray[np.bool_]]:
+        size: int = source.size
+        mask: Optional[NDArray[np.bool_]] = None
+        if env is not None:
+            mask = _and(mask, source.envs[:size] == ENV_VALUES.index(env))
+        if origin_kind is not None:
+            mask = _and(mask, source.origin_kinds[:size] == ORIGIN_KIND_VALUES.index(origin_kind))
+        if hazard_flag is not None:
+            mask = _and(mask, source.hazard_flags[:size] == hazard_flag)
+        if since_ns is not None:
+            mask = _and(mask, source.timestamps[:size] >= since_ns)
+        if until_ns is not None:
+            mask = _and(mask, source.timestamps[:size] < until_ns)
+        return mask
+
+    @staticmethod
+    def _probe_masks(
+        sources: List[_VectorSource],
+        masks: List[Optional[NDArray[np.bool_]]],
+        centroid_scores: NDArray[np.float32],
+        probes: int,
+        k: int,
+    ) -> List[Optional[NDArray[np.bool_]]]:
+        """Narrow the filter masks to rows in the nearest lists, probing more lists until ``k`` rows pass."""
+        ranked: NDArray[np.intp] = np.argsort(-centroid_scores)
+        while True:
+            probed = np.zeros(ranked.shape[0], dtype=np.bool_)
+            probed[ranked[:probes]] = True
+            narrowed: List[Optional[NDArray[np.bool_]]] = []
+            for source, mask in zip(sources, masks):
+                in_lists: NDArray[np.bool_] = probed[np.asarray(source.lists[: source.size])]  # type: ignore[index]
+                narrowed.append(_and(mask, in_lists))
+            if probes >= ranked.shape[0] or sum(int(np.count_nonzero(mask)) for mask in narrowed) >= k:
+                return narrowed
+            probes *= 2
+
+    @staticmethod
+    def _hit(source: _VectorSource, row: int, score: float) -> VectorHit:
+        return VectorHit(
+            tsr_id=source.tsr_id(row),
+            score=score,
+            tsr_timestamp_ns=int(source.timestamps[row]),
+            env=ENV_VALUES[int(source.envs[row])],
+            origin_kind=ORIGIN_KIND_VALUES[int(source.origin_kinds[row])],
+            hazard_flag=bool(source.hazard_flags[row]),
+        )
+
+
+def _and(mask: Optional[NDArray[np.bool_]], condition: NDArray[np.bool_]) -> NDArray[np.bool_]:
+    return condition if mask is None else mask & condition
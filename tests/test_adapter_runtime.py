@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentsr import AdapterRuntime, TSRSignal, read_records
+from opentsr.adapter_runtime import compile_mapping
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+REGISTRY_PATH: Path = REPO_ROOT / "adapters" / "registry.json"
+ADAPTER_IDS: List[str] = [entry["adapter_id"] for entry in json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))["adapters"]]
+PH_METER_CSV: str = (
+    "device_id,device_type,captured_at,reading.value,reading.unit,reading.temperature_c,location\n"
+    "phm-221,ph_meter,2026-02-20T10:41:12Z,6.42,pH,24.8,line-7-reactor\n"
+    "phm-222,ph_meter,2026-02-20T10:41:13.5+00:00,7.01,pH,,\n"
+    "phm-223,ph_meter,2026-02-20T10:41:14Z,not-a-number,pH,24.1,line-7-reactor\n"
+    ",ph_meter,2026-02-20T10:41:15Z,6.90,pH,24.0,line-7-reactor\n"
+)
+
+
+@pytest.mark.parametrize("adapter_id", ADAPTER_IDS)
+def test_registered_mappings_reproduce_adapter_examples(adapter_id: str) -> None:
+    runtime = AdapterRuntime.from_registry(REGISTRY_PATH)
+    manifest = runtime.adapters[adapter_id].manifest
+    for example in manifest["examples"]:  # type: ignore[attr-defined]
+        source = json.loads((REPO_ROOT / example["source_path"]).read_text(encoding="utf-8"))
+        expected = json.loads((REPO_ROOT / example["opentsr_path"]).read_text(encoding="utf-8"))
+        mapped = runtime.map_record(adapter_id, source)
+
+        TSRSignal.model_validate(mapped).validate()
+        # The example outputs carry their own tsr_id and a timestamp that predates captured_at.
+        for generated in ("tsr_id", "tsr_timestamp_ns"):
+            mapped.pop(generated)
+            expected.pop(generated)
+        assert mapped == expected
+
+
+def test_ingest_maps_csv_batches_and_counts_errors(tmp_path: Path) -> None:
+    runtime = AdapterRuntime.from_registry(REGISTRY_PATH)
+    records = read_records(io.StringIO(PH_METER_CSV), "csv")
+    results = list(runtime.ingest("generic-ph-meter", records, cold_store_dir=tmp_path / "cold", batch_size=3))
+
+    assert [number for number, _ in results] == [1, 2, 3, 4]
+    assert [result.status_code for _, result in results] == [202, 202, 400, 400]
+    assert results[2][1].message == "adapter mapping failed: payload.physical:sensor.value: could not convert string to float: 'not-a-number'"
+    assert results[3][1].message == "adapter mapping failed: origin.source_id: missing source field device_id"
+
+    second = json.loads(next(path for path in (tmp_path / "cold").glob("*.json") if b"phm-222" in path.read_bytes()).read_bytes())
+    assert second["tsr_timestamp_ns"] == 1771584073500000000
+    assert "location" not in second["payload"]["physical:sensor"] and "temperature_c" not in second["payload"]
+    stats = runtime.stats["generic-ph-meter"]
+    assert (stats.records, stats.accepted, stats.mapping_errors, stats.rejected) == (4, 2, 2, 0)
+    assert set(runtime.report()) == {"generic-ph-meter"} and runtime.report()["generic-ph-meter"]["records_per_sec"] > 0
+
+
+def test_mapped_signals_that_fail_validation_are_rejected(tmp_path: Path) -> None:
+    runtime = AdapterRuntime.from_registry(REGISTRY_PATH)
+    record = {
+        "device_serial": "WRM-1",
+        "mode": "brightfield",
+        "objective": "40x",
+        "magnification": "400",
+        "captured_at": "2026-02-20T10:44:25Z",
+        "image_uri": "s3://vendor-exports/wrm/a.tif",
+        "image_sha256": "short",
+    }
+    results = list(runtime.ingest("woehrsh-rm-compound-microscope", read_records(io.StringIO(json.dumps(record) + "\n"), "ndjson"), tmp_path))
+
+    assert results[0][1].status_code == 400
+    assert results[0][1].message.startswith("invalid signal:")
+    assert "payload.sha256_hash must be a 64-character" in results[0][1].message
+    assert runtime.stats["woehrsh-rm-compound-microscope"].rejected == 1
+
+
+def test_compile_mapping_rejects_overlapping_targets() -> None:
+    with pytest.raises(ValueError, match="nested under a mapped value"):
+        compile_mapping("overlap", {"fields": {"payload": {"const": {}}, "payload.value": {"source": "value"}}})
+    with pytest.raises(ValueError, match="unknown adapter: nope"):
+        AdapterRuntime.from_registry(REGISTRY_PATH).map_record("nope", {})
+
+
+def test_non_finite_numbers_are_mapping_errors(tmp_path: Path) -> None:
+    runtime = AdapterRuntime.from_registry(REGISTRY_PATH)
+    lines = [
+        '{"device_id": "phm-1", "device_type": "ph_meter", "captured_at": 1e400, "reading": {"value": 6.4, "unit": "pH"}}',
+        '{"device_id": "phm-2", "device_type": "ph_meter", "captured_at": 1771584072, "reading": {"value": NaN, "unit": "pH"}}',
+        '{"device_id": "phm-3", "device_type": "ph_meter", "captured_at": 1771584072, "reading": {"value": 6.4, "unit": "pH"}}',
+    ]
+    results = list(runtime.ingest("generic-ph-meter", read_records(io.StringIO("\n".join(lines) + "\n"), "ndjson"), tmp_path / "cold"))
+
+    assert [result.status_code for _, result in results] == [400, 400, 202]
+    assert results[0][1].message == "adapter mapping failed: tsr_timestamp_ns: cannot convert non-finite inf to timestamp"
+    assert results[1][1].message == "adapter mapping failed: payload.physical:sensor.value: cannot convert non-finite nan to float"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from opentsr import Origin, Safety, TSRSignal, ingest_batch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _vector_signal() -> TSRSignal:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://plant-alpha/temp-3", namespace="test"),
+        payload={"event": "temperature_spike"},
+        safety=Safety(veracity_score=0.99, hazard_flag=True),
+        vector=[1.0] + [0.0] * 1023,
+    )
+
+
+@pytest.mark.parametrize("validation_mode", ["pydantic", "schema", "both"])
+def test_ingest_batch_returns_one_result_per_payload(tmp_path: Path, validation_mode: str) -> None:
+    minimal = json.loads((REPO_ROOT / "examples" / "minimal_signal.json").read_text(encoding="utf-8"))
+    invalid = dict(minimal, env="qa")
+    vector_payload = _vector_signal().as_json_dict()
+
+    results = ingest_batch(
+        payloads=[minimal, invalid, vector_payload],
+        cold_store_dir=tmp_path / "cold",
+        validation_mode=validation_mode,  # type: ignore[arg-type]
+    )
+
+    assert [result.status_code for result in results] == [202, 400, 202]
+    assert results[1].message.startswith("invalid signal:")
+    assert results[2].hot_indexed is True
+    assert Path(str(results[0].cold_path)).is_file()
+    hot_lines = (tmp_path / "cold" / "hot_vectors.ndjson").read_text(encoding="utf-8").splitlines()
+    assert json.loads(hot_lines[0])["vector_dim"] == 1024
+
+
+@pytest.mark.parametrize("validation_mode", ["pydantic", "schema", "both"])
+def test_ingest_batch_verifies_signatures(tmp_path: Path, validation_mode: str) -> None:
+    signed = _vector_signal()
+    signed.sign(key=b"batch-key")
+    tampered = signed.as_json_dict()
+    tampered["safety"] = dict(tampered["safety"], hazard_flag=False)  # type: ignore[arg-type]
+
+    results = ingest_batch(
+        payloads=[signed.as_json_dict(), tampered],
+        cold_store_dir=tmp_path / "cold",
+        verify_signatures=True,
+        signature_key=b"batch-key",
+        validation_mode=validation_mode,  # type: ignore[arg-type]
+    )
+
+    assert [result.status_code for result in results] == [202, 400]
+    assert results[1].message == "invalid signal: signature verification failed"
+
+
+def test_ingest_batch_rejects_unknown_validation_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unsupported validation_mode"):
+        ingest_batch(payloads=[], cold_store_dir=tmp_path, validation_mode="none")  # type: ignore[arg-type]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from opentsr import BlobFinding, BlobVerifier, Origin, ResourceRef, Safety, TSRSignal, ingest_batch
+from opentsr.blob_verify import blob_refs, sha256_file
+
+
+def _blob(path: Path, content: bytes) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def _signal(blob_url: str, sha256_hash: str, resources: Optional[List[ResourceRef]] = None) -> dict:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://evidence", namespace="test"),
+        payload={"event": "capture", "blob_url": blob_url, "sha256_hash": sha256_hash},
+        safety=Safety(veracity_score=0.9),
+        resources=resources,
+    ).as_json_dict()
+
+
+def test_sha256_file_matches_hashlib_across_chunk_boundaries(tmp_path: Path) -> None:
+    content = os.urandom(10_000)
+    expected = _blob(tmp_path / "blob.bin", content)
+    assert sha256_file(tmp_path / "blob.bin", chunk_bytes=4096) == expected
+    assert sha256_file(tmp_path / "blob.bin") == expected
+    empty = _blob(tmp_path / "empty.bin", b"")
+    assert sha256_file(tmp_path / "empty.bin") == empty
+
+
+def test_resolve_and_cache_by_path_mtime_and_size(tmp_path: Path) -> None:
+    digest = _blob(tmp_path / "store" / "frames" / "a.tif", b"frame-a")
+    with BlobVerifier(base_dir=tmp_path / "store", url_prefixes={"s3://evidence/": tmp_path / "store"}) as verifier:
+        assert verifier.resolve("file://" + str(tmp_path / "store" / "frames" / "a.tif")) == tmp_path / "store" / "frames" / "a.tif"
+        assert verifier.resolve("frames/a.tif") == tmp_path / "store" / "frames" / "a.tif"
+        assert verifier.resolve("s3://evidence/frames/a.tif") == tmp_path / "store" / "frames" / "a.tif"
+        assert verifier.resolve("s3://evidence/../secrets") is None
+        assert verifier.resolve("https://r2.example.com/a.tif") is None
+
+        signal = _signal("s3://evidence/frames/a.tif", digest)
+        assert verifier.verify(signal) == [] and verifier.verify(signal) == []
+        assert (verifier.hashed_bytes, verifier.cache_hits) == (7, 1)
+
+        os.utime(tmp_path / "store" / "frames" / "a.tif", ns=(1, 1))
+        assert verifier.verify(signal) == [] and verifier.hashed_bytes == 14
+
+
+def test_references_are_confined_to_configured_directories(tmp_path: Path) -> None:
+    _blob(tmp_path / "secret.txt", b"secret")
+    digest = _blob(tmp_path / "store" / "a.bin", b"alpha")
+    (tmp_path / "store" / "escape.bin").symlink_to(tmp_path / "secret.txt")
+    os.mkfifo(tmp_path / "store" / "pipe")
+    with BlobVerifier(base_dir=tmp_path / "store", url_prefixes={"s3://evidence/": tmp_path / "store"}) as verifier:
+        for blob_url in (
+            "../secret.txt",
+            "../../../../etc/hostname",
+            str(tmp_path / "secret.txt"),
+            "file://" + str(tmp_path / "secret.txt"),
+            "escape.bin",
+            "s3://evidence/escape.bin",
+        ):
+            assert verifier.resolve(blob_url) is None, blob_url
+        assert verifier.resolve(str(tmp_path / "store" / "a.bin")) == tmp_path / "store" / "a.bin"
+        assert [finding.kind for finding in verifier.verify(_signal("pipe", digest))] == ["unreadable"]
+
+    with BlobVerifier() as unconfigured:
+        assert unconfigured.resolve("a.bin") is None and unconfigured.resolve(str(tmp_path / "secret.txt")) is None
+
+
+def test_findings_cover_mismatch_size_missing_and_unresolved(tmp_path: Path) -> None:
+    digest = _blob(tmp_path / "a.bin", b"alpha")
+    resources = [
+        ResourceRef(blob_url=str(tmp_path / "a.bin"), sha256_hash=digest, size_bytes=4),
+        ResourceRef(blob_url=str(tmp_path / "gone.bin"), sha256_hash=digest),
+        ResourceRef(blob_url="https://r2.example.com/pcap/net-0001.pcap", sha256_hash=digest),
+    ]
+    signal = _signal(str(tmp_path / "a.bin"), "0" * 64, resources)
+    assert [ref.location for ref in blob_refs(signal)] == ["payload", "resources[0]", "resources[1]", "resources[2]"]
+
+    with BlobVerifier(require_resolvable=True, allow_local_paths=True) as verifier:
+        findings = verifier.verify(signal)
+    assert [(finding.location, finding.kind) for finding in findings] == [
+        ("payload", "mismatch"),
+        ("resources[0]", "size_mismatch"),
+        ("resources[1]", "missing"),
+        ("resources[2]", "unresolved"),
+    ]
+    assert findings[0].actual == digest and findings[1].message.endswith(": " + str(tmp_path / "a.bin") + " (expected 4)")
+
+
+def test_ingest_rejects_mismatched_blobs_in_order(tmp_path: Path) -> None:
+    digests = [_blob(tmp_path / "blobs" / f"{number}.bin", f"blob-{number}".encode()) for number in range(6)]
+    payloads = [_signal(f"{number}.bin", digests[number] if number != 3 else digests[0]) for number in range(6)]
+    with BlobVerifier(base_dir=tmp_path / "blobs", workers=2) as verifier:
+        results = ingest_batch(payloads, tmp_path / "cold", blob_verifier=verifier)
+
+    assert [result.status_code for result in results] == [202, 202, 202, 400, 202, 202]
+    assert results[3].message == f"invalid signal: blob mismatch for payload: 3.bin (expected {digests[0]})"
+    assert not (tmp_path / "cold" / f"{payloads[3]['tsr_id']}.json").exists()
+
+
+    too_long = [_signal("x" * 300 + ".bin", digests[0]), _signal("0.bin", digests[0])]
+    with BlobVerifier(base_dir=tmp_path / "blobs") as verifier:
+        results = ingest_batch(too_long, tmp_path / "cold", blob_verifier=verifier)
+    assert [result.status_code for result in results] == [400, 202]
+    assert results[0].message.startswith("invalid signal: blob unreadable for payload: xxx")
+
+
+def test_audit_mode_accepts_and_reports_findings_later(tmp_path: Path) -> None:
+    reported: List[BlobFinding] = []
+    payloads = [_signal(str(tmp_path / "missing.bin"), "a" * 64)]
+    with BlobVerifier(mode="audit", on_finding=reported.append, allow_local_paths=True) as verifier:
+        results = ingest_batch(payloads, tmp_path / "cold", blob_verifier=verifier)
+    assert results[0].status_code == 202
+    assert [finding.kind for finding in verifier.findings] == ["missing"] and reported == verifier.findings
+
+    with BlobVerifier(allow_local_paths=True) as auditor:
+        assert [finding.tsr_id for finding in auditor.audit(payloads * 3)] == [payloads[0]["tsr_id"]] * 3
+    with pytest.raises(ValueError, match="unsupported blob verification mode: later"):
+        BlobVerifier(mode="later")  # type: ignore[arg-type]
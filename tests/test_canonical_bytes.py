@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from opentsr import Origin, Safety, TSRSignal, ingest_signal
+
+
+def _signal() -> TSRSignal:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="service", source_id="svc-canonical", namespace="test"),
+        payload={"event": "canonical", "z": 1, "a": [1, 2]},
+        safety=Safety(veracity_score=0.75, hazard_flag=False),
+    )
+
+
+def test_canonical_bytes_are_cached_and_invalidated_on_field_assignment() -> None:
+    signal = _signal()
+    first = signal.canonical_bytes()
+
+    assert first is signal.canonical_bytes()
+    assert json.loads(first) == signal.as_json_dict()
+
+    signal.sign(key=b"canonical-key")
+    signed = signal.canonical_bytes()
+    assert signed is not first
+    assert json.loads(signed)["safety"]["signature_alg"] == "hmac-sha256"
+    assert signal.verify_signature(key=b"canonical-key") is True
+
+    signal.origin.region = "eu-west"
+    assert json.loads(signal.canonical_bytes())["origin"]["region"] == "eu-west"
+    assert signal.verify_signature(key=b"canonical-key") is False
+
+
+def test_copies_do_not_reuse_the_original_canonical_cache() -> None:
+    signal = _signal()
+    signal.canonical_bytes()
+
+    copied = signal.model_copy(update={"env": "staging"})
+    assert json.loads(copied.canonical_bytes())["env"] == "staging"
+    assert json.loads(signal.canonical_bytes())["env"] == "dev"
+
+    bogus = signal.model_copy(update={"env": "bogus"})
+    with pytest.raises(ValueError, match="bogus"):
+        bogus.validate()
+
+    signal.sign(key=b"canonical-key")
+    resigned = signal.model_copy(deep=True, update={"env": "staging"})
+    resigned.sign(key=b"canonical-key")
+    assert TSRSignal.model_validate(resigned.as_json_dict()).verify_signature(key=b"canonical-key") is True
+
+
+def test_in_place_container_edits_need_explicit_invalidation() -> None:
+    signal = _signal()
+    stale = signal.canonical_bytes()
+
+    signal.payload["z"] = 2
+    assert signal.canonical_bytes() is stale
+
+    signal.invalidate_canonical_cache()
+    assert json.loads(signal.canonical_bytes())["payload"]["z"] == 2
+
+
+def test_ingest_persists_canonical_bytes(tmp_path: Path) -> None:
+    signal = _signal()
+    result = ingest_signal(signal.as_json_dict(), cold_store_dir=tmp_path / "cold")
+
+    assert Path(str(result.cold_path)).read_bytes() == signal.canonical_bytes()
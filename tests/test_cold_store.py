@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from opentsr import Origin, Safety, SegmentedColdStore, TSRSignal, ingest_batch
+
+
+def _payload(sequence: int) -> dict:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="service", source_id="svc-cold", namespace="test"),
+        payload={"event": "cold", "sequence": sequence},
+        safety=Safety(veracity_score=0.7, hazard_flag=False),
+    ).as_json_dict()
+
+
+def test_segmented_store_reports_locators_and_reads_back(tmp_path: Path) -> None:
+    payloads = [_payload(sequence) for sequence in range(20)]
+    with SegmentedColdStore(tmp_path / "cold", segment_max_bytes=1024, fsync_batch_size=8) as store:
+        results = ingest_batch(payloads, cold_store_dir=tmp_path / "cold", cold_store=store)
+
+        assert all(result.status_code == 202 for result in results)
+        assert "segment-000000.log@16:" in str(results[0].cold_path)
+        assert len(list((tmp_path / "cold").glob("segment-*.log"))) > 1
+        assert store.get(str(payloads[13]["tsr_id"])) == payloads[13]
+
+    assert not list((tmp_path / "cold").glob("*.json"))
+
+
+def test_segmented_store_recovers_unindexed_and_torn_records(tmp_path: Path) -> None:
+    root = tmp_path / "cold"
+    payloads = [_payload(sequence) for sequence in range(3)]
+    with SegmentedColdStore(root) as store:
+        for payload in payloads:
+            store.put(str(payload["tsr_id"]), json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+    index_path = root / "index.bin"
+    index_bytes = index_path.read_bytes()
+    index_path.write_bytes(index_bytes[: len(index_bytes) // 3 + 5])
+    with (root / "segment-000000.log").open("ab") as segment_file:
+        segment_file.write(struct.pack(">II", 256, 0) + b"{\"tsr_id\"")
+
+    with SegmentedColdStore(root) as reopened:
+        assert len(reopened) == 3
+        assert reopened.get(str(payloads[2]["tsr_id"])) == payloads[2]
+        fresh = _payload(99)
+        reopened.put(str(fresh["tsr_id"]), json.dumps(fresh).encode("utf-8"))
+        assert reopened.get(str(fresh["tsr_id"])) == fresh
+
+
+def test_segmented_store_truncates_zero_filled_and_corrupt_tails(tmp_path: Path) -> None:
+    root = tmp_path / "cold"
+    payloads = [_payload(sequence) for sequence in range(3)]
+    records = [json.dumps(payload, sort_keys=True).encode("utf-8") for payload in payloads]
+    with SegmentedColdStore(root) as store:
+        for payload, record in zip(payloads[:2], records):
+            store.put(str(payload["tsr_id"]), record)
+    segment_path = root / "segment-000000.log"
+    durable_size = segment_path.stat().st_size
+    (root / "index.bin").write_bytes(b"")
+    with segment_path.open("ab") as segment_file:
+        # A full-length record whose bytes were never written, after power loss.
+        segment_file.write(struct.pack(">II", len(records[2]), zlib.crc32(records[2])) + bytes(len(records[2])))
+        segment_file.write(bytes(4096))
+    # A segment whose header never reached the disk.
+    (root / "segment-000001.log").write_bytes(bytes(16))
+
+    with SegmentedColdStore(root) as reopened:
+        assert len(reopened) == 2
+        assert segment_path.stat().st_size == durable_size
+        assert reopened.get(str(payloads[1]["tsr_id"])) == payloads[1]
+        assert "segment-000001.log@16:" in reopened.put(str(payloads[2]["tsr_id"]), records[2])
+
+    (root / "segment-000002.log").write_bytes(b"not a segment at all")
+    with pytest.raises(ValueError, match="not an OpenTSR cold store segment"):
+        SegmentedColdStore(root)
+
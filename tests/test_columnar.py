@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import List
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from opentsr import ColumnBundle, DirectoryColdStore, Origin, Safety, SegmentedColdStore, TSRSignal, Trace, export_columns
+from opentsr.models import JsonObject
+
+
+def _payload(sequence: int) -> JsonObject:
+    vector = [(-1) ** (sequence + position) / math.sqrt(1024) for position in range(1024)] if sequence % 3 == 0 else None
+    return TSRSignal(
+        env="dev" if sequence % 2 else "staging",
+        origin=Origin(kind="sensor", source_id=f"sensor://columns/{sequence % 4}", region="eu-west-1" if sequence % 2 else None),
+        payload={"event": "reading", "sequence": sequence},
+        safety=Safety(veracity_score=sequence / 100, hazard_flag=sequence % 5 == 0),
+        vector=vector,
+        trace=Trace(trace_id=f"trace-{sequence}", span_id="span-1") if sequence % 4 == 0 else None,
+    ).as_json_dict()
+
+
+def _assert_matches(bundle: ColumnBundle, payloads: List[JsonObject]) -> None:
+    by_id = {str(payload["tsr_id"]): payload for payload in payloads}
+    tsr_ids = [tsr_id.decode("ascii") for tsr_id in bundle.column("tsr_id").tolist()]
+    assert sorted(tsr_ids) == sorted(by_id) and len(bundle) == len(payloads)
+
+    rows = [by_id[tsr_id] for tsr_id in tsr_ids]
+    assert bundle.column("tsr_timestamp_ns").tolist() == [row["tsr_timestamp_ns"] for row in rows]
+    assert bundle.column("safety.veracity_score").tolist() == [row["safety"]["veracity_score"] for row in rows]  # type: ignore[index]
+    assert bundle.column("safety.hazard_flag").tolist() == [row["safety"]["hazard_flag"] for row in rows]  # type: ignore[index]
+    assert bundle.column("env").tolist() == [row["env"] for row in rows]
+    assert bundle.column("origin.source_id").tolist() == [row["origin"]["source_id"] for row in rows]  # type: ignore[index]
+    assert bundle.column("origin.region").tolist() == [row["origin"].get("region") for row in rows]  # type: ignore[attr-defined]
+    assert bundle.column("trace.trace_id").tolist() == [row["trace"]["trace_id"] if "trace" in row else None for row in rows]  # type: ignore[index]
+
+    vector_rows, matrix = bundle.vectors(1024)
+    assert vector_rows.tolist() == [index for index, row in enumerate(rows) if "vector" in row]
+    for row_number, vector in zip(vector_rows.tolist(), matrix):
+        np.testing.assert_array_equal(vector, np.asarray(rows[row_number]["vector"], dtype=np.float32))
+    assert bundle.vectors(1536)[1].shape == (0, 1536)
+
+
+def test_segmented_export_appends_only_new_signals(tmp_path: Path) -> None:
+    payloads = [_payload(sequence) for sequence in range(30)]
+    bundle_dir = tmp_path / "columns"
+    with SegmentedColdStore(tmp_path / "cold", segment_max_bytes=16 * 1024) as store:
+        for payload in payloads[:20]:
+            store.put(str(payload["tsr_id"]), json.dumps(payload).encode("utf-8"))
+        assert export_columns(store, bundle_dir, part_rows=8) == 20
+        assert export_columns(store, bundle_dir) == 0
+        for payload in payloads[20:]:
+            store.put(str(payload["tsr_id"]), json.dumps(payload).encode("utf-8"))
+        assert export_columns(store, bundle_dir) == 10
+
+    bundle = ColumnBundle(bundle_dir)
+    assert len(bundle.parts) == 4
+    assert bundle.column("tsr_id").tolist() == [str(payload["tsr_id"]).encode("ascii") for payload in payloads]
+    _assert_matches(bundle, payloads)
+
+
+def test_directory_export_skips_exported_and_partial_files(tmp_path: Path) -> None:
+    payloads = [_payload(sequence) for sequence in range(12)]
+    store = DirectoryColdStore(tmp_path / "cold")
+    bundle_dir = tmp_path / "columns"
+    for payload in payloads[:7]:
+        store.put(str(payload["tsr_id"]), json.dumps(payload).encode("utf-8"))
+    assert export_columns(store, bundle_dir) == 7
+
+    for payload in payloads[7:]:
+        store.put(str(payload["tsr_id"]), json.dumps(payload).encode("utf-8"))
+    (tmp_path / "cold" / "00000000-0000-7000-8000-000000000000.json").write_text('{"tsr_id": ', encoding="utf-8")
+    assert export_columns(store, bundle_dir) == 5
+    _assert_matches(ColumnBundle(bundle_dir), payloads)
+
+    with SegmentedColdStore(tmp_path / "segments") as segmented, pytest.raises(ValueError, match="exported from a directory cold store"):
+        export_columns(segmented, bundle_dir)
+    with pytest.raises(ValueError, match="unsupported string column: payload"):
+        ColumnBundle(bundle_dir).column("payload")
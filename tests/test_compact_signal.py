@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+from array import array
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentsr import CompactSignal, Environment, Origin, OriginKind, Safety, TSRSignal, Trace
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+FIXTURE_PATHS: List[Path] = sorted(REPO_ROOT.glob("examples/*.json")) + sorted(REPO_ROOT.glob("adapters/*/examples/opentsr.json"))
+KEY: bytes = b"compact-signal-key"
+
+
+def _vector_signal(vector: List[float]) -> TSRSignal:
+    signal = TSRSignal(
+        env="staging",
+        origin=Origin(kind="sensor", source_id="sensor://compact", region="eu-west-1"),
+        payload={"event": "reading", "nested": {"values": [1, 2.5, None]}},
+        safety=Safety(veracity_score=0.75, hazard_flag=True),
+        vector=vector,
+        tags=["a", "b"],
+        trace=Trace(),
+    )
+    signal.sign(KEY)
+    return signal
+
+
+@pytest.mark.parametrize("fixture_path", FIXTURE_PATHS, ids=lambda path: str(path.relative_to(REPO_ROOT)))
+def test_round_trip_is_lossless_for_fixtures(fixture_path: Path) -> None:
+    signal = TSRSignal.model_validate_json(fixture_path.read_text(encoding="utf-8"))
+    compact = CompactSignal.from_signal(signal)
+
+    assert json.dumps(compact.as_json_dict()) == json.dumps(signal.as_json_dict())
+    assert compact.to_signal().canonical_bytes() == signal.canonical_bytes()
+    assert CompactSignal.from_json(signal.canonical_bytes()) == compact
+
+
+def test_vector_storage_is_packed_and_lossless() -> None:
+    float32_exact: List[float] = array("f", [1 / math.sqrt(1024)] * 1024).tolist()
+    float64_only: List[float] = [(-1) ** index / math.sqrt(1536) for index in range(1536)]
+
+    for vector, typecode in ((float32_exact, "f"), (float64_only, "d")):
+        signal = _vector_signal(vector)
+        compact = CompactSignal.from_signal(signal)
+        assert compact.vector is not None and compact.vector.typecode == typecode
+        assert compact.env is Environment.STAGING and compact.origin_kind is OriginKind.SENSOR
+        restored = compact.to_signal()
+        assert restored.vector == vector
+        assert restored.canonical_bytes() == signal.canonical_bytes()
+        assert restored.verify_signature(KEY)
+        restored.validate()
+
+    rounded = CompactSignal.from_signal(_vector_signal(float64_only), vector_dtype="float32")
+    assert rounded.vector is not None and rounded.vector.typecode == "f"
+    assert rounded.as_json_dict()["vector"] == array("f", float64_only).tolist()
+
+
+def test_compact_signals_are_slotted_and_frozen() -> None:
+    compact = CompactSignal.from_signal(_vector_signal([1 / math.sqrt(1024)] * 1024))
+    assert not hasattr(compact, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compact.hazard_flag = False  # type: ignore[misc]
+    with pytest.raises(ValueError, match="unsupported vector_dtype: float16"):
+        CompactSignal.from_signal(_vector_signal([1 / math.sqrt(1024)] * 1024), vector_dtype="float16")  # type: ignore[arg-type]
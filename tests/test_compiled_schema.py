@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import pytest
+from jsonschema import Draft202012Validator, FormatChecker
+
+from opentsr import TSRSignal, _compiled_schema, codegen, ingest_signal
+from opentsr.compiled_schema import compiled_validator
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SCHEMA_PATH: Path = REPO_ROOT / "spec" / "schema.json"
+FIXTURE_PATHS: List[Path] = sorted(REPO_ROOT.glob("examples/*.json")) + sorted(REPO_ROOT.glob("adapters/*/examples/opentsr.json"))
+
+JsonObject = Dict[str, object]
+JsonPath = Tuple[Union[str, int], ...]
+
+PROBES: List[object] = [None, True, False, 0, -1, 1, 1.0, 1.5, -2.5, 2**63, "", "x", "not-a-uuid", [], [1, 1], {}, {"extra": 1}]
+
+
+def _schema_strings(node: object) -> Iterator[str]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in ("const", "enum"):
+                yield from (each for each in (value if isinstance(value, list) else [value]) if isinstance(each, str))
+            else:
+                yield from _schema_strings(value)
+    elif isinstance(node, list):
+        for each in node:
+            yield from _schema_strings(each)
+
+
+def _paths(node: object, path: JsonPath = ()) -> Iterator[JsonPath]:
+    yield path
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _paths(value, path + (key,))
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            yield from _paths(value, path + (index,))
+
+
+def _replaced(instance: JsonObject, path: JsonPath, value: object) -> JsonObject:
+    mutated: JsonObject = copy.deepcopy(instance)
+    parent: object = mutated
+    for part in path[:-1]:
+        parent = parent[part]  # type: ignore[index]
+    parent[path[-1]] = value  # type: ignore[index]
+    return mutated
+
+
+def _mutations(instance: JsonObject, probes: List[object]) -> Iterator[object]:
+    yield instance
+    for path in _paths(instance):
+        target: object = instance
+        for part in path:
+            target = target[part]  # type: ignore[index]
+        if isinstance(target, dict):
+            yield _replaced(instance, path, {**target, "unexpected": 1}) if path else {**target, "unexpected": 1}
+            for key in target:
+                trimmed: JsonObject = {name: value for name, value in target.items() if name != key}
+                yield _replaced(instance, path, trimmed) if path else trimmed
+        if path:
+            for probe in probes:
+                yield _replaced(instance, path, probe)
+    for key, value in (("vector", [0.0] * 1024), ("vector", [0.5] * 1536 + [2.0]), ("vector", [True] * 1536)):
+        yield {**instance, key: value}
+    for combination in ({"env": "prod"}, {"origin": {"kind": "llm_agent", "source_id": "agent://x"}}):
+        yield {**instance, **combination}
+
+
+def _jsonschema_first_error(validator: Draft202012Validator, instance: object) -> Optional[Tuple[JsonPath, str]]:
+    error = next(iter(validator.iter_errors(instance)), None)
+    return None if error is None else (tuple(error.absolute_path), error.message)
+
+
+def test_generated_validator_matches_spec() -> None:
+    schema_bytes = SCHEMA_PATH.read_bytes()
+    assert _compiled_schema.SCHEMA_SHA256 == codegen.schema_digest(schema_bytes), "run `python -m opentsr.codegen`"
+    assert Path(_compiled_schema.__file__).read_text(encoding="utf-8") == codegen.render_validator_module(schema_bytes)
+
+
+@pytest.mark.parametrize("fixture_path", FIXTURE_PATHS, ids=lambda path: str(path.relative_to(REPO_ROOT)))
+def test_compiled_validator_reports_the_first_jsonschema_error(fixture_path: Path) -> None:
+    schema: JsonObject = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    reference = Draft202012Validator(schema, format_checker=FormatChecker())
+    compiled = compiled_validator()
+    probes: List[object] = PROBES + sorted(set(_schema_strings(schema)))
+    instance: JsonObject = json.loads(fixture_path.read_text(encoding="utf-8"))
+
+    checked: int = 0
+    rejected: int = 0
+    for mutated in _mutations(instance, probes):
+        expected = _jsonschema_first_error(reference, mutated)
+        assert compiled.check(mutated) == expected, json.dumps(mutated)[:300]
+        checked += 1
+        rejected += expected is not None
+    assert reference.is_valid(instance) and rejected > checked // 2
+
+
+def test_runtime_compilation_and_engine_selection(tmp_path: Path) -> None:
+    runtime = compiled_validator(str(SCHEMA_PATH))
+    assert runtime.schema_sha256 == _compiled_schema.SCHEMA_SHA256
+    instance: JsonObject = json.loads((REPO_ROOT / "examples" / "minimal_signal.json").read_text(encoding="utf-8"))
+    assert runtime.is_valid(instance)
+
+    signal = TSRSignal.model_validate(instance)
+    assert signal.validate(schema_engine="compiled")
+    with pytest.raises(ValueError, match="unsupported schema_engine: fast"):
+        signal.validate(schema_engine="fast")  # type: ignore[arg-type]
+
+    invalid: JsonObject = {**instance, "env": "qa"}
+    results = [
+        ingest_signal(invalid, tmp_path / engine, validation_mode="schema", schema_engine=engine)  # type: ignore[arg-type]
+        for engine in ("jsonschema", "compiled")
+    ]
+    assert results[0] == results[1]
+    assert results[0].message == "invalid signal: OpenTSR schema validation failed at env: 'qa' is not one of ['dev', 'staging', 'prod']"
+    assert ingest_signal(instance, tmp_path / "accepted", schema_engine="compiled").status_code == 202
+
+
+def test_unsupported_keywords_fail_at_generation_time() -> None:
+    with pytest.raises(ValueError, match="unsupported schema keyword: dependentSchemas"):
+        codegen.render_validator_module(b'{"type": "object", "dependentSchemas": {"a": {"required": ["b"]}}}')
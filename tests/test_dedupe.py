@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from opentsr import DedupeIndex, IngestSession, Origin, Safety, TSRSignal, ingest_batch
+from opentsr.models import _generate_uuid7
+
+HOUR_NS: int = 3600 * 1_000_000_000
+
+
+def _uuid7_at(unix_ms: int) -> str:
+    value = _generate_uuid7()
+    return f"{unix_ms:012x}"[:8] + "-" + f"{unix_ms:012x}"[8:] + value[13:]
+
+
+def _payload(sequence: int) -> dict:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://dedupe", namespace="test"),
+        payload={"event": "dedupe", "sequence": sequence},
+        safety=Safety(veracity_score=0.8),
+        vector=[1.0] + [0.0] * 1023,
+    ).as_json_dict()
+
+
+def test_retried_signals_are_reported_as_duplicates_without_rewrite(tmp_path: Path) -> None:
+    payloads = [_payload(sequence) for sequence in range(3)]
+    with DedupeIndex(tmp_path / "dedupe") as dedupe:
+        first = ingest_batch(payloads + [payloads[1]], cold_store_dir=tmp_path / "cold", dedupe_index=dedupe)
+        retried = ingest_batch([{**payloads[0], "env": "not-an-env"}], cold_store_dir=tmp_path / "cold", dedupe_index=dedupe)
+
+    assert [result.status_code for result in first] == [202, 202, 202, 200]
+    assert first[3].message == "duplicate" and first[3].cold_path is None
+    # Duplicates short-circuit before validation.
+    assert retried[0].status_code == 200
+    hot_lines = (tmp_path / "cold" / "hot_vectors.ndjson").read_text(encoding="utf-8").splitlines()
+    assert len(hot_lines) == 3
+
+    with DedupeIndex(tmp_path / "dedupe") as reopened:
+        assert len(reopened) == 3
+        assert all(payload["tsr_id"] in reopened for payload in payloads)
+        assert _generate_uuid7() not in reopened
+
+
+def test_non_object_payloads_are_rejected_with_a_dedupe_index(tmp_path: Path) -> None:
+    with DedupeIndex(tmp_path / "dedupe") as dedupe:
+        for mode in ("pydantic", "schema"):
+            payloads: list = [[1, 2], 7]
+            results = ingest_batch(payloads, cold_store_dir=tmp_path / "cold", dedupe_index=dedupe, validation_mode=mode)
+            assert [result.status_code for result in results] == [400, 400]
+        with IngestSession(tmp_path / "cold", dedupe_index=dedupe) as session:
+            assert session.ingest_signal([1, 2]).status_code == 400  # type: ignore[arg-type]
+
+
+def test_filter_is_rebuilt_after_unclean_shutdown(tmp_path: Path) -> None:
+    dedupe = DedupeIndex(tmp_path, expected_per_generation=4)
+    tsr_ids = [_generate_uuid7() for _ in range(50)]
+    assert all(dedupe.add(tsr_id) for tsr_id in tsr_ids)
+    assert not dedupe.add(tsr_ids[7])
+    dedupe.flush()
+    # No close(): the saved filters are missing, so the reopened index rebuilds them from the sets.
+    assert not list(tmp_path.glob("*.bloom"))
+
+    reopened = DedupeIndex(tmp_path, expected_per_generation=4)
+    assert len(reopened) == 50
+    assert all(tsr_id in reopened for tsr_id in tsr_ids)
+    reopened.close()
+    assert list(tmp_path.glob("*.bloom"))
+
+
+def test_generations_outside_the_window_are_expired(tmp_path: Path) -> None:
+    now_ns = time.time_ns()
+    clock = [now_ns]
+    dedupe = DedupeIndex(tmp_path, window_ns=2 * HOUR_NS, generation_ns=HOUR_NS, clock=lambda: clock[0])
+    old_id = _uuid7_at((now_ns - HOUR_NS) // 1_000_000)
+    new_id = _uuid7_at(now_ns // 1_000_000)
+    assert dedupe.add(old_id) and dedupe.add(new_id)
+    assert not dedupe.add(_uuid7_at((now_ns - 5 * HOUR_NS) // 1_000_000))
+
+    clock[0] = now_ns + 2 * HOUR_NS
+    assert dedupe.expire() == 1
+    assert old_id not in dedupe and new_id in dedupe
+    dedupe.close()
+    assert len(list(tmp_path.glob("*.set"))) == 1
+
+
+def test_future_dated_ids_cannot_open_generations(tmp_path: Path) -> None:
+    now_ns = time.time_ns()
+    dedupe = DedupeIndex(tmp_path, window_ns=2 * HOUR_NS, generation_ns=HOUR_NS, clock=lambda: now_ns, expected_per_generation=4)
+    skewed_id = _uuid7_at((now_ns + 60 * 1_000_000_000) // 1_000_000)
+    assert dedupe.add(skewed_id) and skewed_id in dedupe
+    assert not any(dedupe.add(_uuid7_at((now_ns + hours * HOUR_NS) // 1_000_000)) for hours in range(1, 200))
+    assert len(list(tmp_path.glob("*.set"))) <= 2 and dedupe.max_generations == 4
+    dedupe.close()
+
+    # Generations from before the bound existed are dropped on open.
+    (tmp_path / f"generation-{(now_ns + 100 * HOUR_NS) // HOUR_NS:012d}.set").write_bytes(b"")
+    with DedupeIndex(tmp_path, window_ns=2 * HOUR_NS, generation_ns=HOUR_NS, clock=lambda: now_ns) as reopened:
+        assert skewed_id in reopened
+    assert len(list(tmp_path.glob("*.set"))) <= 2
+
+
+def test_invalid_configuration_and_ids(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="false_positive_rate"):
+        DedupeIndex(tmp_path, false_positive_rate=1.5)
+    with DedupeIndex(tmp_path) as dedupe:
+        assert "not-a-uuid" not in dedupe
+        with pytest.raises(ValueError, match="tsr_id must be a UUID"):
+            dedupe.add("not-a-uuid")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from opentsr import IngestMetrics, Origin, ParallelIngestPipeline, Safety, TSRSignal, Trace, ingest_batch, ingest_signal_json
+from opentsr.ingest_server import METRICS_PATH, IngestServer
+from opentsr.metrics import IngestEvent, otel_span_event_sink
+
+KEY: bytes = b"metrics-key"
+
+
+def _payload(sequence: int, **overrides: object) -> dict:
+    signal = TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://metrics", region="eu-west-1"),
+        payload={"event": "metrics", "sequence": sequence},
+        safety=Safety(veracity_score=0.8),
+        trace=Trace(trace_id="4bf92f3577b34da6a3ce929d0e0e4736", span_id="00f067aa0ba902b7"),
+    )
+    signal.sign(KEY)
+    return {**signal.as_json_dict(), **overrides}
+
+
+def test_batch_ingest_records_stages_reasons_and_sizes(tmp_path: Path) -> None:
+    events: List[IngestEvent] = []
+    metrics = IngestMetrics(sinks=[events.append])
+    unsigned = _payload(3)
+    unsigned["safety"] = {"veracity_score": 0.8}
+    payloads = [_payload(1), _payload(2), _payload(4, env="qa"), unsigned, _payload(5, payload={"big": "x" * (1024 * 1024 + 1)})]
+
+    with pytest.warns(RuntimeWarning, match="soft limit"):
+        results = ingest_batch(payloads, tmp_path / "cold", verify_signatures=True, signature_key=KEY, metrics=metrics)
+
+    assert [result.status_code for result in results] == [202, 202, 400, 400, 400]
+    assert metrics.results == {202: 2, 400: 3}
+    assert metrics.rejections == {"model": 1, "signature_missing": 1, "signature_invalid": 1}
+    assert metrics.soft_limit_warnings == 1
+    assert metrics.stage_seconds["pydantic"].count == 4 and metrics.stage_seconds["schema"].count == 4
+    assert metrics.stage_seconds["signature"].count == 4 and metrics.stage_seconds["cold_write"].count == 2
+    assert metrics.stage_seconds["parse"].count == 0 and metrics.signal_bytes.count == 4
+
+    accepted = events[0]
+    assert accepted.status_code == 202 and accepted.reason is None
+    assert accepted.attributes["opentsr.id"] == payloads[0]["tsr_id"]
+    assert accepted.attributes["opentsr.origin.source_id"] == "sensor://metrics"
+    assert accepted.attributes["opentsr.origin.region"] == "eu-west-1"
+    assert accepted.attributes["opentsr.safety.veracity_score"] == 0.8
+    assert accepted.timestamp_ns == payloads[0]["tsr_timestamp_ns"] and accepted.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert set(accepted.stage_seconds) == {"pydantic", "schema", "signature", "cold_write"}
+    assert events[2].attributes == {"opentsr.ingest.status_code": 400, "opentsr.ingest.reason": "model"}
+
+    text = metrics.prometheus_text()
+    assert 'opentsr_ingest_stage_seconds_count{stage="pydantic"} 4' in text
+    assert 'opentsr_ingest_stage_seconds_bucket{stage="cold_write",le="+Inf"} 2' in text
+    assert 'opentsr_ingest_rejections_total{reason="signature_missing"} 1' in text
+    assert "opentsr_ingest_payload_soft_limit_total 1" in text
+
+
+def test_json_entry_points_record_parse_stage_and_otel_events(tmp_path: Path) -> None:
+    added: List[Tuple[str, dict, int]] = []
+    metrics = IngestMetrics(sinks=[otel_span_event_sink(lambda name, attributes, timestamp: added.append((name, attributes, timestamp)))])
+
+    ingest_signal_json(json.dumps(_payload(1)), tmp_path / "cold", metrics=metrics)
+    ingest_signal_json("{broken", tmp_path / "cold", metrics=metrics)
+
+    assert metrics.stage_seconds["parse"].count == 1
+    assert metrics.rejections == {"invalid_json": 1}
+    assert [name for name, _, _ in added] == ["opentsr.ingest", "opentsr.ingest"]
+    assert added[0][1]["opentsr.ingest.status_code"] == 202 and added[0][2] is not None
+    assert metrics.snapshot()["results"] == {"202": 1, "400": 1}
+
+
+def test_parallel_pipeline_and_server_record_worker_observations(tmp_path: Path) -> None:
+    metrics = IngestMetrics()
+    items = [json.dumps(_payload(sequence)) for sequence in range(6)] + ["[]"]
+    with ParallelIngestPipeline(tmp_path / "parallel", workers=2, chunk_size=2, executor_kind="process", metrics=metrics) as pipeline:
+        results = list(pipeline.ingest(items))
+    assert [result.status_code for result in results] == [202] * 6 + [400]
+    assert metrics.stage_seconds["parse"].count == 7 and metrics.stage_seconds["pydantic"].count == 6
+    assert metrics.stage_seconds["cold_write"].count == 6 and metrics.rejections == {"invalid_json": 1}
+
+    async def scenario() -> str:
+        server = IngestServer(tmp_path / "server", port=0, metrics=IngestMetrics())
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            body = json.dumps(_payload(7)).encode("utf-8")
+            writer.write(f"POST /v1/signals HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            writer.write(f"GET {METRICS_PATH} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            response = (await reader.read()).decode("utf-8")
+            writer.close()
+            return response
+        finally:
+            await server.close()
+
+    response = asyncio.run(scenario())
+    assert "Content-Type: text/plain; version=0.0.4" in response
+    assert 'opentsr_ingest_results_total{status_code="202"} 1' in response
+    assert 'opentsr_ingest_stage_seconds_count{stage="parse"} 1' in response
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+from opentsr import DirectoryColdStore, Origin, Safety, TSRSignal
+from opentsr.ingest_server import INGEST_PATH, IngestServer
+
+
+def _signal_body(sequence: int, vector: bool = False) -> bytes:
+    return json.dumps(
+        TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id="sensor://server", namespace="test"),
+            payload={"event": "server", "sequence": sequence},
+            safety=Safety(veracity_score=0.8),
+            vector=[1.0] + [0.0] * 1023 if vector else None,
+        ).as_json_dict()
+    ).encode("utf-8")
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, head: str, body: bytes = b""
+) -> Tuple[int, Dict[str, str], dict]:
+    writer.write(head.encode("latin-1") + b"\r\n\r\n" + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    headers: Dict[str, str] = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+    return int(status_line.split()[1]), headers, payload
+
+
+def _post(body: bytes) -> str:
+    return f"POST {INGEST_PATH} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}"
+
+
+def test_server_accepts_and_rejects_over_keep_alive(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        server = IngestServer(tmp_path / "cold", port=0, max_body_bytes=64 * 1024)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            status, _, payload = await _request(reader, writer, _post(_signal_body(1)), _signal_body(1))
+            assert status == 202 and payload["status_code"] == 202
+            assert Path(payload["cold_path"]).exists()
+
+            status, _, payload = await _request(reader, writer, _post(b"{broken"), b"{broken")
+            assert status == 400 and payload["message"].startswith("invalid JSON:")
+
+            body = _signal_body(2)
+            chunked = f"{len(body):x}\r\n".encode() + body + b"\r\n0\r\n\r\n"
+            head = f"POST {INGEST_PATH} HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked"
+            status, _, payload = await _request(reader, writer, head, chunked)
+            assert status == 202
+
+            status, headers, payload = await _request(reader, writer, _post(b"x" * 65 * 1024))
+            assert status == 413 and headers["connection"] == "close"
+            writer.close()
+
+            concurrent = await asyncio.gather(
+                *(_post_one(server.port, _signal_body(sequence)) for sequence in range(10, 30))
+            )
+            assert [status for status, _, _ in concurrent] == [202] * 20
+            assert len(list((tmp_path / "cold").glob("*.json"))) == 22
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+async def _post_one(port: int, body: bytes) -> Tuple[int, Dict[str, str], dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        return await _request(reader, writer, _post(body), body)
+    finally:
+        writer.close()
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+class _BlockingColdStore(DirectoryColdStore):
+    def __init__(self, release: threading.Event) -> None:
+        super().__init__(Path("unused"))
+        self.release = release
+        self.entered = threading.Event()
+        self.records: Dict[str, bytes] = {}
+
+    def put(self, tsr_id: str, record: bytes) -> str:
+        self.entered.set()
+        self.release.wait(timeout=5)
+        self.records[tsr_id] = record
+        return f"memory:{tsr_id}"
+
+
+def test_server_sheds_load_with_429_and_503(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        server = IngestServer(tmp_path / "cold", port=0, max_in_flight=0)
+        await server.start()
+        try:
+            status, headers, _ = await _post_one(server.port, _signal_body(1))
+            assert status == 429 and headers["retry-after"] == "1"
+        finally:
+            await server.close()
+        with pytest.raises(ValueError, match="smaller than max_in_flight"):
+            IngestServer(tmp_path / "cold", max_in_flight=8, write_queue_size=8)
+
+        release = threading.Event()
+        store = _BlockingColdStore(release)
+        server = IngestServer(tmp_path / "cold", port=0, write_queue_size=1, cold_store=store)
+        await server.start()
+        try:
+            # The first write blocks the writer and the second fills the queue.
+            pending = [asyncio.create_task(_post_one(server.port, _signal_body(2)))]
+            await _wait_for(store.entered.is_set)
+            pending.append(asyncio.create_task(_post_one(server.port, _signal_body(3))))
+            assert server._write_queue is not None
+            await _wait_for(server._write_queue.full)
+            status, headers, payload = await _post_one(server.port, _signal_body(4))
+            assert status == 503 and headers["retry-after"] == "1"
+            assert payload["message"] == "write queue is full; retry later"
+            release.set()
+            assert [status for status, _, _ in await asyncio.gather(*pending)] == [202, 202]
+        finally:
+            release.set()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+class _FailingColdStore(DirectoryColdStore):
+    def put(self, tsr_id: str, record: bytes) -> str:
+        if b'"sequence":2' in record:
+            raise OSError("disk full")
+        return super().put(tsr_id, record)
+
+
+def test_server_maps_bad_chunks_to_400_and_write_failures_to_500(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        server = IngestServer(tmp_path / "cold", port=0, cold_store=_FailingColdStore(tmp_path / "cold"))
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            head = f"POST {INGEST_PATH} HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked"
+            status, headers, payload = await _request(reader, writer, head, b"zz\r\n{}\r\n0\r\n\r\n")
+            assert status == 400 and headers["connection"] == "close"
+            assert payload["message"] == "malformed chunk size: zz"
+            writer.close()
+
+            status, _, payload = await _post_one(server.port, _signal_body(2))
+            assert status == 500 and payload["message"] == "write failed: disk full"
+            status, _, _ = await _post_one(server.port, _signal_body(1, vector=True))
+            assert status == 202
+            # Flushed after the write batch, before the server closes.
+            assert len((tmp_path / "cold" / "hot_vectors.ndjson").read_text(encoding="utf-8").splitlines()) == 1
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentsr import DedupeIndex, IngestResult, IngestSession, MetadataIndex, Origin, Safety, SegmentedColdStore, TSRSignal, VectorIndex
+from opentsr.reference_ingest import _accepted_from_record
+
+
+def _payload(number: int, vector: bool = True) -> dict:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id=f"sensor://session/{number}", namespace="test"),
+        payload={"event": "reading", "number": number},
+        safety=Safety(veracity_score=0.9),
+        vector=[1.0 if position == number % 1024 else 0.0 for position in range(1024)] if vector else None,
+    ).as_json_dict()
+
+
+def _hot_ids(path: Path) -> List[str]:
+    return [json.loads(line)["tsr_id"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_batch_ingest_groups_commits_and_checkpoints_on_close(tmp_path: Path) -> None:
+    payloads = [_payload(number, vector=number % 2 == 0) for number in range(10)]
+    invalid = dict(payloads[3], env="nowhere")
+    with IngestSession(tmp_path / "cold", group_commit_records=4) as session:
+        results = session.ingest(payloads[:3] + [invalid] + payloads[4:])
+        assert session.ingest_signal_json("[]").message == "invalid JSON: root must be an object"
+
+    assert [result.status_code for result in results] == [202, 202, 202, 400] + [202] * 6
+    assert session.commits == 3
+    assert (tmp_path / "cold" / f"{payloads[9]['tsr_id']}.json").is_file()
+    assert _hot_ids(tmp_path / "cold" / "hot_vectors.ndjson") == [payloads[number]["tsr_id"] for number in (0, 2, 4, 6, 8)]
+    assert [path.name for path in sorted((tmp_path / "cold" / "wal").iterdir())] == ["checkpoint.json", "wal-000001.log"]
+    with pytest.raises(ValueError, match="ingest session is closed"):
+        session.ingest_signal(_payload(10))
+
+
+def test_reopen_replays_wal_into_stores_missing_writes(tmp_path: Path) -> None:
+    payloads = [_payload(number) for number in range(6)]
+    metadata_index = MetadataIndex(tmp_path / "metadata.sqlite")
+    session = IngestSession(tmp_path / "cold", checkpoint_bytes=1 << 30)
+    assert all(result.status_code == 202 for result in session.ingest(payloads))
+    session._writer._hot_file.flush()  # type: ignore[union-attr]
+    # Crash: the cold write of signal 4 and the hot append of signal 5 (half a line) were lost,
+    # and signal 3's cold file was left empty and signal 2's torn.
+    (tmp_path / "cold" / f"{payloads[4]['tsr_id']}.json").unlink()
+    (tmp_path / "cold" / f"{payloads[3]['tsr_id']}.json").write_bytes(b"")
+    torn_path = tmp_path / "cold" / f"{payloads[2]['tsr_id']}.json"
+    torn_path.write_bytes(torn_path.read_bytes()[:40])
+    hot_path = tmp_path / "cold" / "hot_vectors.ndjson"
+    lines = hot_path.read_bytes().splitlines(keepends=True)
+    hot_path.write_bytes(b"".join(lines[:5]) + lines[5][:20])
+
+    with IngestSession(tmp_path / "cold", metadata_index=metadata_index) as recovered:
+        assert recovered.recovered == 6
+    for number in (2, 3, 4):
+        assert json.loads((tmp_path / "cold" / f"{payloads[number]['tsr_id']}.json").read_bytes()) == payloads[number]
+    assert _hot_ids(hot_path) == [payload["tsr_id"] for payload in payloads]
+    assert len(metadata_index) == 6
+
+    with IngestSession(tmp_path / "cold") as reopened:
+        assert reopened.recovered == 0
+
+
+def test_checkpoint_seals_vector_index_before_dropping_the_wal(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    payloads = [_payload(number) for number in range(5)]
+    session = IngestSession(tmp_path / "cold", vector_index=VectorIndex(directory=tmp_path / "hot"), checkpoint_bytes=1)
+    assert [result.status_code for result in session.ingest(payloads)] == [202] * 5
+    # Crash without close: every commit was followed by a checkpoint, so the WAL is empty.
+
+    with IngestSession(tmp_path / "cold") as recovered:
+        assert recovered.recovered == 0
+    assert len(VectorIndex.open(tmp_path / "hot")) == 5
+
+
+def test_recovery_restores_vectors_whose_hot_lines_reached_disk(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    payloads = [_payload(number) for number in range(20)]
+    session = IngestSession(tmp_path / "cold", vector_index=VectorIndex(directory=tmp_path / "hot"), checkpoint_bytes=1 << 30)
+    assert all(result.status_code == 202 for result in session.ingest(payloads))
+    session._writer._hot_file.flush()  # type: ignore[union-attr]
+    # Crash: every hot line reached the disk, but no vector was sealed.
+    assert len(VectorIndex.open(tmp_path / "hot")) == 0
+
+    with IngestSession(tmp_path / "cold", vector_index=VectorIndex(directory=tmp_path / "hot")) as recovered:
+        assert recovered.recovered == 20
+    assert len(VectorIndex.open(tmp_path / "hot")) == 20
+    assert VectorIndex.open(tmp_path / "hot").indexed([payloads[3]["tsr_id"], "missing"]) == {payloads[3]["tsr_id"]}
+    assert len(_hot_ids(tmp_path / "cold" / "hot_vectors.ndjson")) == 20
+
+    with IngestSession(tmp_path / "cold", vector_index=VectorIndex(directory=tmp_path / "hot")) as reopened:
+        assert reopened.recovered == 0
+    assert len(VectorIndex.open(tmp_path / "hot")) == 20
+
+
+def test_resent_duplicates_are_not_logged_or_replayed_into_the_hot_index(tmp_path: Path) -> None:
+    payload = _payload(0)
+    hot_path = tmp_path / "cold" / "hot_vectors.ndjson"
+    with DedupeIndex(tmp_path / "dedupe") as dedupe_index:
+        with IngestSession(tmp_path / "cold", dedupe_index=dedupe_index) as first:
+            assert first.ingest_signal(payload).status_code == 202
+
+        session = IngestSession(tmp_path / "cold", dedupe_index=dedupe_index)
+        assert session.ingest_signal(payload).status_code == 200
+        assert session._wal_bytes == 0
+        # A resend that raced past the check is logged, then found to be a duplicate when applied.
+        session._log(session._check(_payload(1))[0], None)  # type: ignore[arg-type]
+        session._log(_accepted_from_record(json.dumps(payload, sort_keys=True).encode()), None)
+        session.commit()
+        session._writer._hot_file.flush()  # type: ignore[union-attr]
+
+        with IngestSession(tmp_path / "cold", dedupe_index=dedupe_index) as recovered:
+            assert recovered.recovered == 2
+    hot_ids = _hot_ids(hot_path)
+    assert len(hot_ids) == 2 and hot_ids.count(payload["tsr_id"]) == 1
+
+
+def test_torn_wal_tail_is_truncated_and_not_replayed(tmp_path: Path) -> None:
+    payloads = [_payload(number) for number in range(3)]
+    with SegmentedColdStore(tmp_path / "segments") as cold_store, DedupeIndex(tmp_path / "dedupe") as dedupe_index:
+        session = IngestSession(tmp_path / "cold", cold_store=cold_store, dedupe_index=dedupe_index)
+        session.ingest(payloads[:2])
+        segment = tmp_path / "cold" / "wal" / "wal-000000.log"
+        session._log(session._check(payloads[2])[0], None)  # type: ignore[arg-type]
+        session._wal_file.flush()
+        with segment.open("r+b") as wal_file:
+            wal_file.truncate(segment.stat().st_size - 7)
+
+        with IngestSession(tmp_path / "cold", cold_store=cold_store, dedupe_index=dedupe_index) as recovered:
+            assert recovered.recovered == 2
+            assert not segment.exists() and len(cold_store) == 2
+            assert recovered.ingest_signal(payloads[0]).status_code == 200
+            assert recovered.ingest_signal(payloads[2]).status_code == 202
+
+
+def test_concurrent_callers_are_all_committed(tmp_path: Path) -> None:
+    results: List[IngestResult] = []
+    lock = threading.Lock()
+
+    def worker(offset: int) -> None:
+        for number in range(offset, offset + 25):
+            result = session.ingest_signal(_payload(number))
+            with lock:
+                results.append(result)
+
+    with IngestSession(tmp_path / "cold") as session:
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(0, 200, 25)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(results) == 200 and all(result.status_code == 202 for result in results)
+    assert len(_hot_ids(tmp_path / "cold" / "hot_vectors.ndjson")) == 200
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from opentsr import MetadataIndex, Origin, Safety, TSRSignal, ingest_batch
+
+BASE_NS: int = 1_700_000_000_000_000_000
+
+
+def _payload(sequence: int) -> dict:
+    return TSRSignal(
+        tsr_timestamp_ns=BASE_NS + sequence * 1_000_000_000,
+        env="staging" if sequence % 2 else "dev",
+        origin=Origin(
+            kind="service" if sequence % 3 == 0 else "sensor",
+            source_id=f"sensor://site/{sequence % 4}",
+            namespace="test",
+        ),
+        payload={"event": "metadata", "sequence": sequence},
+        safety=Safety(veracity_score=sequence / 20, hazard_flag=sequence % 5 == 0),
+        tags=["alpha", "beta"] if sequence % 2 == 0 else ["alpha"],
+    ).as_json_dict()
+
+
+def test_ingest_populates_queryable_metadata(tmp_path: Path) -> None:
+    payloads = [_payload(sequence) for sequence in range(20)]
+    with MetadataIndex(tmp_path / "metadata.sqlite3") as index:
+        results = ingest_batch(payloads, cold_store_dir=tmp_path / "cold", metadata_index=index)
+        assert all(result.status_code == 202 for result in results)
+        assert len(index) == 20
+
+        hazards = index.query(source_id="sensor://site/0", hazard_flag=True)
+        assert [row.tsr_id for row in hazards] == [payloads[sequence]["tsr_id"] for sequence in (0,)]
+        assert hazards[0].cold_path == results[0].cold_path
+
+        window = index.query(since_ns=BASE_NS + 5_000_000_000, until_ns=BASE_NS + 10_000_000_000, newest_first=False)
+        assert [row.tsr_timestamp_ns for row in window] == [BASE_NS + second * 1_000_000_000 for second in range(5, 10)]
+
+        filtered = index.query(env="dev", origin_kind="service", min_veracity=0.5, tags=["alpha", "beta"])
+        assert [row.tsr_timestamp_ns for row in filtered] == [BASE_NS + 18_000_000_000, BASE_NS + 12_000_000_000]
+        assert index.query(tags=["beta"], limit=3)[0].tsr_timestamp_ns == BASE_NS + 18_000_000_000
+
+        ingest_batch(payloads[:2], cold_store_dir=tmp_path / "cold", metadata_index=index)
+        assert len(index) == 20
+
+    with MetadataIndex(tmp_path / "metadata.sqlite3") as reopened:
+        assert len(reopened.query(hazard_flag=False, limit=100)) == 16
+
+
+def test_query_rejects_non_positive_limit() -> None:
+    with MetadataIndex(":memory:") as index:
+        with pytest.raises(ValueError, match="limit must be >= 1"):
+            index.query(limit=0)
+
+
+def test_reingest_keeps_the_first_row_and_its_tags() -> None:
+    first = _payload(2)
+    moved = dict(first, tsr_timestamp_ns=BASE_NS + 99_000_000_000, tags=["gamma"])
+    with MetadataIndex(":memory:") as index:
+        index.add_instance(first)
+        index.flush()
+        index.add_instance(moved)
+        index.add_instance(dict(moved, tsr_timestamp_ns=BASE_NS + 98_000_000_000))
+        index.flush()
+        index.add_instance(dict(first, tags=["delta"]))
+        fresh = _payload(4)
+        index.add_instance(fresh)
+        index.add_instance(dict(fresh, tags=["epsilon"]))
+        assert len(index) == 2
+        assert [row.tsr_timestamp_ns for row in index.query()] == [BASE_NS + 4_000_000_000, BASE_NS + 2_000_000_000]
+        assert index.query(tags=["gamma"]) == [] and index.query(tags=["delta"]) == [] and index.query(tags=["epsilon"]) == []
+        tag_rows = index._connection.execute("SELECT COUNT(*) FROM signal_tags").fetchone()[0]
+        assert tag_rows == 4
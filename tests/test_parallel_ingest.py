@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from opentsr import Origin, Safety, TSRSignal, ingest_batch
+from opentsr.parallel_ingest import ParallelIngestPipeline, ingest_parallel
+
+
+def _payload(sequence: int) -> dict:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://parallel", namespace="test"),
+        payload={"event": "parallel", "sequence": sequence},
+        safety=Safety(veracity_score=0.8, hazard_flag=sequence % 2 == 0),
+        vector=[1.0] + [0.0] * 1023 if sequence % 3 == 0 else None,
+    ).as_json_dict()
+
+
+@pytest.mark.parametrize("executor_kind", ["process", "thread"])
+def test_parallel_ingest_matches_sequential_results_in_order(tmp_path: Path, executor_kind: str) -> None:
+    payloads = [_payload(sequence) for sequence in range(40)]
+    payloads[11]["env"] = "qa"
+    items: list = [json.dumps(payload) if sequence % 2 else payload for sequence, payload in enumerate(payloads)]
+    items[5] = "{broken"
+
+    results = ingest_parallel(
+        items, cold_store_dir=tmp_path / "parallel", workers=2, chunk_size=4, executor_kind=executor_kind
+    )
+    expected = ingest_batch(payloads[:5] + payloads[6:], cold_store_dir=tmp_path / "sequential")
+
+    statuses = [result.status_code for result in results]
+    assert len(results) == 40
+    assert statuses[5] == 400 and results[5].message.startswith("invalid JSON:")
+    assert statuses[:5] + statuses[6:] == [result.status_code for result in expected]
+    assert [result.hot_indexed for result in results[6:]] == [result.hot_indexed for result in expected[5:]]
+    assert Path(str(results[0].cold_path)).read_bytes() == Path(str(expected[0].cold_path)).read_bytes()
+
+
+def test_pipeline_rejects_invalid_configuration(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="workers must be >= 1"):
+        ParallelIngestPipeline(tmp_path, workers=0)
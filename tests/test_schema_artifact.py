@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from opentsr import _schema, codegen
+from opentsr.models import PRECOMPILED_SCHEMA, _default_schema_key
+
+REPO_ROOT: Path = Path(__file__).resolve().parents[1]
+SCHEMA_PATH: Path = REPO_ROOT / "spec" / "schema.json"
+
+
+def test_precompiled_schema_matches_spec() -> None:
+    schema_bytes = SCHEMA_PATH.read_bytes()
+    assert _schema.SCHEMA == json.loads(schema_bytes)
+    assert _schema.SCHEMA_SHA256 == codegen.schema_digest(schema_bytes), "run `python -m opentsr.codegen`"
+    assert Path(_schema.__file__).read_text(encoding="utf-8") == codegen.render_schema_module(schema_bytes)
+    assert _default_schema_key() == PRECOMPILED_SCHEMA
+
+
+def test_building_signals_does_not_import_validation_or_ingest_modules() -> None:
+    script = """
+import json, sys
+from opentsr import Origin, Safety, TSRSignal
+signal = TSRSignal(origin=Origin(kind="sensor", source_id="sensor://lazy"), payload={}, safety=Safety(veracity_score=0.5))
+signal.canonical_bytes()
+before = {name: name in sys.modules for name in ("jsonschema", "numpy", "opentsr.reference_ingest", "opentsr._schema")}
+signal.validate()
+after = {name: name in sys.modules for name in ("jsonschema", "opentsr._schema")}
+print(json.dumps([before, after]))
+"""
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    before, after = json.loads(output)
+    assert before == {"jsonschema": False, "numpy": False, "opentsr.reference_ingest": False, "opentsr._schema": False}
+    assert after == {"jsonschema": True, "opentsr._schema": True}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from opentsr import Keyring, Origin, Safety, TSRSignal, ingest_batch, sign_many, verify_many
+
+
+def _signal(source: str, sequence: int) -> TSRSignal:
+    return TSRSignal(
+        env="dev",
+        origin=Origin(kind="sensor", source_id=source, namespace="test"),
+        payload={"event": "signing", "sequence": sequence, "blob": "x" * 4096},
+        safety=Safety(veracity_score=0.7),
+    )
+
+
+def test_sign_many_matches_single_sign_and_verify_many_flags_tampering() -> None:
+    key = b"batch-key"
+    signals = [_signal("sensor://a", sequence) for sequence in range(600)]
+    singles = [_signal("sensor://a", 0)]
+    singles[0].tsr_id = signals[0].tsr_id
+    singles[0].tsr_timestamp_ns = signals[0].tsr_timestamp_ns
+
+    signatures = sign_many(signals, key)
+    assert signatures[0] == singles[0].sign(key)
+    assert all(signal.verify_signature(key) for signal in signals[:5])
+
+    signals[3].payload["sequence"] = -1
+    signals[3].invalidate_canonical_cache()
+    for workers in (None, 4):
+        flags = verify_many(signals, key, workers=workers, chunk_size=64)
+        assert flags[3] is False
+        assert flags[:3] + flags[4:] == [True] * 599
+    assert verify_many([_signal("sensor://a", 1)], key) == [False]
+
+
+def test_keyring_resolves_keys_by_source_id_and_supports_rotation(tmp_path: Path) -> None:
+    keyring = Keyring({"sensor://a": b"key-a", "sensor://b": b"key-b"})
+    signals = [_signal("sensor://a", 0), _signal("sensor://b", 1)]
+    sign_many(signals, keyring)
+    assert signals[0].verify_signature(b"key-a") and signals[1].verify_signature(b"key-b")
+
+    unknown = _signal("sensor://c", 2)
+    unsigned = unknown.canonical_bytes()
+    with pytest.raises(ValueError, match="no signing key for key id: sensor://c"):
+        sign_many([unknown], keyring)
+    assert unknown.safety.signature_alg is None and unknown.canonical_bytes() == unsigned
+    unknown.validate()
+
+    restored: Keyring = pickle.loads(pickle.dumps(keyring))
+    assert len(restored) == 2 and verify_many(signals, restored) == [True, True]
+
+    keyring.add("sensor://a", b"key-a-rotated")
+    assert verify_many(signals, keyring) == [False, True]
+
+    payloads = [signal.as_json_dict() for signal in signals]
+    for mode in ("pydantic", "schema"):
+        results = ingest_batch(
+            payloads,
+            cold_store_dir=tmp_path / mode,
+            verify_signatures=True,
+            signature_key=keyring,
+            validation_mode=mode,
+        )
+        assert [result.status_code for result in results] == [400, 202]
+        assert results[0].message == "invalid signal: signature verification failed"
+
+    keyring.remove("sensor://b")
+    results = ingest_batch(payloads[1:], cold_store_dir=tmp_path, verify_signatures=True, signature_key=keyring)
+    assert results[0].message == "invalid signal: no signature key for key id: sensor://b"
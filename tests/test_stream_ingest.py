@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+from opentsr import Origin, Safety, SegmentedColdStore, TSRSignal, ingest_stream
+
+
+def _line(sequence: int) -> str:
+    signal = TSRSignal(
+        env="dev",
+        origin=Origin(kind="service", source_id="svc-stream", namespace="test"),
+        payload={"event": "stream", "sequence": sequence},
+        safety=Safety(veracity_score=0.6, hazard_flag=False),
+    )
+    return json.dumps(signal.as_json_dict())
+
+
+def test_ingest_stream_yields_line_numbered_results_in_order(tmp_path: Path) -> None:
+    lines = [_line(0), "", "{not json", "[]", _line(1), "x" * 5000, json.dumps({"env": "dev"}), _line(2)]
+    readable = io.BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+
+    results = list(
+        ingest_stream(readable, cold_store_dir=tmp_path / "cold", batch_size=3, max_line_bytes=len(_line(0)) + 8)
+    )
+
+    assert [(line_number, result.status_code) for line_number, result in results] == [
+        (1, 202),
+        (3, 400),
+        (4, 400),
+        (5, 202),
+        (6, 400),
+        (7, 400),
+        (8, 202),
+    ]
+    assert results[1][1].message.startswith("invalid JSON:")
+    assert "exceeds" in results[4][1].message
+    assert results[5][1].message.startswith("invalid signal:")
+
+
+def test_ingest_stream_flushes_lagging_cold_store(tmp_path: Path) -> None:
+    readable = io.StringIO("\n".join(_line(sequence) for sequence in range(10)))
+
+    with SegmentedColdStore(tmp_path / "cold", fsync_batch_size=1000, fsync_interval_s=3600) as store:
+        for expected_line, (line_number, result) in enumerate(
+            ingest_stream(readable, cold_store_dir=tmp_path / "cold", cold_store=store, batch_size=2, max_pending_records=4),
+            start=1,
+        ):
+            assert (line_number, result.status_code) == (expected_line, 202)
+            assert store.pending < 4
+        assert len(store) == 10
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from opentsr import vector_checks
+from opentsr.vector_checks import VECTOR_LENGTH_ERROR, VECTOR_NORM_ERROR, VECTOR_NORMALIZATION_ERROR, vector_error, vector_errors
+
+VALID = [1.0] + [0.0] * 1023
+CASES = [
+    (VALID, None),
+    ([1.0] * 10, VECTOR_LENGTH_ERROR),
+    ([0.0] * 1536, VECTOR_NORM_ERROR),
+    ([math.nan] + [0.0] * 1023, VECTOR_NORM_ERROR),
+    ([math.inf] + [0.0] * 1023, VECTOR_NORM_ERROR),
+    ([0.5] + [0.0] * 1023, VECTOR_NORMALIZATION_ERROR),
+]
+
+
+@pytest.mark.parametrize("vector, expected", CASES)
+def test_vector_error_matches_model_messages(vector: list, expected: str) -> None:
+    assert vector_error(vector) == expected
+
+
+def test_vector_errors_numpy_batch_matches_scalar_path() -> None:
+    np = pytest.importorskip("numpy")
+    arrays = [np.asarray(vector, dtype=np.float32) for vector, _ in CASES]
+    expected = [error for _, error in CASES]
+
+    assert vector_errors(arrays) == expected
+    assert vector_errors(np.stack([arrays[0], arrays[4], arrays[5]])) == [None, VECTOR_NORM_ERROR, VECTOR_NORMALIZATION_ERROR]
+
+
+def test_vector_errors_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vector_checks, "_numpy", lambda: None)
+    assert vector_errors([vector for vector, _ in CASES]) == [error for _, error in CASES]
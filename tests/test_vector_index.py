@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from opentsr import Origin, Safety, TSRSignal, VectorIndex, ingest_batch, ingest_signal
+
+
+def _unit(dim: int, hot: int, tilt: float = 0.0) -> list:
+    vector = np.zeros(dim, dtype=np.float64)
+    vector[hot] = 1.0
+    vector[(hot + 1) % dim] = tilt
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def test_search_ranks_by_cosine_and_applies_filters() -> None:
+    index = VectorIndex(initial_capacity=2)
+    index.add("a", _unit(1024, 0), 100, "dev", "sensor", False)
+    index.add("b", _unit(1024, 0, tilt=0.5), 200, "prod", "sensor", True)
+    index.add("c", _unit(1024, 7), 300, "dev", "service", True)
+    index.add("d", _unit(1536, 0), 400, "dev", "sensor", False)
+
+    hits = index.search(_unit(1024, 0), k=2)
+    assert [hit.tsr_id for hit in hits] == ["a", "b"]
+    assert hits[0].score == pytest.approx(1.0)
+
+    assert [hit.tsr_id for hit in index.search(_unit(1024, 0), k=5, hazard_flag=True)] == ["b", "c"]
+    assert [hit.tsr_id for hit in index.search(_unit(1024, 0), k=5, env="dev", since_ns=150)] == ["c"]
+    assert [hit.tsr_id for hit in index.search(_unit(1536, 0), k=5)] == ["d"]
+    assert index.search(_unit(1024, 0), k=5, origin_kind="llm_agent") == []
+
+
+def test_ingest_batch_populates_vector_index(tmp_path: Path) -> None:
+    signal = TSRSignal(
+        env="staging",
+        origin=Origin(kind="sensor", source_id="sensor://line-1", namespace="test"),
+        payload={"event": "vibration"},
+        safety=Safety(veracity_score=0.9, hazard_flag=True),
+        vector=_unit(1024, 3),
+    )
+    index = VectorIndex()
+
+    results = ingest_batch([signal.as_json_dict()], cold_store_dir=tmp_path / "cold", vector_index=index)
+
+    assert results[0].hot_indexed is True
+    hit = index.search(_unit(1024, 3), k=1, env="staging")[0]
+    assert (hit.tsr_id, hit.origin_kind, hit.hazard_flag) == (signal.tsr_id, "sensor", True)
+
+
+def test_per_call_ingest_shares_one_segment_until_flush(tmp_path: Path) -> None:
+    signals = [
+        TSRSignal(
+            env="dev",
+            origin=Origin(kind="sensor", source_id="sensor://line-1", namespace="test"),
+            payload={"event": "vibration", "sequence": sequence},
+            safety=Safety(veracity_score=0.9),
+            vector=_unit(1024, sequence),
+        )
+        for sequence in range(50)
+    ]
+    index = VectorIndex(directory=tmp_path / "hot")
+    for signal in signals:
+        assert ingest_signal(signal.as_json_dict(), tmp_path / "cold", vector_index=index).hot_indexed is True
+    assert not list((tmp_path / "hot").glob("*.seg"))
+
+    index.flush()
+    assert len(list((tmp_path / "hot").glob("*.seg"))) == 1
+    reopened = VectorIndex.open(tmp_path / "hot")
+    assert len(reopened) == 50
+    assert [hit.tsr_id for hit in reopened.search(_unit(1024, 7), k=1)] == [signals[7].tsr_id]
+
+
+@pytest.mark.parametrize("storage_dtype", ["float32", "float16"])
+def test_flushed_segments_are_memory_mapped_on_reopen(tmp_path: Path, storage_dtype: str) -> None:
+    index = VectorIndex(directory=tmp_path / "hot", storage_dtype=storage_dtype, segment_rows=2)  # type: ignore[arg-type]
+    index.add("018f0c44-3f1a-7cc1-8a5e-4f8ecf4c8f20", _unit(1024, 0), 100, "dev", "sensor", False)
+    index.add("018f0c44-3f1a-7cc1-8a5e-4f8ecf4c8f21", _unit(1024, 5), 200, "prod", "service", True)
+    index.add("018f0c44-3f1a-7cc1-8a5e-4f8ecf4c8f22", _unit(1536, 9), 300, "dev", "sensor", False)
+    index.flush()
+
+    reopened = VectorIndex.open(tmp_path / "hot")
+    assert len(reopened) == 3
+    assert sorted(path.name for path in (tmp_path / "hot").iterdir()) == [
+        "vectors-1024-000000.seg",
+        "vectors-1536-000001.seg",
+    ]
+    hit = reopened.search(_unit(1024, 5), k=1, hazard_flag=True)[0]
+    assert (hit.tsr_id, hit.env, hit.tsr_timestamp_ns) == ("018f0c44-3f1a-7cc1-8a5e-4f8ecf4c8f21", "prod", 200)
+    assert hit.score == pytest.approx(1.0, abs=1e-3)
+
+    reopened.add("018f0c44-3f1a-7cc1-8a5e-4f8ecf4c8f23", _unit(1024, 5, tilt=0.2), 400, "prod", "service", True)
+    assert [hit.tsr_id[-2:] for hit in reopened.search(_unit(1024, 5), k=2)] == ["21", "23"]
+
+
+def test_signal_from_vector_buffer() -> None:
+    row = np.asarray(_unit(1024, 2), dtype="<f4")
+    signal = TSRSignal.from_vector_buffer(
+        row,
+        env="dev",
+        origin=Origin(kind="sensor", source_id="sensor://line-1", namespace="test"),
+        payload={"event": "replay"},
+        safety=Safety(veracity_score=0.9, hazard_flag=False),
+    )
+    assert signal.vector is not None and signal.vector[2] == 1.0
+
+    with pytest.raises(ValueError, match="unsupported vector_dtype"):
+        TSRSignal.from_vector_buffer(row, vector_dtype="int8")
+
+
+def _clustered(rng: "np.random.Generator", count: int, dim: int, clusters: int) -> "np.ndarray":
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, count)] + 0.3 * rng.standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _add_rows(index: VectorIndex, vectors: "np.ndarray", first: int = 0) -> None:
+    count = vectors.shape[0]
+    index.add_batch(
+        tsr_ids=[f"018f0c44-3f1a-7cc1-8a5e-{first + row:012d}" for row in range(count)],
+        vectors=vectors,
+        tsr_timestamps_ns=list(range(first, first + count)),
+        envs=["prod" if (first + row) % 50 == 0 else "dev" for row in range(count)],
+        origin_kinds=["sensor"] * count,
+        hazard_flags=[False] * count,
+    )
+
+
+def test_ivf_search_trains_incrementally_and_keeps_filters() -> None:
+    rng = np.random.default_rng(3)
+    vectors = _clustered(rng, 3000, 1024, clusters=32)
+    index = VectorIndex(ann="ivf", ann_lists=32, ann_probes=4, ann_train_rows=1000)
+    _add_rows(index, vectors[:500])
+    assert index.search(vectors[0], k=1)[0].score == pytest.approx(1.0)
+    _add_rows(index, vectors[500:], first=500)
+
+    recalled = 0
+    for query in vectors[rng.choice(3000, 20, replace=False)]:
+        exact = {hit.tsr_id for hit in index.search(query, k=10, exact=True)}
+        recalled += len(exact & {hit.tsr_id for hit in index.search(query, k=10)})
+    assert recalled / 200 >= 0.9
+
+    filtered = index.search(vectors[1], k=10, env="prod", probes=1)
+    assert len(filtered) == 10 and {hit.env for hit in filtered} == {"prod"}
+    with pytest.raises(ValueError, match="unsupported ann: hnsw"):
+        VectorIndex(ann="hnsw")  # type: ignore[arg-type]
+
+
+def test_ivf_lists_are_persisted_next_to_segments(tmp_path: Path) -> None:
+    rng = np.random.default_rng(5)
+    vectors = _clustered(rng, 600, 1024, clusters=8)
+    exact_index = VectorIndex(directory=tmp_path / "hot")
+    for first in (0, 300):
+        _add_rows(exact_index, vectors[first : first + 300], first=first)
+        exact_index.flush()
+
+    index = VectorIndex(directory=tmp_path / "hot", ann="ivf", ann_lists=8, ann_probes=2, ann_train_rows=500)
+    _add_rows(index, vectors[:10], first=600)
+    index.flush()
+    assert sorted(path.name for path in (tmp_path / "hot").iterdir()) == [
+        "ivf-1024.npy",
+        "vectors-1024-000000.ivf.npy",
+        "vectors-1024-000000.seg",
+        "vectors-1024-000001.ivf.npy",
+        "vectors-1024-000001.seg",
+        "vectors-1024-000002.ivf.npy",
+        "vectors-1024-000002.seg",
+    ]
+
+    reopened = VectorIndex.open(tmp_path / "hot", ann="ivf", ann_probes=2)
+    assert {hit.tsr_id[-3:] for hit in reopened.search(vectors[3], k=2)} == {"003", "603"}
+    assert [hit.env for hit in reopened.search(vectors[3], k=3, env="prod", probes=1)] == ["prod"] * 3